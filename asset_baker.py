@@ -0,0 +1,156 @@
+# asset_baker.py
+#
+# Wypiekanie grafik gry do atlasów:
+#     python asset_baker.py [--output assets/baked] [--max-size 2048]
+#
+# Skrypt przygotowuje wszystkie sprite'y w docelowych rozmiarach (przeskalowane, obrócone
+# i odbite), pakuje je w strony atlasu i zapisuje manifest z pozycjami. W czasie gry
+# SpriteAtlas wczytuje atlas jednorazowo i wydaje podpowierzchnie zamiast wczytywać
+# i skalować pliki PNG przy tworzeniu każdego obiektu.
+
+import argparse
+import json
+import os
+import pygame
+
+from sprite_atlas import BAKED_DIR, MANIFEST_NAME, sprite_key, apply_transform
+from tile_manager import TileManager
+
+TILESET_PATH = "assets/images/tileset.png"
+
+# Lista sprite'ów do wypieczenia: (ścieżka, rozmiar lub None, przekształcenia)
+# Rozmiary odpowiadają tym, w których obiekty gry używają grafik.
+SPRITE_SPECS = [
+    ("assets/images/MainCharacter_Echo.png", (64, 64), [None, "flip_x"]),
+    ("assets/images/Enemy_ChaotycznaBestia.png", (64, 64), [None, "flip_x"]),
+    ("assets/images/Enemy_Dystansowy.png", (40, 64), [None, "flip_x"]),
+    ("assets/images/boss.png", (128, 128), [None, "flip_x"]),
+    ("assets/images/shockwave.png", (250, 250), [None]),
+    ("assets/images/Ranged_Projectile.png", None, [None]),
+    # Pocisk gracza – obroty dla czterech kierunków strzału (kubełki RotatedSpriteCache)
+    ("assets/images/Projectile_Default.png", (17, 32), [None, "rot_90", "rot_180", "rot_270"]),
+    ("assets/images/satellite.png", None, [None]),
+    ("assets/images/explosion.png", None, [None]),
+    # Ikony menu ulepszeń (LevelSystem)
+    ("assets/images/Projectile_Default.png", (32, 32), [None]),
+    ("assets/images/satellite.png", (32, 32), [None]),
+    ("assets/images/explosion.png", (32, 32), [None]),
+]
+
+# Promienie eksplozji na kolejnych poziomach broni (Weapon.level_up) – obraz ma średnicę 2 * promień
+EXPLOSION_RADII = [100, 160, 180, 200, 220, 240, 260]
+SPRITE_SPECS += [("assets/images/explosion.png", (r * 2, r * 2), [None]) for r in EXPLOSION_RADII]
+
+
+def collect_sprites():
+    """
+    Przygotowuje powierzchnie wszystkich sprite'ów do wypieczenia.
+
+    :return: Lista krotek (klucz, pygame.Surface)
+    """
+    sprites = []
+    for path, size, transforms in SPRITE_SPECS:
+        source = pygame.image.load(path).convert_alpha()
+        if size:
+            source = pygame.transform.scale(source, size)
+        for transform in transforms:
+            sprites.append((sprite_key(path, size, transform), apply_transform(source, transform)))
+
+    # Kafelki terenu – wycięte z tilesetu i obrócone przez TileManager
+    tile_manager = TileManager(TILESET_PATH)
+    for tile_name, tile_surf in tile_manager.surfaces.items():
+        sprites.append((sprite_key(TILESET_PATH, None, f"tile:{tile_name}"), tile_surf))
+    return sprites
+
+
+def pack_sprites(sprites, max_size, padding=1):
+    """
+    Pakuje sprite'y w strony atlasu metodą półkową (od najwyższych).
+
+    :param sprites: Lista krotek (klucz, pygame.Surface)
+    :param max_size: Maksymalna szerokość i wysokość strony atlasu (w pikselach)
+    :param padding: Odstęp między sprite'ami (w pikselach)
+    :return: Krotka (placements, page_sizes): placements to słownik klucz -> (strona, x, y, w, h),
+             page_sizes to lista rozmiarów (szerokość, wysokość) kolejnych stron
+    """
+    placements = {}
+    page_sizes = []
+    page, shelf_x, shelf_y, shelf_h, page_w = 0, 0, 0, 0, 0
+
+    for key, surf in sorted(sprites, key=lambda item: item[1].get_height(), reverse=True):
+        w, h = surf.get_size()
+        if w > max_size or h > max_size:
+            raise ValueError(f"Sprite {key} ({w}x{h}) nie mieści się na stronie atlasu {max_size}x{max_size}")
+        # Nowa półka, gdy sprite nie mieści się w bieżącym wierszu
+        if shelf_x + w > max_size:
+            shelf_y += shelf_h + padding
+            shelf_x, shelf_h = 0, 0
+        # Nowa strona, gdy półka nie mieści się na wysokość
+        if shelf_y + h > max_size:
+            page_sizes.append((page_w, shelf_y))
+            page += 1
+            shelf_x, shelf_y, shelf_h, page_w = 0, 0, 0, 0
+        placements[key] = (page, shelf_x, shelf_y, w, h)
+        shelf_x += w + padding
+        shelf_h = max(shelf_h, h)
+        page_w = max(page_w, shelf_x)
+
+    if placements:
+        page_sizes.append((page_w, shelf_y + shelf_h))
+    return placements, page_sizes
+
+
+def bake(output_dir=BAKED_DIR, max_size=2048):
+    """
+    Wypieka atlasy oraz manifest do wskazanego katalogu.
+
+    :param output_dir: Katalog docelowy
+    :param max_size: Maksymalny rozmiar strony atlasu
+    :return: Ścieżka do zapisanego manifestu
+    """
+    sprites = collect_sprites()
+    placements, page_sizes = pack_sprites(sprites, max_size)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for key, surf in sprites:
+        page, x, y, _, _ = placements[key]
+        # BLEND_RGBA_MAX na przezroczystym tle kopiuje piksele wraz z kanałem alfa bez mieszania
+        pages[page].blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    os.makedirs(output_dir, exist_ok=True)
+    page_names = []
+    for i, page_surf in enumerate(pages):
+        name = f"atlas_{i}.png"
+        pygame.image.save(page_surf, os.path.join(output_dir, name))
+        page_names.append(name)
+
+    manifest = {
+        "version": 1,
+        "pages": page_names,
+        "sprites": {key: list(placement) for key, placement in placements.items()},
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+
+    print(f"Wypieczono {len(sprites)} sprite'ów na {len(pages)} stronach atlasu -> {manifest_path}")
+    return manifest_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wypieka grafiki Echo of Chaos do atlasów sprite'ów.")
+    parser.add_argument("--output", default=BAKED_DIR, help="Katalog docelowy atlasów i manifestu")
+    parser.add_argument("--max-size", type=int, default=2048, help="Maksymalny rozmiar strony atlasu (px)")
+    args = parser.parse_args()
+
+    pygame.init()
+    # convert_alpha() wymaga trybu wideo – wystarczy ukryte okno 1x1
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    try:
+        bake(args.output, args.max_size)
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
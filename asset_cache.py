@@ -0,0 +1,107 @@
+import pygame
+from sprite_atlas import SpriteAtlas, sprite_key, apply_transform, load_sprite
+from rotation_cache import RotatedSpriteCache, DEFAULT_ANGLE_STEP
+
+class AssetCache:
+    """
+    Klasa AssetCache – wspólne dla całego procesu sprite'y pod kluczem (ścieżka, rozmiar, przekształcenie).
+    Wydawanych powierzchni nie wolno modyfikować – do rysowania po nich należy użyć copy().
+    """
+    _surfaces = {}   # (ścieżka, rozmiar, przekształcenie) -> pygame.Surface
+    _rotations = {}  # (ścieżka, rozmiar, rozdzielczość kątowa) -> RotatedSpriteCache
+    hits = 0         # Liczba trafień w pamięć podręczną
+    misses = 0       # Liczba chybień (faktycznych wczytań / przekształceń)
+
+    @staticmethod
+    def get(path, size=None, transform=None):
+        """
+        Zwraca współdzielony sprite w docelowym rozmiarze i z podanym przekształceniem.
+
+        :param path: Ścieżka do obrazu źródłowego
+        :param size: Docelowy rozmiar (szerokość, wysokość) lub None dla rozmiaru oryginalnego
+        :param transform: Opcjonalne przekształcenie – np. "flip_x" (patrz sprite_atlas.apply_transform)
+        :return: pygame.Surface
+        """
+        surface = AssetCache._surfaces.get((path, tuple(size) if size else None, transform))
+        if surface is not None:
+            AssetCache.hits += 1
+            return surface
+        AssetCache.misses += 1
+        return AssetCache._load(path, size, transform)
+
+    @staticmethod
+    def _load(path, size, transform):
+        """
+        Zwraca sprite z pamięci podręcznej lub go wczytuje – bez zmiany statystyk trafień.
+        """
+        key = (path, tuple(size) if size else None, transform)
+        surface = AssetCache._surfaces.get(key)
+        if surface is not None:
+            return surface
+        surface = SpriteAtlas.get(sprite_key(path, size, transform))
+        if surface is None:
+            if transform:
+                # Wariant przekształcony budujemy z wersji bazowej, bez ponownego czytania pliku
+                surface = apply_transform(AssetCache._load(path, size, None), transform)
+            else:
+                surface = load_sprite(path, size)
+        # Przed utworzeniem okna powierzchnie nie są jeszcze skonwertowane – nie zapamiętujemy ich
+        if pygame.display.get_surface() is not None:
+            AssetCache._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def get_facing(path, size=None):
+        """
+        Zwraca parę wariantów sprite'a dla kierunków patrzenia.
+
+        :param path: Ścieżka do obrazu źródłowego
+        :param size: Docelowy rozmiar (szerokość, wysokość) lub None
+        :return: Krotka (obraz_w_prawo, obraz_w_lewo)
+        """
+        return AssetCache.get(path, size), AssetCache.get(path, size, "flip_x")
+
+    @staticmethod
+    def get_rotations(path, size=None, angle_step=DEFAULT_ANGLE_STEP):
+        """
+        Zwraca współdzielony zbiór obróconych wariantów sprite'a (np. dla pocisków).
+        Warianty o kątach wypieczonych w atlasie (np. "rot_90") są pobierane z atlasu.
+
+        :param path: Ścieżka do obrazu źródłowego
+        :param size: Docelowy rozmiar (szerokość, wysokość) lub None
+        :param angle_step: Rozdzielczość kątowa w stopniach
+        :return: RotatedSpriteCache
+        """
+        key = (path, tuple(size) if size else None, angle_step)
+        rotations = AssetCache._rotations.get(key)
+        if rotations is None:
+            def rotate(angle):
+                if angle == 0:
+                    return AssetCache.get(path, size)
+                return AssetCache.get(path, size, f"rot_{angle:g}")
+            rotations = RotatedSpriteCache(AssetCache.get(path, size), angle_step, rotate)
+            AssetCache._rotations[key] = rotations
+        return rotations
+
+    @staticmethod
+    def stats():
+        """
+        Zwraca statystyki pamięci podręcznej.
+
+        :return: Słownik z kluczami "hits", "misses" i "entries"
+        """
+        return {
+            "hits": AssetCache.hits,
+            "misses": AssetCache.misses,
+            "entries": len(AssetCache._surfaces),
+        }
+
+    @staticmethod
+    def clear():
+        """
+        Czyści pamięć podręczną i zeruje statystyki.
+        """
+        AssetCache._surfaces = {}
+        AssetCache._rotations = {}
+        AssetCache.hits = 0
+        AssetCache.misses = 0
@@ -2,8 +2,12 @@ import pygame
 import math
 import random
 from enemy import Enemy
-from projectile_enemy import EnemyProjectile
+from enemy_store import TYPE_BOSS
+from enemy_factory import EnemyFactory
+from projectile_enemy import EnemyProjectiles
 from audio_manager import AudioManager
+from asset_cache import AssetCache
+from scheduler import Scheduler
 
 class BossEnemy(Enemy):
     """
@@ -13,43 +17,41 @@ class BossEnemy(Enemy):
     3) Hybryda: dynamiczne przełączanie + bullet hell
     """
 
-    def __init__(self, x, y, wall_rects=None):
+    def __init__(self, x, y, collision_world=None):
         # wywołujemy konstruktor bazowy Enemy, ale zmieniamy parametry
         self.health_base = 80000
         super().__init__(x, y,
                          speed=3.5,      # faza 1: boss porusza się szybko
                          health=self.health_base,    # duży zapas zdrowia
                          xp_value=2,   # dużo XP za pokonanie
-                         wall_rects=wall_rects)
+                         collision_world=collision_world)
+        self.type_id = TYPE_BOSS
 
         # Zastąp domyślny sprite
         self.width = 128
         self.height = 128
-        self.original_image = pygame.image.load("assets/images/boss.png")
-        self.original_image = pygame.transform.scale(self.original_image, (self.width, self.height))
-        self.image = self.original_image.copy()
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.projectiles = []
+        self.set_facing_images("assets/images/boss.png")
+        self.original_image = self.image_right
         self.shockwave_effects = []
-        self.shockwave_image = pygame.image.load("assets/images/shockwave.png")
-        self.shockwave_image = pygame.transform.scale(self.shockwave_image, (250, 250))  # Dobierz rozmiar wedle potrzeb
+        self.shockwave_image = AssetCache.get("assets/images/shockwave.png", (250, 250))  # Dobierz rozmiar wedle potrzeb
 
         # fazy bossa i progi zdrowia
         self.phase = 1  # start w fazie 1
         self.phase2_threshold = 0.65  # np. przy 65% HP przechodzi w fazę 2
         self.phase3_threshold = 0.30  # przy 30% HP – faza 3
-        # rejestrowanie mechanik (np. cooldown na falę uderzeniową)
+        # rejestrowanie mechanik (np. cooldown na falę uderzeniową);
+        # końce cooldownów planuje Scheduler, tutaj tylko flagi gotowości
         self.shockwave_cooldown = 120
-        self.shockwave_timer = 0
+        self.shockwave_ready = True
 
         # parametry ataków dystansowych
         self.ranged_cooldown = 90
-        self.ranged_timer = 0
+        self.ranged_ready = True
         self.ranged_spread_angle = 45  # jak bardzo „rozrzuca” pociski w wachlarzu
         self.num_ranged_projectiles = 5
 
-        # bullet-hell
-        self.bullethell_timer = 0
+        # bullet-hell – zegar fazy 3 liczony od klatki wejścia w fazę (Scheduler.now)
+        self.phase3_start = None
         self.bullethell_cooldown = 60  # np. co 60 klatek strzelamy serią
 
         # Przykładowa konfiguracja spawnów w fazach:
@@ -58,10 +60,10 @@ class BossEnemy(Enemy):
             2: 120,  # co 120 klatek w fazie 2
             3: 60    # co 60 klatek w fazie 3
         }
-        self.minion_spawn_timer = 0
+        self.minion_ready = True
 
 
-    def update(self, player, screen_width, screen_height, enemies, wall_rects=None, map_width=0, map_height=0):
+    def update(self, player, screen_width, screen_height, enemies, collision_world=None, map_width=0, map_height=0):
         """
         Główna metoda bossa, wywoływana co klatkę.
         Zależnie od fazy bossa, inne zachowania.
@@ -70,32 +72,56 @@ class BossEnemy(Enemy):
         self.check_phase()
 
         if self.phase == 1:
-            self.update_phase_1(player, wall_rects, map_width, map_height)
+            self.update_phase_1(player, collision_world, map_width, map_height)
         elif self.phase == 2:
-            self.update_phase_2(player)
+            self.update_phase_2(player, collision_world)
         else:
             # faza 3 = hybryda
-            self.update_phase_3(player, wall_rects, map_width, map_height)
+            self.update_phase_3(player, collision_world, map_width, map_height)
 
-        # Przesunięcie bossa i ewentualne kolizje
-        # (Bazowy Enemy ma move_towards_player, ale tu w poszczególnych fazach
-        #  możemy go wywoływać albo nie)
-        self.rect.topleft = (self.x, self.y)
-
-        # ewentualnie: self.handle_wall_collisions(wall_rects)
+        # ewentualnie: self.handle_wall_collisions(collision_world)
         # lub cokolwiek innego
 
-        # Faza 1, 2, 3 mogą generować pociski (przechowywane w self.projectiles)
-        self.update_projectiles(player, screen_width, screen_height, map_width, map_height)
+        # Pociski faz 2 i 3 lecą we wspólnym buforze EnemyProjectiles (aktualizowanym w pętli gry)
 
         # Na końcu metody update (boss_enemy.py):
         spawn_rate = self.phase_minion_spawn_rate[self.phase]
-        if spawn_rate > 0:
-            if self.minion_spawn_timer <= 0:
-                self.spawn_minion(enemies)
-                self.minion_spawn_timer = spawn_rate
-            else:
-                self.minion_spawn_timer -= 1
+        if spawn_rate > 0 and self.minion_ready:
+            self.spawn_minion(enemies)
+            self.minion_ready = False
+            Scheduler.schedule(spawn_rate, self._on_minion_ready)
+
+    def _on_minion_ready(self):
+        self.minion_ready = True
+
+    def _on_shockwave_ready(self):
+        self.shockwave_ready = True
+
+    def _on_ranged_ready(self):
+        self.ranged_ready = True
+
+    def try_shockwave(self, player, collision_world, map_width, map_height):
+        """
+        Odpala falę uderzeniową, jeśli minął jej cooldown, a gracz jest w zasięgu.
+        """
+        if not self.shockwave_ready:
+            return
+        # Jeśli boss jest blisko gracza, odpal falę
+        dist = math.hypot((player.x - self.x), (player.y - self.y))
+        if dist < 80:  # dowolny próg zasięgu
+            self.trigger_shockwave(player, collision_world, map_width, map_height)
+            self.shockwave_ready = False
+            Scheduler.schedule(self.shockwave_cooldown, self._on_shockwave_ready)
+
+    def try_ranged_attack(self, player, collision_world):
+        """
+        Strzela wachlarzem pocisków, jeśli minął cooldown i gracz nie jest zasłonięty ścianą.
+        """
+        if self.ranged_ready and self.can_see(player.x + player.width / 2, player.y + player.height / 2,
+                                              collision_world):
+            self.ranged_attack(player)
+            self.ranged_ready = False
+            Scheduler.schedule(self.ranged_cooldown, self._on_ranged_ready)
 
 
     def check_phase(self):
@@ -113,24 +139,17 @@ class BossEnemy(Enemy):
     # -------------------------
     # FAZA 1: kontakt + fala uderzeniowa
     # -------------------------
-    def update_phase_1(self, player, wall_rects, map_width, map_height):
+    def update_phase_1(self, player, collision_world, map_width, map_height):
         # poruszaj się w stronę gracza
         target_x = player.x - player.width // 2
         target_y = player.y - player.height // 2
-        self.move_towards_player(target_x, target_y, None)
+        self.move_towards_player(target_x, target_y, collision_world)
 
 
-        # co klatkę odliczaj cooldown fali
-        if self.shockwave_timer > 0:
-            self.shockwave_timer -= 1
-        else:
-            # Jeśli boss jest blisko gracza, odpal falę
-            dist = math.hypot((player.x - self.x), (player.y - self.y))
-            if dist < 80:  # dowolny próg zasięgu
-                self.trigger_shockwave(player, wall_rects, map_width, map_height)
-                self.shockwave_timer = self.shockwave_cooldown
+        # fala uderzeniowa (gdy minął cooldown)
+        self.try_shockwave(player, collision_world, map_width, map_height)
 
-    def trigger_shockwave(self, player, wall_rects, map_width, map_height):
+    def trigger_shockwave(self, player, collision_world, map_width, map_height):
         """
         Fala uderzeniowa – zadaje obrażenia w promieniu, odpycha gracza
         (opcjonalnie).
@@ -152,7 +171,7 @@ class BossEnemy(Enemy):
                     player,
                     dx, dy,
                     push_strength,# przekazujemy listę ścian i rozmiar mapy,
-                    wall_rects,  # to samo, co w update Bossa
+                    collision_world,  # to samo, co w update Bossa
                     map_width,
                     map_height
                 )
@@ -169,20 +188,15 @@ class BossEnemy(Enemy):
     # -------------------------
     # FAZA 2: ataki dystansowe (wachlarz pocisków)
     # -------------------------
-    def update_phase_2(self, player):
+    def update_phase_2(self, player, collision_world=None):
         # Boss stoi w miejscu (lub wolno się porusza),
         # a jednocześnie strzela serią pocisków co X klatek
         self.speed = 1.0  # wolniejszy ruch
         # ewentualnie minimalne chodzenie w bok:
         # self.x += some_small_value
 
-        # odlicz timer
-        if self.ranged_timer > 0:
-            self.ranged_timer -= 1
-        else:
-            # strzelaj wachlarz
-            self.ranged_attack(player)
-            self.ranged_timer = self.ranged_cooldown
+        # strzelaj wachlarz (gdy minął cooldown i gracz nie jest zasłonięty ścianą)
+        self.try_ranged_attack(player, collision_world)
 
     def ranged_attack(self, player):
         """
@@ -208,71 +222,42 @@ class BossEnemy(Enemy):
         start_x = self.x + self.width // 2
         start_y = self.y + self.height // 2
 
-        projectile = EnemyProjectile(start_x, start_y, vx, vy, damage=15)
-        self.projectiles.append(projectile)
+        EnemyProjectiles.emit(start_x, start_y, vx, vy, damage=15)
 
     # -------------------------
     # FAZA 3: hybryda
     # -------------------------
-    def update_phase_3(self, player, wall_rects, map_width, map_height):
+    def update_phase_3(self, player, collision_world, map_width, map_height):
         # szybkie przełączanie – np. co 120 klatek wracamy do kontaktu,
         # potem do dystansu, generujemy bullet-hell
         # Tu jest pełna dowolność – przykład:
-        self.bullethell_timer += 1
+        if self.phase3_start is None:
+            self.phase3_start = Scheduler.now
+        phase_time = Scheduler.now - self.phase3_start + 1
         # Naprzemiennie – co ~2 sekundy biegnij do gracza, potem strzelaj
-        if (self.bullethell_timer // 120) % 2 == 0:
+        if (phase_time // 120) % 2 == 0:
             # ruch kontaktowy
             self.speed = 3.0
             target_x = player.x - player.width // 2
             target_y = player.y - player.height // 2
-            self.move_towards_player(target_x, target_y, None)            
+            self.move_towards_player(target_x, target_y, collision_world)
         else:
             # ostrzał pocisków
             self.speed = 1.5
-            if self.ranged_timer > 0:
-                self.ranged_timer -= 1
-            else:
-                self.ranged_attack(player)
-                self.ranged_timer = self.ranged_cooldown
+            self.try_ranged_attack(player, collision_world)
 
         # ewentualnie bullet-hell = np.:
-        if self.bullethell_timer % self.bullethell_cooldown == 0:
+        if phase_time % self.bullethell_cooldown == 0:
             # wystrzel serię okrężnych pocisków 360°, np. co 15°
             for angle_deg in range(0, 360, 15):
                 self.spawn_projectile(angle_deg)
 
         # plus ewentualna fala co jakiś czas
-        if self.shockwave_timer > 0:
-            self.shockwave_timer -= 1
-        else:
-            dist = math.hypot((player.x - self.x), (player.y - self.y))
-            if dist < 80:
-                self.trigger_shockwave(player, wall_rects, map_width, map_height)
-                self.shockwave_timer = self.shockwave_cooldown
-
-    def update_projectiles(self, player, screen_width, screen_height, map_width, map_height):
-        """
-        Przesuwanie pocisków i usuwanie tych, które wyleciały poza ekran
-        lub trafiły w gracza.
-        """
-        map_w_px = map_width * 64
-        map_h_px = map_height * 64
-        for p in self.projectiles[:]:
-            p.update()
-            # sprawdź kolizję z graczem
-            if p.rect.colliderect(pygame.Rect(player.x, player.y, player.width, player.height)):
-                player.take_damage(p.damage)
-                self.projectiles.remove(p)
-                continue
-
-            # sprawdź wyjście poza mapę
-            if (p.x < 0 or p.x > map_w_px or
-                p.y < 0 or p.y > map_h_px):
-                self.projectiles.remove(p)
+        self.try_shockwave(player, collision_world, map_width, map_height)
 
     def draw(self, screen, camera_x, camera_y):
         """
-        Specjalne rysowanie bossa i jego pocisków.
+        Specjalne rysowanie bossa i fali uderzeniowej (pociski rysuje EnemyProjectiles).
         """
         screen_x = self.x - camera_x
         screen_y = self.y - camera_y
@@ -286,13 +271,6 @@ class BossEnemy(Enemy):
             if effect["timer"] <= 0:
                 self.shockwave_effects.remove(effect)
 
-
-        # dorysuj pociski
-        for p in self.projectiles:
-            draw_x = p.x - camera_x
-            draw_y = p.y - camera_y
-            screen.blit(p.image, (draw_x, draw_y))
-
     def spawn_minion(self, enemies):
         # Przykładowe pozycjonowanie miniona w pobliżu bossa:
         offset_x = random.randint(-150, 150)
@@ -300,14 +278,14 @@ class BossEnemy(Enemy):
         minion_x = self.x + offset_x
         minion_y = self.y + offset_y
 
-        # Tworzymy zwykłego Enemy (lub RangedEnemy) – do wyboru
-        new_enemy = Enemy(minion_x, minion_y, speed=2, health=30, xp_value=1)
-        enemies.append(new_enemy)
+        # Zwykły Enemy z puli minionów (przygotowanej przed falą z bossem)
+        enemies.append(EnemyFactory.spawn("minion", minion_x, minion_y))
 
-    def attempt_push_player(self, player, dx, dy, push_strength, wall_rects, map_width, map_height):
+    def attempt_push_player(self, player, dx, dy, push_strength, collision_world, map_width, map_height):
         """
-        Odrzuca gracza w kierunku (dx, dy) o 'push_strength' pikseli,
-        ale iteracyjnie (co 1 piksel), by uniknąć przenikania przez ściany.
+        Odrzuca gracza w kierunku (dx, dy) o 'push_strength' pikseli, zatrzymując go
+        przy pierwszej napotkanej ścianie lub granicy mapy. Punkt kontaktu wyznaczany jest
+        jednym rzutem prostokąta kolizji gracza (CollisionWorld.sweep_rect).
         """
         # Upewnij się, że dx, dy nie jest wektorem (0,0):
         dist = math.hypot(dx, dy)
@@ -321,32 +299,44 @@ class BossEnemy(Enemy):
         # Ile "kroków" – np. push_strength pikseli:
         steps = int(push_strength)
 
-        for _ in range(steps):
-            old_x, old_y = player.x, player.y
-            # Przesuwamy o 1 piksel w danym kierunku
-            player.x += step_x
-            player.y += step_y
-
-            # Sprawdź kolizję ze ścianą (lub wyjście poza mapę)
+        # Jeden rzut wzdłuż całej drogi odrzutu – ułamek drogi do pierwszego kontaktu
+        start_x, start_y = player.x, player.y
+        collision_box = (
+            player.x + player.OFFSET_X, player.y + player.OFFSET_Y,
+            player.COLLISION_WIDTH, player.COLLISION_HEIGHT
+        )
+        fraction = collision_world.sweep_rect(collision_box, step_x * steps, step_y * steps)
+
+        # Granice mapy – ułamek drogi, przy którym prostokąt kolizji dotyka krawędzi mapy
+        map_px_w = map_width * 64
+        map_px_h = map_height * 64
+        box_x, box_y, box_w, box_h = collision_box
+        move_x = step_x * steps
+        move_y = step_y * steps
+        if move_x > 0:
+            fraction = min(fraction, (map_px_w - box_x - box_w) / move_x)
+        elif move_x < 0:
+            fraction = min(fraction, box_x / -move_x)
+        if move_y > 0:
+            fraction = min(fraction, (map_px_h - box_y - box_h) / move_y)
+        elif move_y < 0:
+            fraction = min(fraction, box_y / -move_y)
+        travel = int(max(fraction, 0.0) * steps)
+
+        # Pozycja gracza jest zmiennoprzecinkowa, a prostokąt kolizji całkowity – zaokrąglenie
+        # może dać nakładanie o 1 piksel, wtedy wystarcza jeden krok korekty
+        for distance in (travel, travel - 1):
+            if distance <= 0:
+                break
+            player.x = start_x + step_x * distance
+            player.y = start_y + step_y * distance
             collision_rect = player.get_collision_rect()
-
-            # Sprawdzamy granice mapy:
-            map_px_w = map_width * 64
-            map_px_h = map_height * 64
             out_of_bounds = (
                 collision_rect.left < 0 or
                 collision_rect.right > map_px_w or
                 collision_rect.top < 0 or
                 collision_rect.bottom > map_px_h
             )
-            if out_of_bounds:
-                # Cofnij ruch i przerwij
-                player.x, player.y = old_x, old_y
-                break
-
-            # Sprawdzamy kolizje ze ścianami (wall_rects)
-            collided = any(collision_rect.colliderect(wrect) for wrect in wall_rects)
-            if collided:
-                # Cofnij i przerwij
-                player.x, player.y = old_x, old_y
-                break
+            if not out_of_bounds and not collision_world.collides(collision_rect):
+                return
+        player.x, player.y = start_x, start_y
@@ -0,0 +1,324 @@
+import pygame
+import numpy as np
+
+class CollisionWorld:
+    """
+    Siatka kolizji terenu zbudowana z mapy kafelków.
+
+    Zamiast płaskiej listy wszystkich prostokątów ścian przechowuje prostokąty kolizji
+    osobno dla każdej komórki siatki. Zapytanie o prostokąt sprawdza wyłącznie komórki,
+    które ten prostokąt pokrywa, więc koszt kolizji nie zależy od rozmiaru mapy.
+    """
+    # Rozdzielczość bitmapy ścian (w pikselach) – prostokąty kolizji kafelków są wyrównane do 4 pikseli
+    SOLID_RESOLUTION = 4
+
+    def __init__(self, terrain_map, tile_manager):
+        """
+        Buduje siatkę kolizji.
+
+        :param terrain_map: Dwuwymiarowa lista nazw kafelków (wynik WaveCollapse.collapse())
+        :param tile_manager: Obiekt TileManager – rozmiar kafelka i szablony kolizji
+        """
+        self.terrain_map = terrain_map
+        self.tile_size = tile_manager.tile_width()
+        self.rows = len(terrain_map)
+        self.cols = len(terrain_map[0]) if self.rows else 0
+        self.pixel_width = self.cols * self.tile_size
+        self.pixel_height = self.rows * self.tile_size
+
+        # Szablony kolizji: nazwa kafelka -> prostokąty względem lewego-górnego rogu kafelka
+        self.templates = {}
+        # Prostokąty kolizji w każdej komórce (we współrzędnych świata)
+        self.cells = []
+        self.wall_count = 0
+        for row in range(self.rows):
+            cell_row = []
+            for col in range(self.cols):
+                tile_name = terrain_map[row][col]
+                if tile_name not in self.templates:
+                    self.templates[tile_name] = tile_manager.get_collision_rects(tile_name, 0, 0)
+                x = col * self.tile_size
+                y = row * self.tile_size
+                rects = [r.move(x, y) for r in self.templates[tile_name]]
+                self.wall_count += len(rects)
+                cell_row.append(rects)
+            self.cells.append(cell_row)
+
+        # Pamięć podręczna widoczności: (komórka, komórka) -> bool
+        self.sight_cache = {}
+
+        # Bitmapa ścian w rozdzielczości SOLID_RESOLUTION pikseli i jej obraz całkowy (summed-area table) –
+        # test zajętości dowolnego prostokąta w czterech odczytach, także dla całej tablicy prostokątów naraz
+        res = self.SOLID_RESOLUTION
+        solid = np.zeros((-(-self.pixel_height // res), -(-self.pixel_width // res)), dtype=bool)
+        for wall_rect in self:
+            solid[wall_rect.top // res:-(-wall_rect.bottom // res), wall_rect.left // res:-(-wall_rect.right // res)] = True
+        self.solid_integral = np.zeros((solid.shape[0] + 1, solid.shape[1] + 1), dtype=np.int32)
+        self.solid_integral[1:, 1:] = solid.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+
+    def cell_at(self, x, y):
+        """
+        Zwraca komórkę siatki zawierającą punkt.
+
+        :param x: Współrzędna x (w pikselach)
+        :param y: Współrzędna y (w pikselach)
+        :return: Krotka (wiersz, kolumna) – może wskazywać poza mapę
+        """
+        return int(y // self.tile_size), int(x // self.tile_size)
+
+    def in_bounds(self, row, col):
+        """
+        Sprawdza, czy komórka leży na mapie.
+        """
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def cell_rects(self, row, col):
+        """
+        Zwraca prostokąty kolizji w danej komórce (pusta lista poza mapą).
+        """
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.cells[row][col]
+        return []
+
+    def _cell_range(self, rect):
+        """
+        Wyznacza zakres komórek pokrywanych przez prostokąt (przycięty do mapy).
+
+        :return: Krotka (row0, row1, col0, col1) – zakresy włącznie; puste, gdy row0 > row1 lub col0 > col1
+        """
+        ts = self.tile_size
+        col0 = max(0, rect.left // ts)
+        col1 = min(self.cols - 1, (rect.right - 1) // ts)
+        row0 = max(0, rect.top // ts)
+        row1 = min(self.rows - 1, (rect.bottom - 1) // ts)
+        return row0, row1, col0, col1
+
+    def query(self, rect):
+        """
+        Zwraca prostokąty ścian nachodzące na podany prostokąt.
+
+        :param rect: pygame.Rect (np. prostokąt kolizji gracza)
+        :return: Lista pygame.Rect
+        """
+        row0, row1, col0, col1 = self._cell_range(rect)
+        hits = []
+        for row in range(row0, row1 + 1):
+            cell_row = self.cells[row]
+            for col in range(col0, col1 + 1):
+                for wall_rect in cell_row[col]:
+                    if rect.colliderect(wall_rect):
+                        hits.append(wall_rect)
+        return hits
+
+    def collides(self, rect):
+        """
+        Sprawdza, czy prostokąt nachodzi na którąkolwiek ścianę.
+
+        :param rect: pygame.Rect
+        :return: True, jeśli występuje kolizja ze ścianą
+        """
+        row0, row1, col0, col1 = self._cell_range(rect)
+        for row in range(row0, row1 + 1):
+            cell_row = self.cells[row]
+            for col in range(col0, col1 + 1):
+                for wall_rect in cell_row[col]:
+                    if rect.colliderect(wall_rect):
+                        return True
+        return False
+
+    def rects_blocked(self, lefts, tops, widths, heights):
+        """
+        Wektorowy odpowiednik collides() dla wielu prostokątów naraz (np. stopek wszystkich przeciwników).
+        Każdy prostokąt sprawdzany jest czterema odczytami obrazu całkowego bitmapy ścian.
+
+        :param lefts: Tablica numpy lewych krawędzi (w pikselach, całkowite)
+        :param tops: Tablica górnych krawędzi
+        :param widths: Tablica szerokości
+        :param heights: Tablica wysokości
+        :return: Tablica bool – True dla prostokątów nachodzących na ścianę
+        """
+        res = self.SOLID_RESOLUTION
+        rows, cols = self.solid_integral.shape
+        lefts = np.asarray(lefts, dtype=np.int64)
+        tops = np.asarray(tops, dtype=np.int64)
+        # Zakres komórek bitmapy pokrywanych przez prostokąt (półotwarty, przycięty do mapy)
+        col0 = np.clip(lefts // res, 0, cols - 1)
+        col1 = np.clip((lefts + widths - 1) // res + 1, 0, cols - 1)
+        row0 = np.clip(tops // res, 0, rows - 1)
+        row1 = np.clip((tops + heights - 1) // res + 1, 0, rows - 1)
+        empty = (col1 <= col0) | (row1 <= row0)
+        table = self.solid_integral
+        count = table[row1, col1] - table[row0, col1] - table[row1, col0] + table[row0, col0]
+        return (count > 0) & ~empty
+
+    def point_blocked(self, x, y):
+        """
+        Sprawdza, czy punkt leży wewnątrz ściany. Wymaga jednego odczytu komórki siatki
+        i sprawdzenia jej (co najwyżej dwóch) prostokątów kolizji – koszt stały.
+        Punkty poza mapą nie są traktowane jako ściana.
+
+        :param x: Współrzędna x punktu (w pikselach)
+        :param y: Współrzędna y punktu (w pikselach)
+        :return: True, jeśli punkt jest wewnątrz ściany
+        """
+        row = int(y // self.tile_size)
+        col = int(x // self.tile_size)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        for wall_rect in self.cells[row][col]:
+            if wall_rect.collidepoint(x, y):
+                return True
+        return False
+
+    def sweep_rect(self, rect, dx, dy, stay_in_bounds=True):
+        """
+        Rzutuje prostokąt wzdłuż wektora (dx, dy) i wyznacza, jaką część tej drogi może on
+        przebyć przed pierwszym kontaktem ze ścianą (swept AABB).
+
+        Kandydaci są pobierani jednym zapytaniem – z komórek pokrywanych przez obszar
+        zamiatany przez prostokąt – zamiast sprawdzania kolizji co piksel drogi.
+        Metoda nadaje się dla dowolnego odrzutu, doskoku czy szarży.
+
+        :param rect: Prostokąt w pozycji startowej (pygame.Rect lub krotka (x, y, w, h))
+        :param dx: Przesunięcie w osi X (w pikselach)
+        :param dy: Przesunięcie w osi Y (w pikselach)
+        :param stay_in_bounds: Czy granice mapy również zatrzymują ruch
+        :return: Ułamek drogi t z zakresu [0, 1] – prostokąt może bezpiecznie przesunąć się o (t*dx, t*dy)
+        """
+        left, top, width, height = rect
+        right = left + width
+        bottom = top + height
+        t_hit = 1.0
+
+        # Granice mapy traktujemy jak ściany otaczające planszę
+        if stay_in_bounds:
+            if left < 0 or top < 0 or right > self.pixel_width or bottom > self.pixel_height:
+                return 0.0
+            if dx > 0:
+                t_hit = min(t_hit, (self.pixel_width - right) / dx)
+            elif dx < 0:
+                t_hit = min(t_hit, -left / dx)
+            if dy > 0:
+                t_hit = min(t_hit, (self.pixel_height - bottom) / dy)
+            elif dy < 0:
+                t_hit = min(t_hit, -top / dy)
+
+        # Obszar zamiatany przez prostokąt – z niego pobieramy ściany-kandydatów
+        swept = pygame.Rect(
+            int(min(left, left + dx)), int(min(top, top + dy)),
+            int(abs(dx) + width) + 2, int(abs(dy) + height) + 2
+        )
+        row0, row1, col0, col1 = self._cell_range(swept)
+        for row in range(row0, row1 + 1):
+            cell_row = self.cells[row]
+            for col in range(col0, col1 + 1):
+                for wall in cell_row[col]:
+                    # Czasy wejścia i wyjścia w każdej osi
+                    if dx > 0:
+                        entry_x, exit_x = (wall.left - right) / dx, (wall.right - left) / dx
+                    elif dx < 0:
+                        entry_x, exit_x = (wall.right - left) / dx, (wall.left - right) / dx
+                    elif right <= wall.left or left >= wall.right:
+                        continue
+                    else:
+                        entry_x, exit_x = float("-inf"), float("inf")
+
+                    if dy > 0:
+                        entry_y, exit_y = (wall.top - bottom) / dy, (wall.bottom - top) / dy
+                    elif dy < 0:
+                        entry_y, exit_y = (wall.bottom - top) / dy, (wall.top - bottom) / dy
+                    elif bottom <= wall.top or top >= wall.bottom:
+                        continue
+                    else:
+                        entry_y, exit_y = float("-inf"), float("inf")
+
+                    entry = max(entry_x, entry_y)
+                    if entry >= min(exit_x, exit_y) or entry >= t_hit:
+                        continue
+                    if entry < 0:
+                        # Prostokąt już nachodzi na ścianę – ruch jest zablokowany od razu
+                        if exit_x > 0 and exit_y > 0:
+                            return 0.0
+                        continue
+                    t_hit = entry
+        return max(0.0, t_hit)
+
+    def line_of_sight(self, x0, y0, x1, y1):
+        """
+        Sprawdza, czy odcinek między dwoma punktami nie przecina żadnej ściany.
+        Przechodzi kolejno po komórkach siatki leżących na odcinku (grid DDA) i testuje
+        tylko ich prostokąty kolizji – koszt zależy od długości odcinka w komórkach.
+
+        :param x0: Współrzędna x początku odcinka (w pikselach)
+        :param y0: Współrzędna y początku odcinka
+        :param x1: Współrzędna x końca odcinka
+        :param y1: Współrzędna y końca odcinka
+        :return: True, jeśli odcinek nie jest zasłonięty ścianą
+        """
+        ts = self.tile_size
+        row, col = int(y0 // ts), int(x0 // ts)
+        end_row, end_col = int(y1 // ts), int(x1 // ts)
+        dx = x1 - x0
+        dy = y1 - y0
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+        # Parametr t (0..1) kolejnego przecięcia granicy komórki w każdej osi i jego przyrost
+        t_max_x = ((col + (dx > 0)) * ts - x0) / dx if dx else float("inf")
+        t_max_y = ((row + (dy > 0)) * ts - y0) / dy if dy else float("inf")
+        t_delta_x = ts / abs(dx) if dx else float("inf")
+        t_delta_y = ts / abs(dy) if dy else float("inf")
+        segment = (int(x0), int(y0), int(x1), int(y1))
+
+        for _ in range(abs(end_row - row) + abs(end_col - col) + 1):
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                for wall_rect in self.cells[row][col]:
+                    if wall_rect.clipline(segment):
+                        return False
+            if t_max_x < t_max_y:
+                col += step_col
+                t_max_x += t_delta_x
+            else:
+                row += step_row
+                t_max_y += t_delta_y
+        return True
+
+    def cells_visible(self, cell_a, cell_b):
+        """
+        Sprawdza widoczność między środkami dwóch komórek, z pamięcią podręczną.
+        Wynik zależy tylko od pary komórek, więc jest ponownie używany, dopóki obserwator
+        i cel nie zmienią komórki.
+
+        :param cell_a: Krotka (wiersz, kolumna) komórki obserwatora
+        :param cell_b: Krotka (wiersz, kolumna) komórki celu
+        :return: True, jeśli między komórkami nie ma ściany
+        """
+        key = (cell_a, cell_b) if cell_a <= cell_b else (cell_b, cell_a)
+        visible = self.sight_cache.get(key)
+        if visible is None:
+            # Ograniczenie pamięci – przy bardzo wielu parach zaczynamy od nowa
+            if len(self.sight_cache) >= 65536:
+                self.sight_cache.clear()
+            ts = self.tile_size
+            visible = self.line_of_sight(
+                cell_a[1] * ts + ts / 2, cell_a[0] * ts + ts / 2,
+                cell_b[1] * ts + ts / 2, cell_b[0] * ts + ts / 2
+            )
+            self.sight_cache[key] = visible
+        return visible
+
+    def invalidate_sight_cache(self):
+        """
+        Czyści pamięć podręczną widoczności – należy ją wywołać po każdej zmianie terenu.
+        """
+        self.sight_cache.clear()
+
+    def __iter__(self):
+        """
+        Iteruje po wszystkich prostokątach ścian (zgodność z dawną listą all_wall_rects).
+        """
+        for cell_row in self.cells:
+            for rects in cell_row:
+                yield from rects
+
+    def __len__(self):
+        return self.wall_count
@@ -0,0 +1,57 @@
+import numpy as np
+
+
+def make_columns(fields, capacity):
+    """
+    Przydziela puste kolumny magazynu (układ struktura-tablic).
+
+    :param fields: Słownik nazwa kolumny -> typ numpy
+    :param capacity: Liczba wierszy
+    :return: Słownik nazwa kolumny -> tablica numpy
+    """
+    return {name: np.zeros(capacity, dtype=dtype) for name, dtype in fields.items()}
+
+
+def grow_columns(columns, count, needed):
+    """
+    Powiększa kolumny (co najmniej dwukrotnie), zachowując zawartość zajętych wierszy.
+
+    :param columns: Słownik kolumn – tablice podmieniane są w miejscu
+    :param count: Liczba zajętych wierszy
+    :param needed: Minimalna liczba wierszy po powiększeniu
+    :return: Nowa pojemność
+    """
+    capacity = max(64, len(next(iter(columns.values()))) * 2, needed)
+    for name, column in columns.items():
+        grown = np.zeros(capacity, dtype=column.dtype)
+        grown[:count] = column[:count]
+        columns[name] = grown
+    return capacity
+
+
+def swap_remove_row(columns, slot, last):
+    """
+    Przenosi ostatni zajęty wiersz na miejsce zwalnianego (usunięcie w czasie stałym).
+
+    :param columns: Słownik kolumn
+    :param slot: Numer zwalnianego wiersza
+    :param last: Numer ostatniego zajętego wiersza
+    """
+    if slot != last:
+        for column in columns.values():
+            column[slot] = column[last]
+
+
+def compact_columns(columns, count, keep):
+    """
+    Zostawia tylko wiersze z maski keep, zachowując ich kolejność.
+
+    :param columns: Słownik kolumn
+    :param count: Liczba zajętych wierszy
+    :param keep: Tablica bool o długości count
+    :return: Liczba pozostawionych wierszy
+    """
+    kept = int(keep.sum())
+    for column in columns.values():
+        column[:kept] = column[:count][keep]
+    return kept
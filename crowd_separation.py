@@ -0,0 +1,75 @@
+import numpy as np
+from spatial_hash import neighbour_pairs
+from enemy_store import EnemyStore, TYPE_BASIC, TYPE_RANGED
+
+# Złoty kąt – rozkłada kierunki odpychania przeciwników stojących dokładnie w tym samym punkcie
+GOLDEN_ANGLE = 2.399963229728653
+
+
+class CrowdSeparation:
+    """
+    Rozpychanie hordy przeciwników (steering – separacja).
+
+    Co klatkę środki przeciwników są grupowane w komórki siatki o boku równym promieniowi separacji
+    (posortowane klucze komórek), więc każdy przeciwnik oddziałuje tylko z sąsiadami z najbliższych komórek.
+    Pary sąsiadów i siły odpychania liczone są wektorowo (numpy) dla wszystkich naraz, a wynik zapisywany
+    w kolumnach separation_x / separation_y EnemyStore – dodawany do kroku ruchu przeciwnika.
+    """
+    def __init__(self, radius=48, strength=1.5):
+        """
+        :param radius: Odległość środków (w pikselach), poniżej której przeciwnicy się odpychają
+        :param strength: Maksymalne przesunięcie separacji na klatkę (w pikselach)
+        """
+        self.radius = radius
+        self.strength = strength
+
+    def update(self, types=(TYPE_BASIC, TYPE_RANGED)):
+        """
+        Wyznacza przesunięcia separacji dla przeciwników podanych typów (boss nie jest odpychany).
+
+        :param types: Typy przeciwników objętych separacją
+        """
+        columns = EnemyStore.columns
+        rows = np.flatnonzero(np.isin(EnemyStore.column("type_id"), types))
+        count = len(rows)
+        columns["separation_x"][rows] = 0.0
+        columns["separation_y"][rows] = 0.0
+        if count < 2:
+            return
+
+        center_x = columns["x"][rows] + columns["width"][rows] / 2
+        center_y = columns["y"][rows] + columns["height"][rows] / 2
+
+        first, second = neighbour_pairs(center_x, center_y, self.radius)
+        if not len(first):
+            return
+
+        # Wektory między parami i odrzucenie par spoza promienia
+        delta_x = center_x[first] - center_x[second]
+        delta_y = center_y[first] - center_y[second]
+        distance = np.hypot(delta_x, delta_y)
+        close = distance < self.radius
+        if not close.any():
+            return
+        first, second = first[close], second[close]
+        delta_x, delta_y, distance = delta_x[close], delta_y[close], distance[close]
+
+        # Przeciwnicy w tym samym punkcie – deterministyczny kierunek zależny od numeru LOD
+        stacked = distance < 1e-6
+        if stacked.any():
+            angles = columns["lod_slot"][rows[first[stacked]]] * GOLDEN_ANGLE
+            delta_x[stacked] = np.cos(angles)
+            delta_y[stacked] = np.sin(angles)
+            distance[stacked] = 1.0
+
+        # Siła rośnie liniowo wraz z nakładaniem się (0 na granicy promienia, 1 przy zetknięciu środków)
+        weight = (self.radius - distance) / (self.radius * distance)
+        push_x = delta_x * weight
+        push_y = delta_y * weight
+        force_x = np.bincount(first, push_x, count) - np.bincount(second, push_x, count)
+        force_y = np.bincount(first, push_y, count) - np.bincount(second, push_y, count)
+
+        # Ograniczenie długości przesunięcia do strength
+        scale = self.strength / np.maximum(np.hypot(force_x, force_y), 1.0)
+        columns["separation_x"][rows] = force_x * scale
+        columns["separation_y"][rows] = force_y * scale
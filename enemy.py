@@ -1,14 +1,41 @@
 import pygame
 import random
 import math
+from asset_cache import AssetCache
+from scheduler import Scheduler
+from enemy_store import EnemyStore, TYPE_BASIC, COLLISION_SCALE, store_field
 
 class Enemy:
     """
     Klasa reprezentująca podstawowego przeciwnika w grze.
     Przeciwnik porusza się w stronę gracza, może zadawać obrażenia przy kolizji
     i posiada metody do przyjmowania obrażeń oraz rysowania.
+
+    Dane symulacji (pozycja, rozmiar, prędkość, zdrowie, flagi, LOD) leżą w wierszu self.slot
+    magazynu EnemyStore – atrybuty poniżej są do niego oknami, więc przeciwnicy mogą być
+    aktualizowani wektorowo (EnemyStore.move_chasers) lub pojedynczo, metodami tej klasy.
     """
-    def __init__(self, x, y, speed, health, xp_value=1, wall_rects=None):
+    # Część sprite'a, która koliduje ze ścianami – wspólna z wektorowym ruchem w EnemyStore
+    COLLISION_SCALE = COLLISION_SCALE
+
+    x = store_field("x")
+    y = store_field("y")
+    width = store_field("width")
+    height = store_field("height")
+    speed = store_field("speed")
+    health = store_field("health")
+    type_id = store_field("type_id")
+    attack_ready = store_field("attack_ready")
+    to_remove = store_field("to_remove")
+    facing_right = store_field("facing_right")
+    separation_x = store_field("separation_x")
+    separation_y = store_field("separation_y")
+    lod_slot = store_field("lod_slot")
+    lod_tier = store_field("lod_tier")
+    lod_time_scale = store_field("lod_time_scale")
+    entity_id = store_field("entity_id")
+
+    def __init__(self, x, y, speed, health, xp_value=1, collision_world=None):
         """
         Inicjalizuje przeciwnika.
 
@@ -17,8 +44,13 @@ class Enemy:
         :param speed: Prędkość ruchu
         :param health: Punkty życia przeciwnika
         :param xp_value: Wartość XP przy pokonaniu (domyślnie 1)
-        :param wall_rects: Opcjonalna lista prostokątów kolizji (np. ścian)
+        :param collision_world: Opcjonalna siatka kolizji terenu (CollisionWorld)
         """
+        # Wiersz w EnemyStore; po usunięciu przeciwnika None, a atrybuty czytają ostatnie wartości
+        self.slot = EnemyStore.allocate(self)
+        self.released_values = None
+        self.type_id = TYPE_BASIC
+
         self.x = x
         self.y = y
         self.width = 64
@@ -27,62 +59,206 @@ class Enemy:
         self.health = health
         self.xp_value = xp_value
 
-        # Prostokąt kolizji, ustawiony na podstawie pozycji i rozmiaru
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-
         # Obrażenia zadawane graczowi przy kolizji
         self.damage = 10
 
-        # Ustawienia ataku – czas odnowienia i licznik czasu (w klatkach)
+        # Ustawienia ataku – czas odnowienia (w klatkach) i gotowość; koniec cooldownu planuje Scheduler
         self.attack_cooldown = 120
-        self.last_attack_time = 0
+        self.attack_ready = True
+        self.attack_timer = None
+
+        # Przesunięcie rozpychające hordę, wyznaczane co klatkę przez CrowdSeparation
+        self.separation_x = 0.0
+        self.separation_y = 0.0
+
+        # Poziom szczegółowości symulacji – ustawiany co klatkę przez SimulationLOD
+        # (stały numer lod_slot, rozkładający aktualizacje między klatki, nadaje EnemyStore)
+        self.lod_tier = 0
+        self.lod_time_scale = 1    # 0 – pominięcie w tej klatce, n – krok czasu n klatek
 
         # Flaga określająca kierunek – przydatna przy obracaniu sprite'a
         self.facing_right = True
 
-        # Wczytanie grafiki przeciwnika i skalowanie do ustalonych rozmiarów
-        self.image = pygame.image.load("assets/images/Enemy_ChaotycznaBestia.png")
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        # Grafika przeciwnika (współdzielona, w obu kierunkach) z pamięci podręcznej
+        self.set_facing_images("assets/images/Enemy_ChaotycznaBestia.png")
 
         # Flaga, która wskazuje, czy przeciwnik ma zostać usunięty (np. po śmierci)
         self.to_remove = False
 
-    def move_towards_player(self, player_x, player_y, wall_rects):
+    @property
+    def rect(self):
+        """
+        Prostokąt przeciwnika (sprite'a) wyznaczony z pozycji i rozmiaru.
+        :return: pygame.Rect
+        """
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    @rect.setter
+    def rect(self, rect):
+        self.x, self.y, self.width, self.height = rect
+
+    def release(self):
+        """
+        Zwalnia wiersz przeciwnika w EnemyStore (wywoływane przez EnemyStore.collect_removed).
+        Obiekt pozostaje czytelny – atrybuty zwracają wartości z chwili usunięcia.
+        """
+        if self.slot is not None:
+            self.released_values = EnemyStore.release(self.slot)
+            self.slot = None
+        # Oczekujący cooldown nie może odblokować ataku przeciwnika użytego ponownie z puli
+        if self.attack_timer is not None:
+            self.attack_timer.cancel()
+            self.attack_timer = None
+
+    def respawn(self, x, y, speed, health, xp_value=1):
+        """
+        Ponownie aktywuje przeciwnika zwolnionego metodą release() (obiekt z puli EnemyFactory):
+        przydziela nowy wiersz w EnemyStore, zachowując rozmiar, typ i grafikę, i ustawia stan
+        jak przy tworzeniu przeciwnika.
+
+        :param x: Pozycja x
+        :param y: Pozycja y
+        :param speed: Prędkość ruchu
+        :param health: Punkty życia
+        :param xp_value: Wartość XP przy pokonaniu
+        """
+        values = self.released_values
+        self.slot = EnemyStore.allocate(self)
+        self.released_values = None
+        self.type_id = values["type_id"]
+        self.width = values["width"]
+        self.height = values["height"]
+        self.x = x
+        self.y = y
+        self.speed = speed
+        self.health = health
+        self.xp_value = xp_value
+        self.attack_ready = True
+        self.lod_time_scale = 1
+        self.set_facing(True)
+
+    def set_facing(self, facing_right):
+        """
+        Obraca przeciwnika w prawo lub w lewo (gotowe warianty z AssetCache, bez tworzenia nowej powierzchni).
+
+        :param facing_right: True – przeciwnik patrzy w prawo
+        """
+        self.facing_right = facing_right
+        self.image = self.image_right if facing_right else self.image_left
+
+    def set_facing_images(self, path):
+        """
+        Ustawia grafikę przeciwnika: pobiera z AssetCache współdzielone warianty
+        zwrócone w prawo i w lewo (w aktualnym rozmiarze przeciwnika).
+
+        :param path: Ścieżka do obrazu przeciwnika
+        """
+        self.image_right, self.image_left = AssetCache.get_facing(path, (self.width, self.height))
+        self.image = self.image_right if self.facing_right else self.image_left
+
+    def get_collision_rect(self):
+        """
+        Zwraca prostokąt kolizji przeciwnika ze ścianami (wyśrodkowany, mniejszy od sprite'a,
+        aby przeciwnik mieścił się w wąskich korytarzach).
+        :return: pygame.Rect
+        """
+        collision_w = int(self.width * self.COLLISION_SCALE)
+        collision_h = int(self.height * self.COLLISION_SCALE)
+        return pygame.Rect(
+            self.x + (self.width - collision_w) // 2,
+            self.y + (self.height - collision_h) // 2,
+            collision_w,
+            collision_h
+        )
+
+    def move_with_sliding(self, step_x, step_y, collision_world):
+        """
+        Przesuwa przeciwnika o (step_x, step_y), rozpatrując osie osobno – zablokowana oś
+        jest cofana, a ruch w drugiej osi pozwala "ślizgać się" wzdłuż ściany.
+        Każdy test sprawdza tylko kilka komórek siatki pokrywanych przez przeciwnika.
+
+        :param step_x: Przesunięcie w osi X
+        :param step_y: Przesunięcie w osi Y
+        :param collision_world: Siatka kolizji terenu (CollisionWorld) lub None – ruch bez kolizji
+        """
+        # Przeciwnik, który już tkwi w ścianie (np. minion zespawnowany w murze), porusza się swobodnie,
+        # dopóki z niej nie wyjdzie
+        if collision_world is None or collision_world.collides(self.get_collision_rect()):
+            self.x += step_x
+            self.y += step_y
+            return
+
+        if step_x:
+            self.x += step_x
+            if collision_world.collides(self.get_collision_rect()):
+                self.x -= step_x
+        if step_y:
+            self.y += step_y
+            if collision_world.collides(self.get_collision_rect()):
+                self.y -= step_y
+
+    def move_towards_player(self, player_x, player_y, collision_world, flow_field=None, time_scale=1):
         """
         Porusza przeciwnika w kierunku gracza.
 
-        Oblicza wektor między przeciwnikiem a graczem, normalizuje go i aktualizuje pozycję.
+        Kierunek ruchu pochodzi z pola przepływu (FlowField) – przeciwnik idzie do środka kolejnego
+        kafelka drogi omijającej ściany. W kafelku gracza lub bez pola przepływu idzie prosto do gracza.
+        Oblicza wektor ruchu, normalizuje go i aktualizuje pozycję,
+        dodając przesunięcie separacji od sąsiadów (CrowdSeparation) i ślizgając się wzdłuż ścian
+        (move_with_sliding).
         Dodatkowo, obraca sprite, aby przeciwnik "patrzył" w stronę gracza.
 
         :param player_x: Pozycja x gracza
         :param player_y: Pozycja y gracza
-        :param wall_rects: Lista prostokątów kolizji (może być None, jeśli nie jest używana)
+        :param collision_world: Siatka kolizji terenu – CollisionWorld (może być None, jeśli nie jest używana)
+        :param flow_field: Opcjonalne pole przepływu (FlowField) prowadzące do gracza
+        :param time_scale: Liczba klatek, które obejmuje ten krok (SimulationLOD dla dalekich przeciwników)
         """
-        # Zapamiętanie poprzedniej pozycji
-        old_x, old_y = self.x, self.y
-
         # Obliczenie różnicy pozycji
         dx = player_x - self.x
         dy = player_y - self.y
-        distance = math.hypot(dx, dy)
+
+        # Kierunek ruchu – kolejny punkt drogi z pola przepływu lub prosto do gracza
+        move_dx, move_dy = dx, dy
+        if flow_field is not None:
+            center_x = self.x + self.width / 2
+            center_y = self.y + self.height / 2
+            waypoint = flow_field.next_waypoint(center_x, center_y)
+            if waypoint is not None:
+                move_dx = waypoint[0] - center_x
+                move_dy = waypoint[1] - center_y
+
+        distance = math.hypot(move_dx, move_dy)
+        step_x, step_y = self.separation_x, self.separation_y
         if distance != 0:
             # Aktualizacja pozycji z uwzględnieniem prędkości i normalizacji
-            self.x += self.speed * (dx / distance)
-            self.y += self.speed * (dy / distance)
-
-        # Aktualizacja prostokąta kolizji
-        self.rect.topleft = (self.x, self.y)
+            step_x += self.speed * (move_dx / distance)
+            step_y += self.speed * (move_dy / distance)
+        step_x *= time_scale
+        step_y *= time_scale
+        # Ruch z kolizją ze ścianami
+        self.move_with_sliding(step_x, step_y, collision_world)
 
         # Obracanie sprite'a: jeśli gracz znajduje się po lewej a przeciwnik dotąd patrzył w prawo – odwracamy
         if dx < 0 and self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
-            self.facing_right = False
+            self.set_facing(False)
         elif dx > 0 and not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
-            self.facing_right = True
+            self.set_facing(True)
+
+    def can_see(self, target_x, target_y, collision_world):
+        """
+        Sprawdza, czy przeciwnik widzi punkt (np. środek gracza) – czy między nimi nie ma ściany.
+        Korzysta z pamięci podręcznej widoczności par komórek w CollisionWorld.
 
-        # Uaktualnienie prostokąta kolizji po ewentualnym obróceniu
-        self.rect.topleft = (self.x, self.y)
+        :param target_x: Współrzędna x celu (w pikselach)
+        :param target_y: Współrzędna y celu (w pikselach)
+        :param collision_world: Siatka kolizji terenu (CollisionWorld) lub None – wtedy zawsze True
+        :return: True, jeśli cel jest widoczny
+        """
+        if collision_world is None:
+            return True
+        own_cell = collision_world.cell_at(self.x + self.width / 2, self.y + self.height / 2)
+        return collision_world.cells_visible(own_cell, collision_world.cell_at(target_x, target_y))
 
     def take_damage(self, damage):
         """
@@ -94,19 +270,31 @@ class Enemy:
         self.health -= damage
         return self.health <= 0
 
-    def check_collision_with_player(self, player, current_time):
+    def start_attack_cooldown(self):
+        """
+        Blokuje atak na czas attack_cooldown – odblokowanie planowane jest w Scheduler,
+        więc oczekujący cooldown nie wymaga żadnej pracy w kolejnych klatkach.
+        """
+        self.attack_ready = False
+        self.attack_timer = Scheduler.schedule(self.attack_cooldown, self._on_attack_ready)
+
+    def _on_attack_ready(self):
+        self.attack_ready = True
+        self.attack_timer = None
+
+    def check_collision_with_player(self, player):
         """
         Sprawdza, czy przeciwnik koliduje z graczem.
-        Jeśli nastąpi kolizja i upłynął wymagany czas od ostatniego ataku, przeciwnik zadaje obrażenia.
+        Jeśli nastąpi kolizja i atak jest gotowy (minął cooldown), przeciwnik zadaje obrażenia.
 
         :param player: Obiekt gracza
-        :param current_time: Aktualny czas (np. liczba klatek), wykorzystywany do kontroli cooldownu ataku
         """
+        if not self.attack_ready:
+            return
         player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
         if self.rect.colliderect(player_rect):
-            if current_time - self.last_attack_time >= self.attack_cooldown:
-                player.take_damage(self.damage)
-                self.last_attack_time = current_time
+            player.take_damage(self.damage)
+            self.start_attack_cooldown()
 
     def draw(self, screen, camera_x, camera_y):
         """
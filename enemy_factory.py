@@ -0,0 +1,117 @@
+import math
+from enemy import Enemy
+from ranged_enemy import RangedEnemy
+
+# Prefabrykaty przeciwników: archetyp -> (klasa, parametry konstruktora i ponownej aktywacji)
+PREFABS = {
+    "basic": (Enemy, {"speed": 2, "health": 50, "xp_value": 1}),
+    "ranged": (RangedEnemy, {"speed": 1.5, "health": 40, "xp_value": 3}),
+    "minion": (Enemy, {"speed": 2, "health": 30, "xp_value": 1}),
+}
+
+
+class EnemyFactory:
+    """
+    Klasa EnemyFactory – tworzy przeciwników z archetypów (PREFABS), korzystając z pul obiektów
+    przygotowanych w prewarm(); pokonani przeciwnicy wracają do puli metodą recycle().
+    """
+    MAX_PREWARM = 128          # Górna granica wolnych obiektów przygotowywanych dla archetypu
+    BOSS_MINION_PREWARM = 32   # Liczba minionów przygotowywanych przed falą z bossem
+
+    _pools = {archetype: [] for archetype in PREFABS}
+    created = 0                # Obiekty utworzone od zera
+    reused = 0                 # Spawny obsłużone obiektem z puli
+
+    @staticmethod
+    def reset():
+        """
+        Opróżnia pule i zeruje statystyki (np. przy starcie nowej gry).
+        """
+        EnemyFactory._pools = {archetype: [] for archetype in PREFABS}
+        EnemyFactory.created = 0
+        EnemyFactory.reused = 0
+
+    @staticmethod
+    def _create(archetype, x, y):
+        """
+        Tworzy nowy obiekt przeciwnika danego archetypu.
+        """
+        cls, params = PREFABS[archetype]
+        enemy = cls(x, y, **params)
+        enemy.archetype = archetype
+        EnemyFactory.created += 1
+        return enemy
+
+    @staticmethod
+    def prewarm(archetype, count):
+        """
+        Uzupełnia pulę archetypu do co najmniej count wolnych obiektów.
+
+        :param archetype: Klucz PREFABS
+        :param count: Oczekiwana liczba wolnych obiektów
+        """
+        pool = EnemyFactory._pools[archetype]
+        for _ in range(min(count, EnemyFactory.MAX_PREWARM) - len(pool)):
+            enemy = EnemyFactory._create(archetype, 0, 0)
+            enemy.release()
+            pool.append(enemy)
+
+    @staticmethod
+    def prewarm_for_wave(wave_info):
+        """
+        Przygotowuje pule na falę: liczba obiektów archetypu to liczba spawnów w całej fali
+        (czas trwania / tempo spawnu z spawn_rates), a przed falą z bossem – pula minionów.
+
+        :param wave_info: Słownik z danymi o fali (duration, spawn_rates, boss)
+        """
+        duration = wave_info.get("duration", 0)
+        for archetype, rate in wave_info.get("spawn_rates", {}).items():
+            if archetype in PREFABS and rate > 0:
+                EnemyFactory.prewarm(archetype, math.ceil(duration / rate))
+        if wave_info.get("boss", False):
+            EnemyFactory.prewarm("minion", EnemyFactory.BOSS_MINION_PREWARM)
+
+    @staticmethod
+    def spawn(archetype, x, y):
+        """
+        Zwraca aktywnego przeciwnika danego archetypu w pozycji (x, y) – z puli, jeśli to możliwe.
+
+        :param archetype: Klucz PREFABS ("basic", "ranged", "minion")
+        :param x: Pozycja x (lewy-górny róg)
+        :param y: Pozycja y (lewy-górny róg)
+        :return: Obiekt Enemy
+        """
+        pool = EnemyFactory._pools[archetype]
+        if not pool:
+            return EnemyFactory._create(archetype, x, y)
+        enemy = pool.pop()
+        enemy.respawn(x, y, **PREFABS[archetype][1])
+        EnemyFactory.reused += 1
+        return enemy
+
+    @staticmethod
+    def recycle(enemies):
+        """
+        Zwraca pokonanych przeciwników do pul ich archetypów. Przeciwnicy spoza fabryki
+        (np. boss) są pomijani. Wiersze EnemyStore muszą być już zwolnione (collect_removed).
+
+        :param enemies: Lista usuniętych przeciwników
+        """
+        pools = EnemyFactory._pools
+        for enemy in enemies:
+            archetype = getattr(enemy, "archetype", None)
+            if archetype is not None:
+                pools[archetype].append(enemy)
+
+    @staticmethod
+    def stats():
+        """
+        Zwraca statystyki fabryki.
+
+        :return: Słownik z kluczami "created", "reused" i "pooled" (wolne obiekty na archetyp)
+        """
+        return {
+            "created": EnemyFactory.created,
+            "reused": EnemyFactory.reused,
+            "pooled": {archetype: len(pool) for archetype, pool in EnemyFactory._pools.items()},
+        }
@@ -0,0 +1,351 @@
+import numpy as np
+from column_store import make_columns, grow_columns, swap_remove_row
+
+# Identyfikatory typów przeciwników (kolumna type_id)
+TYPE_BASIC = 0
+TYPE_RANGED = 1
+TYPE_BOSS = 2
+
+# Kolumny magazynu: nazwa -> typ numpy
+FIELDS = {
+    "x": np.float64,
+    "y": np.float64,
+    "width": np.int32,
+    "height": np.int32,
+    "speed": np.float64,
+    "health": np.float64,
+    "type_id": np.int8,
+    "attack_ready": np.bool_,
+    "to_remove": np.bool_,
+    "facing_right": np.bool_,
+    "separation_x": np.float64,
+    "separation_y": np.float64,
+    "lod_slot": np.int64,
+    "lod_tier": np.int8,
+    "lod_time_scale": np.int32,
+    "entity_id": np.int64,
+    # Efekty statusu (StatusEffects): ładunki i klatka wygaśnięcia (Scheduler.now)
+    "burn_stacks": np.int32,
+    "burn_until": np.int64,
+    "poison_stacks": np.int32,
+    "poison_until": np.int64,
+    "slow_until": np.int64,
+    "freeze_until": np.int64,
+    "slow_amount": np.float64,
+}
+
+# Część sprite'a (w każdej osi), która koliduje ze ścianami – wyśrodkowana "stopka" przeciwnika
+COLLISION_SCALE = 0.6
+
+# Identyfikator przeciwnika: (pokolenie << ID_INDEX_BITS) | indeks w tablicy pokoleń
+ID_INDEX_BITS = 32
+ID_INDEX_MASK = (1 << ID_INDEX_BITS) - 1
+
+
+class EnemyStore:
+    """
+    Klasa EnemyStore – dane wszystkich przeciwników w tablicach numpy (wiersz na przeciwnika)
+    oraz rejestr ich identyfikatorów z pokoleniem; obiekt Enemy czyta i zapisuje swój wiersz.
+    """
+    count = 0                  # Liczba zajętych wierszy
+    capacity = 0               # Rozmiar tablic
+    handles = []               # Wiersz -> obiekt Enemy
+    next_lod_slot = 0          # Kolejny numer rozkładu aktualizacji LOD
+    columns = make_columns(FIELDS, 0)
+    # Tablica pokoleń: indeks identyfikatora -> wiersz (-1 – wolny) i bieżące pokolenie
+    _id_slots = []
+    _id_generations = []
+    _free_ids = []
+
+    @staticmethod
+    def reset(capacity=256):
+        """
+        Usuwa wszystkich przeciwników i przydziela puste tablice.
+
+        :param capacity: Początkowa pojemność (tablice rosną dwukrotnie w razie potrzeby)
+        """
+        EnemyStore.count = 0
+        EnemyStore.capacity = capacity
+        EnemyStore.handles = [None] * capacity
+        EnemyStore.next_lod_slot = 0
+        EnemyStore.columns = make_columns(FIELDS, capacity)
+        EnemyStore._id_slots = []
+        EnemyStore._id_generations = []
+        EnemyStore._free_ids = []
+
+    @staticmethod
+    def _grow():
+        """
+        Podwaja pojemność tablic, zachowując zawartość zajętych wierszy.
+        """
+        capacity = grow_columns(EnemyStore.columns, EnemyStore.count, EnemyStore.count + 1)
+        EnemyStore.handles.extend([None] * (capacity - EnemyStore.capacity))
+        EnemyStore.capacity = capacity
+
+    @staticmethod
+    def allocate(handle):
+        """
+        Przydziela wiersz dla nowego przeciwnika.
+
+        :param handle: Obiekt Enemy, który będzie czytał ten wiersz
+        :return: Numer wiersza (slot)
+        """
+        if EnemyStore.count == EnemyStore.capacity:
+            EnemyStore._grow()
+        slot = EnemyStore.count
+        EnemyStore.count += 1
+        for column in EnemyStore.columns.values():
+            column[slot] = 0
+        EnemyStore.columns["lod_slot"][slot] = EnemyStore.next_lod_slot
+        EnemyStore.next_lod_slot += 1
+        EnemyStore.handles[slot] = handle
+
+        # Identyfikator z pokoleniem – wolny indeks z listy lub nowy
+        if EnemyStore._free_ids:
+            index = EnemyStore._free_ids.pop()
+            EnemyStore._id_slots[index] = slot
+        else:
+            index = len(EnemyStore._id_slots)
+            EnemyStore._id_slots.append(slot)
+            EnemyStore._id_generations.append(0)
+        EnemyStore.columns["entity_id"][slot] = (EnemyStore._id_generations[index] << ID_INDEX_BITS) | index
+        return slot
+
+    @staticmethod
+    def release(slot):
+        """
+        Zwalnia wiersz – ostatni zajęty wiersz jest przenoszony na jego miejsce (O(1)).
+
+        :param slot: Numer zwalnianego wiersza
+        :return: Słownik z ostatnimi wartościami kolumn zwolnionego wiersza
+        """
+        columns = EnemyStore.columns
+        snapshot = {name: column[slot].item() for name, column in columns.items()}
+        # Unieważnienie identyfikatora – nowe pokolenie, indeks wraca na listę wolnych
+        index = snapshot["entity_id"] & ID_INDEX_MASK
+        EnemyStore._id_slots[index] = -1
+        EnemyStore._id_generations[index] += 1
+        EnemyStore._free_ids.append(index)
+
+        last = EnemyStore.count - 1
+        swap_remove_row(columns, slot, last)
+        if slot != last:
+            moved = EnemyStore.handles[last]
+            EnemyStore.handles[slot] = moved
+            moved.slot = slot
+            EnemyStore._id_slots[int(columns["entity_id"][slot]) & ID_INDEX_MASK] = slot
+        EnemyStore.handles[last] = None
+        EnemyStore.count = last
+        return snapshot
+
+    @staticmethod
+    def get(entity_id):
+        """
+        Rozwiązuje identyfikator przeciwnika.
+
+        :param entity_id: Identyfikator (enemy.entity_id) lub None
+        :return: Obiekt Enemy lub None – gdy przeciwnik został już usunięty (nieaktualne pokolenie)
+        """
+        if entity_id is None:
+            return None
+        index = entity_id & ID_INDEX_MASK
+        if index >= len(EnemyStore._id_slots) or EnemyStore._id_generations[index] != entity_id >> ID_INDEX_BITS:
+            return None
+        return EnemyStore.handles[EnemyStore._id_slots[index]]
+
+    @staticmethod
+    def entities():
+        """
+        Zwraca listę aktywnych przeciwników (w kolejności wierszy).
+        """
+        return EnemyStore.handles[:EnemyStore.count]
+
+    @staticmethod
+    def column(name):
+        """
+        Zwraca widok kolumny ograniczony do zajętych wierszy.
+
+        :param name: Nazwa kolumny (klucz FIELDS)
+        :return: Tablica numpy (widok – zapis zmienia dane przeciwników)
+        """
+        return EnemyStore.columns[name][:EnemyStore.count]
+
+    @staticmethod
+    def handles_at(slots):
+        """
+        Zwraca obiekty Enemy dla podanych wierszy.
+        """
+        handles = EnemyStore.handles
+        return [handles[slot] for slot in slots.tolist()]
+
+    @staticmethod
+    def apply_damage(slots, damage):
+        """
+        Zadaje obrażenia przeciwnikom w podanych wierszach (powtórzenia sumują się)
+        i oznacza do usunięcia tych, których zdrowie spadło do zera.
+
+        :param slots: Tablica numerów wierszy
+        :param damage: Obrażenia (liczba lub tablica o długości slots)
+        :return: Tablica wierszy przeciwników pokonanych tym wywołaniem
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        if not len(slots):
+            return slots
+        health = EnemyStore.columns["health"]
+        to_remove = EnemyStore.columns["to_remove"]
+        np.subtract.at(health, slots, damage)
+        hit = np.unique(slots)
+        killed = hit[(health[hit] <= 0) & ~to_remove[hit]]
+        to_remove[killed] = True
+        return killed
+
+    @staticmethod
+    def collect_removed():
+        """
+        Zwalnia wiersze przeciwników oznaczonych do usunięcia.
+
+        :return: Lista usuniętych obiektów Enemy (pusta, jeśli nikt nie zginął – bez dodatkowej pracy)
+        """
+        removed_slots = np.flatnonzero(EnemyStore.column("to_remove"))
+        if not len(removed_slots):
+            return []
+        removed = EnemyStore.handles_at(removed_slots)
+        for enemy in removed:
+            enemy.release()
+        return removed
+
+    @staticmethod
+    def move_chasers(player_x, player_y, collision_world=None, flow_field=None, types=(TYPE_BASIC, TYPE_RANGED)):
+        """
+        Wektorowy ruch przeciwników w stronę gracza – odpowiednik Enemy.move_towards_player
+        dla wszystkich przeciwników podanych typów naraz: kierunek z pola przepływu (lub prosto
+        do gracza), separacja od sąsiadów, krok LOD, spowolnienie z efektów statusu (slow_amount)
+        i ślizganie wzdłuż ścian w każdej osi osobno.
+        Aktualizowani są tylko przeciwnicy z lod_time_scale > 0.
+
+        :param player_x: Pozycja x gracza (lewy-górny róg)
+        :param player_y: Pozycja y gracza (lewy-górny róg)
+        :param collision_world: Opcjonalna siatka kolizji terenu (CollisionWorld)
+        :param flow_field: Opcjonalne pole przepływu (FlowField)
+        :param types: Typy przeciwników objętych ruchem
+        :return: Tablica wierszy przeciwników, którzy wykonali ruch
+        """
+        c = EnemyStore.columns
+        n = EnemyStore.count
+        active = np.isin(c["type_id"][:n], types) & (c["lod_time_scale"][:n] > 0) & ~c["to_remove"][:n]
+        slots = np.flatnonzero(active)
+        if not len(slots):
+            return slots
+
+        x = c["x"][slots]
+        y = c["y"][slots]
+        width = c["width"][slots]
+        height = c["height"][slots]
+        dx = player_x - x
+        dy = player_y - y
+        # Spowolnienie z efektów statusu (1 – zamrożony przeciwnik stoi w miejscu)
+        speed_factor = 1.0 - c["slow_amount"][slots]
+
+        # Kierunek ruchu – kolejny punkt drogi z pola przepływu lub prosto do gracza
+        move_dx, move_dy = dx, dy
+        if flow_field is not None:
+            center_x = x + width / 2
+            center_y = y + height / 2
+            waypoint_x, waypoint_y, valid = flow_field.waypoints(center_x, center_y)
+            move_dx = np.where(valid, waypoint_x - center_x, dx)
+            move_dy = np.where(valid, waypoint_y - center_y, dy)
+
+        distance = np.hypot(move_dx, move_dy)
+        scale = np.divide(c["speed"][slots], distance, out=np.zeros_like(distance), where=distance != 0)
+        time_scale = c["lod_time_scale"][slots] * speed_factor
+        step_x = (move_dx * scale + c["separation_x"][slots]) * time_scale
+        step_y = (move_dy * scale + c["separation_y"][slots]) * time_scale
+
+        new_x = x + step_x
+        new_y = y + step_y
+        if collision_world is not None:
+            # Stopka kolizji – jak w Enemy.get_collision_rect
+            foot_w = (width * COLLISION_SCALE).astype(np.int64)
+            foot_h = (height * COLLISION_SCALE).astype(np.int64)
+            offset_x = (width - foot_w) // 2
+            offset_y = (height - foot_h) // 2
+
+            def blocked(px, py):
+                return collision_world.rects_blocked(np.floor(px + offset_x), np.floor(py + offset_y), foot_w, foot_h)
+
+            # Przeciwnik tkwiący w ścianie porusza się swobodnie, pozostali cofają zablokowaną oś
+            free = blocked(x, y)
+            new_x = np.where(~free & (step_x != 0) & blocked(new_x, y), x, new_x)
+            new_y = np.where(~free & (step_y != 0) & blocked(new_x, new_y), y, new_y)
+
+        c["x"][slots] = new_x
+        c["y"][slots] = new_y
+
+        # Zmiana kierunku patrzenia – tylko dla przeciwników, którzy się obrócili
+        facing_right = c["facing_right"][slots]
+        turned = (((dx < 0) & facing_right) | ((dx > 0) & ~facing_right)) & (speed_factor > 0)
+        if turned.any():
+            for enemy in EnemyStore.handles_at(slots[turned]):
+                enemy.set_facing(not enemy.facing_right)
+        return slots
+
+    @staticmethod
+    def touching_rect(slots, rect):
+        """
+        Wybiera przeciwników, których prostokąt nachodzi na podany prostokąt (np. gracza).
+
+        :param slots: Tablica wierszy do sprawdzenia
+        :param rect: pygame.Rect
+        :return: Tablica wierszy przeciwników nachodzących na prostokąt
+        """
+        c = EnemyStore.columns
+        left = np.floor(c["x"][slots])
+        top = np.floor(c["y"][slots])
+        overlap = ((left < rect.right) & (left + c["width"][slots] > rect.left) &
+                   (top < rect.bottom) & (top + c["height"][slots] > rect.top))
+        return slots[overlap]
+
+    @staticmethod
+    def visible_slots(camera_x, camera_y, screen_width, screen_height, always_types=(TYPE_BOSS,)):
+        """
+        Wybiera przeciwników do narysowania: tych, których sprite choćby częściowo leży na ekranie,
+        oraz wszystkich przeciwników z always_types (draw() bossa rysuje też i odlicza efekty).
+
+        :param camera_x: Pozycja kamery w osi X (w pikselach)
+        :param camera_y: Pozycja kamery w osi Y (w pikselach)
+        :param screen_width: Szerokość ekranu (w pikselach)
+        :param screen_height: Wysokość ekranu (w pikselach)
+        :param always_types: Typy przeciwników rysowanych zawsze
+        :return: Tablica wierszy
+        """
+        c = EnemyStore.columns
+        n = EnemyStore.count
+        x = c["x"][:n]
+        y = c["y"][:n]
+        visible = ((x < camera_x + screen_width) & (x + c["width"][:n] > camera_x) &
+                   (y < camera_y + screen_height) & (y + c["height"][:n] > camera_y))
+        return np.flatnonzero(visible | np.isin(c["type_id"][:n], always_types))
+
+
+def store_field(name):
+    """
+    Tworzy właściwość (property) klasy Enemy czytającą i zapisującą kolumnę magazynu.
+    Po zwolnieniu wiersza (enemy.slot is None) właściwość działa na kopii ostatnich wartości.
+
+    :param name: Nazwa kolumny (klucz FIELDS)
+    :return: property
+    """
+    def getter(self):
+        slot = self.slot
+        if slot is None:
+            return self.released_values[name]
+        return EnemyStore.columns[name][slot].item()
+
+    def setter(self, value):
+        slot = self.slot
+        if slot is None:
+            self.released_values[name] = value
+        else:
+            EnemyStore.columns[name][slot] = value
+
+    return property(getter, setter)
@@ -0,0 +1,202 @@
+import threading
+import numpy as np
+
+
+class FlowFieldBuffer:
+    """
+    Jeden bufor pola przepływu: kafelek docelowy, odległości i środki kolejnych kafelków drogi.
+    """
+    def __init__(self, rows, cols):
+        self.target_cell = None
+        # Odległość (w krokach) od kafelka gracza; FlowField.UNREACHABLE dla kafelków nieosiągalnych
+        self.distance = np.full((rows, cols), FlowField.UNREACHABLE, dtype=np.int32)
+        # Środek kolejnego kafelka na drodze do gracza (w pikselach)
+        self.next_x = np.zeros((rows, cols))
+        self.next_y = np.zeros((rows, cols))
+
+
+class FlowField:
+    """
+    Wspólne pole przepływu (flow field) prowadzące wszystkich przeciwników do gracza.
+
+    Przeszukiwanie wszerz (BFS) z kafelka gracza po siatce nawigacyjnej wyznacza odległość
+    każdego kafelka od gracza oraz kolejny kafelek na najkrótszej drodze. Cały front przeszukiwania
+    rozszerzany jest naraz operacjami na tablicach numpy. Pole jest przeliczane tylko wtedy, gdy
+    gracz przejdzie do innego kafelka, a przeciwnik odczytuje swój kierunek jednym odwołaniem do
+    tablicy – koszt wyszukiwania drogi nie zależy od liczby przeciwników.
+
+    W trybie background pole budowane jest w wątku roboczym do bufora tylnego (podwójne buforowanie).
+    Gotowy bufor zamieniany jest z przednim w update(), na początku klatki głównego wątku, więc
+    przeciwnicy zawsze czytają kompletne pole, a pętla gry nigdy nie czeka na przeliczenie.
+    """
+    UNREACHABLE = -1
+
+    def __init__(self, nav_grid, background=True):
+        """
+        :param nav_grid: Siatka nawigacyjna (NavGrid)
+        :param background: Czy przeliczać pole w wątku roboczym
+        """
+        self.nav_grid = nav_grid
+        self.tile_size = nav_grid.tile_size
+        self.rows = nav_grid.rows
+        self.cols = nav_grid.cols
+        ts = self.tile_size
+        # Środki kafelków (w pikselach) – źródło wartości next_x / next_y
+        self.center_x = np.broadcast_to(np.arange(self.cols) * ts + ts / 2, (self.rows, self.cols))
+        self.center_y = np.broadcast_to((np.arange(self.rows) * ts + ts / 2)[:, None], (self.rows, self.cols))
+
+        self.front = FlowFieldBuffer(self.rows, self.cols)   # Czytany przez przeciwników
+        self.back = FlowFieldBuffer(self.rows, self.cols)    # Zapisywany przez wątek roboczy
+        self.requested_cell = None
+
+        # Stan wątku roboczego (chroniony przez self.condition)
+        self.condition = threading.Condition()
+        self.pending_cell = None    # Kafelek, dla którego wątek ma zbudować pole
+        self.back_ready = False     # Bufor tylny zawiera gotowe pole
+        self.running = background
+        self.worker = None
+        if background:
+            self.worker = threading.Thread(target=self._worker_loop, name="FlowFieldWorker", daemon=True)
+            self.worker.start()
+
+    @property
+    def target_cell(self):
+        """
+        Kafelek gracza, dla którego zbudowano aktualnie czytane pole.
+        """
+        return self.front.target_cell
+
+    def update(self, player_x, player_y):
+        """
+        Publikuje gotowe pole z wątku roboczego i zleca przeliczenie, jeśli gracz zmienił kafelek.
+        Wywoływana raz na klatkę, przed ruchem przeciwników.
+
+        :param player_x: Współrzędna x środka gracza (w pikselach)
+        :param player_y: Współrzędna y środka gracza (w pikselach)
+        """
+        cell = self.nav_grid.nearest_walkable(int(player_y // self.tile_size), int(player_x // self.tile_size))
+
+        if self.worker is None or self.front.target_cell is None:
+            # Bez wątku (lub przy pierwszym polu) budujemy synchronicznie
+            if cell is not None and cell != self.front.target_cell:
+                self.build(cell, self.back)
+                self.front, self.back = self.back, self.front
+                self.requested_cell = cell
+            return
+
+        with self.condition:
+            if self.back_ready:
+                # Zamiana buforów – od tej chwili przeciwnicy czytają nowe pole
+                self.front, self.back = self.back, self.front
+                self.back_ready = False
+            if cell is not None and cell != self.requested_cell and self.pending_cell is None:
+                self.requested_cell = cell
+                self.pending_cell = cell
+                self.condition.notify()
+
+    def stop(self):
+        """
+        Zatrzymuje wątek roboczy (np. przy restarcie gry).
+        """
+        if self.worker is None:
+            return
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.worker.join()
+        self.worker = None
+
+    def _worker_loop(self):
+        """
+        Pętla wątku roboczego: czeka na zlecenie, buduje pole do bufora tylnego i zgłasza gotowość.
+        """
+        while True:
+            with self.condition:
+                while self.running and (self.pending_cell is None or self.back_ready):
+                    self.condition.wait()
+                if not self.running:
+                    return
+                cell = self.pending_cell
+                buffer = self.back
+            # Bufor tylny nie jest czytany przez główny wątek – budowa bez blokady
+            self.build(cell, buffer)
+            with self.condition:
+                self.pending_cell = None
+                self.back_ready = True
+
+    def build(self, target_cell, buffer):
+        """
+        Wyznacza odległości i kolejne kafelki drogi do kafelka docelowego (BFS po froncie, numpy).
+
+        :param target_cell: Krotka (wiersz, kolumna) kafelka gracza
+        :param buffer: FlowFieldBuffer, do którego zapisywany jest wynik
+        """
+        nav_grid = self.nav_grid
+        pass_east = nav_grid.pass_east
+        pass_south = nav_grid.pass_south
+        distance = buffer.distance
+        next_x = buffer.next_x
+        next_y = buffer.next_y
+        distance.fill(self.UNREACHABLE)
+
+        distance[target_cell] = 0
+        next_x[target_cell] = self.center_x[target_cell]
+        next_y[target_cell] = self.center_y[target_cell]
+        frontier = np.zeros((self.rows, self.cols), dtype=bool)
+        frontier[target_cell] = True
+        step = 0
+        while frontier.any():
+            step += 1
+            unvisited = distance == self.UNREACHABLE
+            reached = np.zeros_like(frontier)
+            # Każdy kierunek: (cel, źródło, przejście) – kafelki odkryte z frontu sąsiada
+            # dostają środek tego sąsiada jako kolejny krok drogi
+            for target, source, passable in (
+                ((slice(None), slice(1, None)), (slice(None), slice(None, -1)), pass_east),    # na wschód
+                ((slice(None), slice(None, -1)), (slice(None), slice(1, None)), pass_east),    # na zachód
+                ((slice(1, None), slice(None)), (slice(None, -1), slice(None)), pass_south),   # na południe
+                ((slice(None, -1), slice(None)), (slice(1, None), slice(None)), pass_south),   # na północ
+            ):
+                new = frontier[source] & passable & unvisited[target] & ~reached[target]
+                if not new.any():
+                    continue
+                reached[target] |= new
+                next_x[target][new] = self.center_x[source][new]
+                next_y[target][new] = self.center_y[source][new]
+            distance[reached] = step
+            frontier = reached
+        buffer.target_cell = target_cell
+
+    def next_waypoint(self, x, y):
+        """
+        Zwraca punkt, w stronę którego powinien iść przeciwnik stojący w punkcie (x, y).
+
+        :param x: Współrzędna x środka przeciwnika (w pikselach)
+        :param y: Współrzędna y środka przeciwnika (w pikselach)
+        :return: Krotka (x, y) środka kolejnego kafelka lub None – gdy przeciwnik jest w kafelku gracza,
+                 poza mapą lub w kafelku nieosiągalnym (wtedy powinien iść prosto do gracza)
+        """
+        field = self.front
+        row = int(y // self.tile_size)
+        col = int(x // self.tile_size)
+        if not (0 <= row < self.rows and 0 <= col < self.cols) or field.distance[row, col] <= 0:
+            return None
+        return field.next_x[row, col], field.next_y[row, col]
+
+    def waypoints(self, xs, ys):
+        """
+        Wektorowy odpowiednik next_waypoint() dla tablicy punktów (np. środków wszystkich przeciwników).
+
+        :param xs: Tablica numpy współrzędnych x (w pikselach)
+        :param ys: Tablica numpy współrzędnych y (w pikselach)
+        :return: Krotka (waypoint_x, waypoint_y, valid) – valid jest False tam, gdzie next_waypoint()
+                 zwróciłby None
+        """
+        field = self.front
+        rows = (ys // self.tile_size).astype(np.int64)
+        cols = (xs // self.tile_size).astype(np.int64)
+        inside = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        rows = np.where(inside, rows, 0)
+        cols = np.where(inside, cols, 0)
+        valid = inside & (field.distance[rows, cols] > 0)
+        return field.next_x[rows, cols], field.next_y[rows, cols], valid
@@ -0,0 +1,234 @@
+import pygame
+import numpy as np
+from audio_manager import AudioManager
+from scheduler import Scheduler
+from enemy_store import EnemyStore, TYPE_BASIC, TYPE_RANGED, TYPE_BOSS
+from projectile_enemy import EnemyProjectiles
+from enemy_factory import EnemyFactory
+from status_effects import StatusEffects
+from xp_gems import XPGems
+from system_pipeline import SystemPipeline
+
+# Typy przeciwników zadające obrażenia przy kontakcie z graczem
+CONTACT_TYPES = (TYPE_BASIC,)
+
+
+def _ranged_attack(enemy, ctx):
+    enemy.handle_attack(ctx.player, ctx.screen_width, ctx.screen_height, ctx.map_width, ctx.map_height,
+                        ctx.collision_world)
+
+
+def _boss_update(enemy, ctx):
+    enemy.update(ctx.player, ctx.screen_width, ctx.screen_height, ctx.enemies, ctx.collision_world,
+                 ctx.map_width, ctx.map_height)
+
+
+# Zachowania przeciwników wykonywane po ruchu hordy: type_id -> (funkcja(enemy, ctx), czy zależy od LOD).
+# Nowy typ przeciwnika dostaje zachowanie wpisem w tej tabeli, a nie kolejną gałęzią isinstance.
+ENEMY_BEHAVIOURS = {
+    TYPE_RANGED: (_ranged_attack, True),
+    TYPE_BOSS: (_boss_update, False),
+}
+
+
+def spawn_system(ctx):
+    """
+    Upływ czasu gry i spawn przeciwników z systemu fal.
+    """
+    ctx.game_time += ctx.delta_time
+    ctx.wave_system.update(
+        game_time=ctx.game_time,
+        delta_time=ctx.delta_time,
+        enemies=ctx.enemies,
+        collision_world=ctx.collision_world,
+        camera_x=ctx.camera_x, camera_y=ctx.camera_y,
+        map_pixel_width=ctx.map_pixel_width, map_pixel_height=ctx.map_pixel_height
+    )
+
+
+def timer_system(ctx):
+    """
+    Harmonogram cooldownów – odpalane są tylko timery kończące się w tej klatce.
+    """
+    Scheduler.tick()
+
+
+def player_death_system(ctx):
+    """
+    Koniec gry po śmierci gracza – przerywa resztę klatki.
+    """
+    if ctx.player.health <= 0:
+        AudioManager.play_player_death()
+        AudioManager.fade_to_gameover_music()
+        ctx.next_state = "game_over"
+        return False
+
+
+def player_system(ctx):
+    """
+    Ruch gracza, strzał broni podstawowej i lot jej pocisków.
+    """
+    keys = pygame.key.get_pressed()
+    ctx.player.update(keys, ctx.map_width, ctx.map_height, ctx.collision_world, ctx.screen, ctx.level_system,
+                      ctx.delta_time, ctx.map_width, ctx.map_height, ctx.nearest_index)
+
+
+def separation_system(ctx):
+    """
+    Rozpychanie hordy – boss nie jest odpychany przez zwykłych przeciwników.
+    """
+    ctx.crowd_separation.update()
+
+
+def flow_field_system(ctx):
+    """
+    Pole przepływu – publikacja gotowego bufora i zlecenie przeliczenia po zmianie kafelka gracza.
+    """
+    player = ctx.player
+    ctx.flow_field.update(player.x + player.width / 2, player.y + player.height / 2)
+
+
+def lod_system(ctx):
+    """
+    LOD symulacji – boss zawsze aktualizowany w pełni.
+    """
+    ctx.simulation_lod.update(ctx.camera_x, ctx.camera_y)
+
+
+def status_effect_system(ctx):
+    """
+    Efekty statusu – obrażenia w czasie i spowolnienia jedną operacją wektorową na typ efektu.
+    Pokonani przez efekty są oznaczani do usunięcia (kryształy XP upuszcza cleanup_system).
+    """
+    StatusEffects.tick()
+
+
+def movement_system(ctx):
+    """
+    Ruch całej hordy jedną operacją wektorową na kolumnach EnemyStore.
+    """
+    ctx.moved = EnemyStore.move_chasers(ctx.player.x, ctx.player.y, ctx.collision_world, ctx.flow_field)
+
+
+def contact_system(ctx):
+    """
+    Obrażenia przy kontakcie – pętla tylko po przeciwnikach gotowych do ataku, którzy dotykają gracza.
+    Zamrożeni przeciwnicy nie atakują.
+    """
+    moved = ctx.moved
+    columns = EnemyStore.columns
+    attackers = moved[np.isin(columns["type_id"][moved], CONTACT_TYPES) & columns["attack_ready"][moved] &
+                      (columns["slow_amount"][moved] < 1.0)]
+    player = ctx.player
+    player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
+    for enemy in EnemyStore.handles_at(EnemyStore.touching_rect(attackers, player_rect)):
+        player.take_damage(enemy.damage)
+        enemy.start_attack_cooldown()
+
+
+def enemy_behaviour_system(ctx):
+    """
+    Zachowania zależne od typu (ENEMY_BEHAVIOURS) – wiersze każdego typu wybierane z kolumny type_id.
+    Zamrożeni przeciwnicy są pomijani.
+    """
+    count = EnemyStore.count
+    columns = EnemyStore.columns
+    alive = ~columns["to_remove"][:count] & ~StatusEffects.immobile_mask()
+    for type_id, (behaviour, lod_gated) in ENEMY_BEHAVIOURS.items():
+        mask = alive & (columns["type_id"][:count] == type_id)
+        if lod_gated:
+            mask &= columns["lod_time_scale"][:count] > 0
+        # Uchwyty pobierane przed wywołaniami – zachowanie może dodawać przeciwników (miniony bossa)
+        for enemy in EnemyStore.handles_at(np.flatnonzero(mask)):
+            behaviour(enemy, ctx)
+
+
+def enemy_projectile_system(ctx):
+    """
+    Wszystkie pociski wrogów – jedno przejście po wspólnym buforze (także pociski poległych strzelców).
+    """
+    EnemyProjectiles.update(ctx.player, ctx.map_pixel_width, ctx.map_pixel_height, ctx.collision_world)
+
+
+def collision_system(ctx):
+    """
+    Trafienia pocisków gracza – tylko pary z sąsiednich komórek siatki.
+    """
+    ctx.enemy_index.rebuild(ctx.enemies)
+    ctx.player.current_weapon.resolve_projectile_hits(ctx.enemy_index)
+
+
+def weapon_system(ctx):
+    """
+    Bronie obszarowe (satelity, wybuch) – zapytania do tego samego indeksu przestrzennego.
+    """
+    player = ctx.player
+    for weapon in (player.secondary_weapon_1, player.secondary_weapon_2):
+        weapon.update(player, ctx.enemies, ctx.screen, ctx.delta_time, ctx.enemy_index)
+
+
+def cleanup_system(ctx):
+    """
+    Granica klatki – odroczone usunięcie oznaczonych przeciwników (swap-remove wierszy EnemyStore).
+    Lista aktywnych przeciwników pobierana jest z rejestru tylko wtedy, gdy ktoś faktycznie zginął.
+    Każdy pokonany przeciwnik upuszcza kryształ XP o wartości xp_value.
+    Pokonanie bossa przerywa resztę klatki.
+    """
+    removed = EnemyStore.collect_removed()
+    if removed:
+        ctx.enemies = EnemyStore.entities()
+        XPGems.drop([enemy.x + enemy.width / 2 for enemy in removed],
+                    [enemy.y + enemy.height / 2 for enemy in removed],
+                    [enemy.xp_value for enemy in removed])
+        # Pokonani przeciwnicy wracają do pul fabryki
+        EnemyFactory.recycle(removed)
+    # Pozycje żywych przeciwników dla celowania w następnej klatce
+    ctx.nearest_index.rebuild()
+
+    if any(enemy.type_id == TYPE_BOSS for enemy in removed):
+        print("Boss został pokonany!")
+        AudioManager.fade_to_gameover_music()  # lub odtwarzamy muzykę zwycięstwa
+        ctx.next_state = "boss_defeated"
+        return False
+
+
+def xp_gem_system(ctx):
+    """
+    Magnes i zbieranie kryształów XP – punkty trafiają do LevelSystem po dotarciu kryształu do gracza.
+    """
+    XPGems.update(ctx.player, ctx.level_system)
+
+
+def level_up_system(ctx):
+    """
+    Otwarcie menu ulepszeń, jeśli gracz awansował.
+    """
+    ctx.level_system.handle_possible_level_up()
+
+
+def build_simulation_pipeline():
+    """
+    Tworzy harmonogram systemów symulacji w kolejności wykonywania w klatce.
+    Systemy rysowania dodaje main() – zależą od funkcji pomocniczych ekranu.
+
+    :return: SystemPipeline
+    """
+    pipeline = SystemPipeline()
+    pipeline.add("spawn", spawn_system)
+    pipeline.add("timers", timer_system)
+    pipeline.add("player_death", player_death_system)
+    pipeline.add("player", player_system)
+    pipeline.add("separation", separation_system)
+    pipeline.add("flow_field", flow_field_system)
+    pipeline.add("lod", lod_system)
+    pipeline.add("status_effects", status_effect_system)
+    pipeline.add("movement", movement_system)
+    pipeline.add("contact", contact_system)
+    pipeline.add("enemy_behaviour", enemy_behaviour_system)
+    pipeline.add("enemy_projectiles", enemy_projectile_system)
+    pipeline.add("collisions", collision_system)
+    pipeline.add("weapons", weapon_system)
+    pipeline.add("cleanup", cleanup_system)
+    pipeline.add("xp_gems", xp_gem_system)
+    pipeline.add("level_up", level_up_system)
+    return pipeline
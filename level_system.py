@@ -1,6 +1,7 @@
 import random
 import pygame
 from audio_manager import AudioManager
+from asset_cache import AssetCache
 
 class LevelSystem:
     def __init__(self, player, initial_points_needed=2, level_up_increment=6):
@@ -39,9 +40,7 @@ class LevelSystem:
         }
         self.weapon_icons = {}
         for key, path in weapon_icon_paths.items():
-            icon_surf = pygame.image.load(path).convert_alpha()
-            icon_surf = pygame.transform.scale(icon_surf, (32, 32))
-            self.weapon_icons[key] = icon_surf
+            self.weapon_icons[key] = AssetCache.get(path, (32, 32))
         # Dodanie ikony dla ulepszenia leczenia – prosta zielona ikona
         self.weapon_icons["heal"] = pygame.Surface((32, 32), pygame.SRCALPHA)
         pygame.draw.circle(self.weapon_icons["heal"], (0, 255, 0), (16, 16), 15)
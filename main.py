@@ -4,16 +4,28 @@ import sys
 
 # Importy modułów gry
 from player import Player
-from enemy import Enemy
 from level_system import LevelSystem
-from ranged_enemy import RangedEnemy
-from projectile_enemy import EnemyProjectile
+from projectile_enemy import EnemyProjectiles
 from tile_manager import TileManager
+from collision_world import CollisionWorld
+from nav_grid import NavGrid
+from spawn_sampler import SpawnSampler
+from flow_field import FlowField
+from simulation_lod import SimulationLOD
+from spatial_hash import SpatialHash
+from crowd_separation import CrowdSeparation
+from nearest_index import NearestEnemyIndex
 from wave_collapse import WaveCollapse
 from adjacency_rules import adjacency_rules
 from wave_system import WaveSystem
-from boss_enemy import BossEnemy
 from audio_manager import AudioManager
+from sprite_atlas import SpriteAtlas
+from scheduler import Scheduler
+from enemy_store import EnemyStore
+from enemy_factory import EnemyFactory
+from system_pipeline import FrameContext
+from game_systems import build_simulation_pipeline
+from xp_gems import XPGems
 from screens import TitleScreen, IntroScreen, BossVictoryScreen, GameOverScreen
 
 # ============================
@@ -22,6 +34,7 @@ from screens import TitleScreen, IntroScreen, BossVictoryScreen, GameOverScreen
 SCREEN_WIDTH, SCREEN_HEIGHT = 1200, 900
 FPS = 60
 BLACK = (0, 0, 0)
+PIPELINE_STATS = False  # Diagnostyka: logowanie najdroższych systemów potoku razem z FPS
 
 # Wczytanie kafelka tła (placeholder)
 tile = pygame.image.load("assets/images/tile_placeholder.png")
@@ -179,6 +192,71 @@ def update_camera_on_player(player, camera_x, camera_y, screen_width, screen_hei
     return new_camera_x, new_camera_y
 
 
+def draw_terrain(ctx):
+    """
+    Rysuje kafelki terenu z uwzględnieniem przesunięcia kamery.
+    """
+    tile_manager = ctx.tile_manager
+    tile_width = tile_manager.tile_width()
+    tile_height = tile_manager.tile_height()
+    for row in range(ctx.map_height):
+        for col in range(ctx.map_width):
+            tile_surf = tile_manager.get_surface(ctx.terrain_map[row][col])
+            ctx.screen.blit(tile_surf, (col * tile_width - ctx.camera_x, row * tile_height - ctx.camera_y))
+
+
+# ============================
+# SYSTEMY KAMERY I RYSOWANIA
+# ============================
+def camera_system(ctx):
+    """
+    Aktualizacja kamery, aby gracz był na środku.
+    """
+    ctx.camera_x, ctx.camera_y = update_camera_on_player(
+        ctx.player,
+        ctx.camera_x,
+        ctx.camera_y,
+        ctx.screen_width,
+        ctx.screen_height,
+        ctx.map_width,
+        ctx.map_height,
+        ctx.tile_manager.tile_width()
+    )
+
+
+def render_system(ctx):
+    """
+    Rysuje klatkę: teren, kryształy XP, wybuchy, gracza, widocznych przeciwników, pociski wrogów i interfejs.
+    """
+    screen = ctx.screen
+    player = ctx.player
+    camera_x, camera_y = ctx.camera_x, ctx.camera_y
+
+    # Rysowanie tła (kafelki)
+    draw_terrain(ctx)
+
+    # Kryształy XP leżą na ziemi – pod wybuchami, graczem i przeciwnikami
+    XPGems.draw(screen, camera_x, camera_y)
+    # Rysowanie efektów wybuchu przed innymi elementami
+    player.secondary_weapon_2.draw_explosions(screen, camera_x, camera_y)
+    # Rysowanie gracza oraz przeciwników – zwykli przeciwnicy tylko wtedy, gdy ich sprite leży na ekranie
+    player.draw(screen, camera_x, camera_y)
+    for enemy in EnemyStore.handles_at(EnemyStore.visible_slots(camera_x, camera_y, ctx.screen_width, ctx.screen_height)):
+        enemy.draw(screen, camera_x, camera_y)
+    EnemyProjectiles.draw(screen, camera_x, camera_y)
+
+    # Rysowanie paska doświadczenia
+    draw_experience_bar_and_timer(screen, ctx.level_system, ctx.screen_width, ctx.game_time)
+
+    # Jeśli menu ulepszeń jest aktywne – rysujemy je na wierzchu
+    if ctx.level_system.in_level_up_menu:
+        ctx.level_system.draw_level_up_menu(screen, ctx.screen_width, ctx.screen_height)
+
+    # Reset flagi dla broni (np. aktualizacji satelitów czy wybuchów)
+    player.secondary_weapon_1.satellite_updated = False
+    player.secondary_weapon_2.explosion_updated = False
+
+
 # ============================
 # FUNKCJA GŁÓWNA
 # ============================
@@ -187,6 +265,7 @@ def main():
     AudioManager.init()  # Inicjalizacja audio
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Echo of Chaos")
+    SpriteAtlas.init()  # Wypieczone atlasy sprite'ów (jeśli istnieją) – po utworzeniu okna
     clock = pygame.time.Clock()
 
     # ----------------------------
@@ -210,15 +289,12 @@ def main():
     wfc = WaveCollapse(map_width, map_height, all_tiles)
     terrain_map = wfc.collapse()
 
-    # Pobieramy prostokąty kolizji ze wszystkich kafelków
-    all_wall_rects = []
-    for row in range(map_height):
-        for col in range(map_width):
-            tile_name = terrain_map[row][col]
-            x = col * tile_manager.tile_width()
-            y = row * tile_manager.tile_height()
-            collision_rects = tile_manager.get_collision_rects(tile_name, x, y)
-            all_wall_rects.extend(collision_rects)
+    # Budujemy siatkę kolizji – prostokąty kolizji kafelków przypisane do komórek mapy
+    collision_world = CollisionWorld(terrain_map, tile_manager)
+    # Siatka nawigacyjna – dostępne kafelki i przejścia między nimi
+    nav_grid = NavGrid(collision_world)
+    # Wspólne pole przepływu – droga do gracza dla wszystkich przeciwników (przeliczana w wątku roboczym)
+    flow_field = FlowField(nav_grid, background=True)
 
     # ----------------------------
     # Inicjalizacja zmiennych gry
@@ -227,11 +303,6 @@ def main():
     game_over = False
     map_pixel_width = map_width * tile_manager.tile_width()
     map_pixel_height = map_height * tile_manager.tile_height()
-    camera_x, camera_y = 0, 0
-    game_time = 0
-
-    # Inicjalizacja systemu fal
-    wave_system = WaveSystem(WAVE_DATA, total_game_time=600, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT)
 
     # Inicjalizacja gracza:
     # Wybieramy środek dowolnego kafelka typu "floor"
@@ -246,16 +317,49 @@ def main():
     spawn_x, spawn_y = candidate_positions[mid_idx]
     player = Player(spawn_x - 32, spawn_y - 32)  # centrowanie gracza
 
-    enemies = []  # Lista przeciwników
+    # Inicjalizacja systemu fal – spawn tylko na polach osiągalnych z pozycji gracza
+    spawn_sampler = SpawnSampler(nav_grid, spawn_x, spawn_y, SCREEN_WIDTH, SCREEN_HEIGHT)
+    wave_system = WaveSystem(WAVE_DATA, total_game_time=600, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                             spawn_sampler=spawn_sampler)
+
+    # Haszowanie przestrzenne przeciwników – odbudowywane co klatkę (broad-phase kolizji)
+    enemy_index = SpatialHash(cell_size=128)
+    # Separacja hordy – własna siatka o komórce równej promieniowi odpychania
+    crowd_separation = CrowdSeparation(radius=48, strength=1.5)
+    # Indeks najbliższych przeciwników – automatyczne celowanie i pociski naprowadzane
+    nearest_index = NearestEnemyIndex(cell_size=128)
+    # Poziomy szczegółowości symulacji – dalecy przeciwnicy aktualizowani rzadziej, z większym krokiem
+    simulation_lod = SimulationLOD(SCREEN_WIDTH, SCREEN_HEIGHT)
     # Inicjalizacja systemu poziomów (do ulepszania broni i przyrostu XP)
     level_system = LevelSystem(player)
 
     frame_count = 0
     start_time = pygame.time.get_ticks()
 
-    # Zmienna służąca do odliczania klatek przy kolizjach przeciwników (używana m.in. w enemy.check_collision_with_player)
-    enemy_frame_counter = 0
-    boss_defeated = False
+    # Harmonogram cooldownów (koło czasowe) i magazyn danych przeciwników – każda gra zaczyna od zera
+    Scheduler.reset()
+    EnemyStore.reset()
+    EnemyProjectiles.reset()
+    EnemyFactory.reset()
+    XPGems.reset()
+
+    # Stan klatki współdzielony przez systemy i harmonogram systemów (symulacja, kamera, rysowanie)
+    ctx = FrameContext(
+        screen=screen, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+        tile_manager=tile_manager, terrain_map=terrain_map,
+        map_width=map_width, map_height=map_height,
+        map_pixel_width=map_pixel_width, map_pixel_height=map_pixel_height,
+        player=player, level_system=level_system, wave_system=wave_system,
+        collision_world=collision_world, flow_field=flow_field, simulation_lod=simulation_lod,
+        crowd_separation=crowd_separation, enemy_index=enemy_index, nearest_index=nearest_index,
+        enemies=[],          # Lista przeciwników
+        moved=None,          # Wiersze EnemyStore przesunięte w tej klatce (system ruchu)
+        camera_x=0, camera_y=0,
+        game_time=0, delta_time=0.0,
+    )
+    pipeline = build_simulation_pipeline()
+    pipeline.add("camera", camera_system)
+    pipeline.add("render", render_system)
 
     # ----------------------------
     # GŁÓWNA PĘTLA GRY
@@ -271,6 +375,8 @@ def main():
         if frame_count % 60 == 0:
             actual_fps = frame_count / elapsed_time
             print(f"Rzeczywiste FPS: {actual_fps:.2f} (logowane co 60 klatek)")
+            if PIPELINE_STATS:
+                print(f"Najdroższe systemy: {pipeline.summary()}")
 
         # ----------------------------
         # Obsługa zdarzeń
@@ -326,6 +432,7 @@ def main():
             pygame.display.flip()
             if not boss_victory_screen.running:
                 # Restart gry – wywołanie main() ponownie
+                flow_field.stop()
                 main()
                 return
             continue
@@ -335,6 +442,7 @@ def main():
             game_over_screen.draw(screen)
             pygame.display.flip()
             if not game_over_screen.running:
+                flow_field.stop()
                 main()
                 return
             continue
@@ -345,136 +453,39 @@ def main():
         if level_system.in_level_up_menu:
             # Jeśli aktywne jest menu ulepszeń – renderujemy grę w tle
             screen.fill(BLACK)
-            for row in range(map_height):
-                for col in range(map_width):
-                    tile_name = terrain_map[row][col]
-                    tile_surf = tile_manager.get_surface(tile_name)
-                    screen_x = col * tile_manager.tile_width() - camera_x
-                    screen_y = row * tile_manager.tile_height() - camera_y
-                    screen.blit(tile_surf, (screen_x, screen_y))
-            player.draw(screen, camera_x, camera_y)
-            for enemy in enemies:
-                enemy.draw(screen, camera_x, camera_y)
-            draw_experience_bar_and_timer(screen, level_system, SCREEN_WIDTH, game_time)
+            draw_terrain(ctx)
+            XPGems.draw(screen, ctx.camera_x, ctx.camera_y)
+            player.draw(screen, ctx.camera_x, ctx.camera_y)
+            for enemy in ctx.enemies:
+                enemy.draw(screen, ctx.camera_x, ctx.camera_y)
+            EnemyProjectiles.draw(screen, ctx.camera_x, ctx.camera_y)
+            draw_experience_bar_and_timer(screen, level_system, SCREEN_WIDTH, ctx.game_time)
             level_system.draw_level_up_menu(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
             pygame.display.flip()
 
             # Aktualizacja fal – zatrzymujemy ruch przeciwników, gdy gracz wybiera ulepszenie
             wave_system.update(
-                game_time=game_time,
+                game_time=ctx.game_time,
                 delta_time=0.0,
-                enemies=enemies,
-                all_wall_rects=all_wall_rects,
-                camera_x=camera_x, camera_y=camera_y,
+                enemies=ctx.enemies,
+                collision_world=collision_world,
+                camera_x=ctx.camera_x, camera_y=ctx.camera_y,
                 map_pixel_width=map_pixel_width, map_pixel_height=map_pixel_height
             )
             continue
-        else:
-            # Aktualizacja czasu i fal
-            game_time += delta_time
-            wave_system.update(
-                game_time=game_time,
-                delta_time=delta_time,
-                enemies=enemies,
-                all_wall_rects=all_wall_rects,
-                camera_x=camera_x, camera_y=camera_y,
-                map_pixel_width=map_pixel_width, map_pixel_height=map_pixel_height
-            )
-            enemy_frame_counter += 1
 
-        # Sprawdzenie stanu gracza (koniec gry)
-        if player.health <= 0:
-            AudioManager.play_player_death()
-            AudioManager.fade_to_gameover_music()
-            game_state = "game_over"
+        # Harmonogram systemów klatki: symulacja, kamera i rysowanie (z pomiarem czasu każdego systemu)
+        ctx.delta_time = delta_time
+        if not pipeline.run(ctx):
+            # System przerwał klatkę zmianą stanu gry (śmierć gracza, pokonanie bossa)
+            game_state = ctx.next_state
+            ctx.next_state = None
             continue
 
-        # ----------------------------
-        # Aktualizacja gracza oraz broni
-        # ----------------------------
-        keys = pygame.key.get_pressed()
-        player.update(keys, map_width, map_height, all_wall_rects, screen, level_system, delta_time, map_width, map_height)
-        player.secondary_weapon_1.update(player, enemies, screen, level_system, delta_time)
-        player.secondary_weapon_2.update(player, enemies, screen, level_system, delta_time)
-
-        # ----------------------------
-        # Aktualizacja przeciwników
-        # ----------------------------
-        for enemy in enemies[:]:
-            if isinstance(enemy, BossEnemy):
-                enemy.update(player, SCREEN_WIDTH, SCREEN_HEIGHT, enemies, all_wall_rects, map_width, map_height)
-            elif isinstance(enemy, RangedEnemy):
-                enemy.update(player, SCREEN_WIDTH, SCREEN_HEIGHT, all_wall_rects, map_width, map_height)
-            else:
-                enemy.move_towards_player(player.x, player.y, None)
-                enemy.check_collision_with_player(player, enemy_frame_counter)
-            # Sprawdzenie kolizji pocisków gracza z przeciwnikami
-            for projectile in player.current_weapon.projectiles[:]:
-                if enemy.rect.colliderect(projectile.rect):
-                    player.current_weapon.projectiles.remove(projectile)
-                    if enemy.take_damage(player.current_weapon.damage):
-                        enemy.to_remove = True
-                        level_system.add_chaos_points(enemy.xp_value)
-
-        # Usuwamy przeciwników oznaczonych do usunięcia
-        enemies_to_remove = [enemy for enemy in enemies if enemy.to_remove]
-        enemies = [enemy for enemy in enemies if not enemy.to_remove]
-
-        # Jeśli któryś z usuniętych przeciwników był Boss-em, zmieniamy stan gry
-        if any(isinstance(enemy, BossEnemy) for enemy in enemies_to_remove):
-            boss_defeated = True
-            print("Boss został pokonany!")
-            AudioManager.fade_to_gameover_music()  # lub odtwarzamy muzykę zwycięstwa
-            game_state = "boss_defeated"
-            continue
-
-        # Obsługa menu ulepszeń, jeśli gracz awansował
-        level_system.handle_possible_level_up()
-
-        # Aktualizacja kamery, aby gracz był na środku
-        camera_x, camera_y = update_camera_on_player(
-            player,
-            camera_x,
-            camera_y,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT,
-            map_width,
-            map_height,
-            tile_manager.tile_width()
-        )
-
-        # Rysowanie tła (kafelki)
-        for row in range(map_height):
-            for col in range(map_width):
-                tile_name = terrain_map[row][col]
-                tile_surf = tile_manager.get_surface(tile_name)
-                world_x = col * tile_manager.tile_width()
-                world_y = row * tile_manager.tile_height()
-                screen_x = world_x - camera_x
-                screen_y = world_y - camera_y
-                screen.blit(tile_surf, (screen_x, screen_y))
-
-        # Rysowanie efektów wybuchu przed innymi elementami
-        player.secondary_weapon_2.draw_explosions(screen, camera_x, camera_y)
-        # Rysowanie gracza oraz przeciwników
-        player.draw(screen, camera_x, camera_y)
-        for enemy in enemies:
-            enemy.draw(screen, camera_x, camera_y)
-
-        # Rysowanie paska doświadczenia
-        draw_experience_bar_and_timer(screen, level_system, SCREEN_WIDTH, game_time)
-
-        # Jeśli menu ulepszeń jest aktywne – rysujemy je na wierzchu
-        if level_system.in_level_up_menu:
-            level_system.draw_level_up_menu(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
-
-        # Reset flagi dla broni (np. aktualizacji satelitów czy wybuchów)
-        player.secondary_weapon_1.satellite_updated = False
-        player.secondary_weapon_2.explosion_updated = False
-
         pygame.display.flip()
         clock.tick(FPS)
 
+    flow_field.stop()
     pygame.quit()
     sys.exit()
 
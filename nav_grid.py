@@ -0,0 +1,105 @@
+from collections import deque
+import numpy as np
+import pygame
+
+# Rozmiar "stopki" przeciwnika używany do testów przechodniości (Enemy: 64 px * COLLISION_SCALE 0.6)
+DEFAULT_AGENT_SIZE = 38
+
+
+class NavGrid:
+    """
+    Siatka nawigacyjna zbudowana raz na podstawie siatki kolizji terenu.
+
+    Dla każdego kafelka zapamiętuje, czy przeciwnik może w nim stanąć (walkable), a dla każdej
+    pary sąsiednich kafelków – czy może przejść przez ich wspólną krawędź (pass_east, pass_south).
+    Testy wykonywane są jednorazowo prostokątem wielkości stopki przeciwnika, więc późniejsze
+    zapytania (osiągalność, losowanie pól spawnu) to wyłącznie operacje na tablicach numpy.
+    """
+    def __init__(self, collision_world, agent_size=DEFAULT_AGENT_SIZE):
+        """
+        :param collision_world: Siatka kolizji terenu (CollisionWorld)
+        :param agent_size: Bok kwadratu (w pikselach) przybliżającego stopkę przeciwnika
+        """
+        self.collision_world = collision_world
+        self.tile_size = collision_world.tile_size
+        self.rows = collision_world.rows
+        self.cols = collision_world.cols
+        ts = self.tile_size
+        half = agent_size // 2
+
+        def free(center_x, center_y):
+            probe = pygame.Rect(center_x - half, center_y - half, agent_size, agent_size)
+            return not collision_world.collides(probe)
+
+        # Pole dostępne – stopka wyśrodkowana w kafelku nie dotyka ściany
+        self.walkable = np.zeros((self.rows, self.cols), dtype=bool)
+        # Przejście do sąsiada po prawej / poniżej – stopka wyśrodkowana na wspólnej krawędzi
+        self.pass_east = np.zeros((self.rows, max(0, self.cols - 1)), dtype=bool)
+        self.pass_south = np.zeros((max(0, self.rows - 1), self.cols), dtype=bool)
+        for row in range(self.rows):
+            center_y = row * ts + ts // 2
+            for col in range(self.cols):
+                center_x = col * ts + ts // 2
+                self.walkable[row, col] = free(center_x, center_y)
+        for row in range(self.rows):
+            center_y = row * ts + ts // 2
+            for col in range(self.cols - 1):
+                if self.walkable[row, col] and self.walkable[row, col + 1]:
+                    self.pass_east[row, col] = free((col + 1) * ts, center_y)
+        for row in range(self.rows - 1):
+            for col in range(self.cols):
+                if self.walkable[row, col] and self.walkable[row + 1, col]:
+                    self.pass_south[row, col] = free(col * ts + ts // 2, (row + 1) * ts)
+
+    def neighbours(self, row, col):
+        """
+        Zwraca kafelki sąsiednie (4-sąsiedztwo), do których można przejść z podanego kafelka.
+
+        :return: Generator krotek (wiersz, kolumna)
+        """
+        if col + 1 < self.cols and self.pass_east[row, col]:
+            yield row, col + 1
+        if col > 0 and self.pass_east[row, col - 1]:
+            yield row, col - 1
+        if row + 1 < self.rows and self.pass_south[row, col]:
+            yield row + 1, col
+        if row > 0 and self.pass_south[row - 1, col]:
+            yield row - 1, col
+
+    def nearest_walkable(self, row, col):
+        """
+        Zwraca najbliższy (w metryce Czebyszewa) dostępny kafelek – np. dla punktu stojącego przy ścianie.
+
+        :return: Krotka (wiersz, kolumna) lub None, jeśli na mapie nie ma dostępnych kafelków
+        """
+        row = min(max(row, 0), self.rows - 1)
+        col = min(max(col, 0), self.cols - 1)
+        if self.walkable[row, col]:
+            return row, col
+        cells = np.argwhere(self.walkable)
+        if not len(cells):
+            return None
+        nearest = np.abs(cells - (row, col)).max(axis=1).argmin()
+        return int(cells[nearest, 0]), int(cells[nearest, 1])
+
+    def reachable_from(self, row, col):
+        """
+        Wyznacza kafelki osiągalne z podanego kafelka (przeszukiwanie wszerz).
+
+        :param row: Wiersz kafelka startowego
+        :param col: Kolumna kafelka startowego
+        :return: Tablica numpy bool (rows x cols) – True dla kafelków osiągalnych
+        """
+        reachable = np.zeros((self.rows, self.cols), dtype=bool)
+        start = self.nearest_walkable(row, col)
+        if start is None:
+            return reachable
+        reachable[start] = True
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for neighbour in self.neighbours(*cell):
+                if not reachable[neighbour]:
+                    reachable[neighbour] = True
+                    queue.append(neighbour)
+        return reachable
@@ -0,0 +1,137 @@
+import numpy as np
+from enemy_store import EnemyStore
+
+
+class NearestEnemyIndex:
+    """
+    Indeks pozycji przeciwników do zapytań o najbliższego (i k najbliższych) przeciwnika.
+
+    Środki przeciwników są grupowane w komórkach jednorodnej siatki (odbudowywanej co klatkę).
+    Zapytanie przeszukuje pierścienie komórek wokół punktu – od najbliższego na zewnątrz – i kończy,
+    gdy żaden dalszy pierścień nie może zawierać bliższego przeciwnika. Odległości do kandydatów
+    liczone są wektorowo (numpy), więc koszt zależy od liczby przeciwników w pobliżu, a nie od
+    liczby wszystkich przeciwników na mapie.
+    """
+    def __init__(self, cell_size=128):
+        """
+        :param cell_size: Rozmiar komórki siatki (w pikselach)
+        """
+        self.cell_size = cell_size
+        self.items = []
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.cells = {}   # (kolumna, wiersz) -> lista indeksów w self.items
+        self.bounds = (0, 0, 0, 0)
+
+    def rebuild(self):
+        """
+        Odbudowuje indeks na podstawie aktualnych pozycji przeciwników z EnemyStore.
+        Przeciwnicy oznaczeni do usunięcia (to_remove) są pomijani.
+        """
+        columns = EnemyStore.columns
+        rows = np.flatnonzero(~EnemyStore.column("to_remove"))
+        self.items = EnemyStore.handles_at(rows)
+        count = len(self.items)
+        self.xs = columns["x"][rows] + columns["width"][rows] / 2
+        self.ys = columns["y"][rows] + columns["height"][rows] / 2
+        self.cells = {}
+        if not count:
+            return
+        cell_xs = (self.xs // self.cell_size).astype(int)
+        cell_ys = (self.ys // self.cell_size).astype(int)
+        cells = self.cells
+        for i, key in enumerate(zip(cell_xs.tolist(), cell_ys.tolist())):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+        self.bounds = (int(cell_xs.min()), int(cell_xs.max()), int(cell_ys.min()), int(cell_ys.max()))
+
+    def __len__(self):
+        return len(self.items)
+
+    def _ring(self, cell_x, cell_y, ring, out):
+        """
+        Dopisuje do listy out indeksy przeciwników z komórek leżących w odległości
+        (w metryce Czebyszewa) dokładnie ring od komórki (cell_x, cell_y).
+        """
+        cells = self.cells
+        if ring == 0:
+            out.extend(cells.get((cell_x, cell_y), ()))
+            return
+        for cx in range(cell_x - ring, cell_x + ring + 1):
+            out.extend(cells.get((cx, cell_y - ring), ()))
+            out.extend(cells.get((cx, cell_y + ring), ()))
+        for cy in range(cell_y - ring + 1, cell_y + ring):
+            out.extend(cells.get((cell_x - ring, cy), ()))
+            out.extend(cells.get((cell_x + ring, cy), ()))
+
+    def _search(self, x, y, k, max_distance):
+        """
+        Wyszukuje indeksy k najbliższych przeciwników posortowane rosnąco po odległości.
+
+        :return: Krotka (indeksy, odległości) – tablice numpy
+        """
+        if not self.items or k <= 0:
+            return np.empty(0, dtype=int), np.empty(0)
+        cs = self.cell_size
+        cell_x, cell_y = int(x // cs), int(y // cs)
+        min_x, max_x, min_y, max_y = self.bounds
+        last_ring = max(cell_x - min_x, max_x - cell_x, cell_y - min_y, max_y - cell_y, 0)
+        if max_distance is not None:
+            last_ring = min(last_ring, int(max_distance // cs) + 1)
+
+        candidates = []
+        distances = None
+        kth_distance = None
+        for ring in range(last_ring + 1):
+            before = len(candidates)
+            self._ring(cell_x, cell_y, ring, candidates)
+            if len(candidates) < k:
+                continue
+            # Odległości liczone tylko po dojściu nowych kandydatów – pusty pierścień jedynie
+            # przesuwa granicę, więc warunek końca sprawdzany jest w każdym pierścieniu
+            if len(candidates) != before:
+                indices = np.asarray(candidates)
+                distances = np.hypot(self.xs[indices] - x, self.ys[indices] - y)
+                kth_distance = np.partition(distances, k - 1)[k - 1]
+            # Każdy przeciwnik z dalszego pierścienia leży co najmniej ring * cs od punktu
+            if kth_distance <= ring * cs:
+                break
+
+        if not candidates:
+            return np.empty(0, dtype=int), np.empty(0)
+        indices = np.asarray(candidates)
+        if distances is None or len(distances) != len(indices):
+            distances = np.hypot(self.xs[indices] - x, self.ys[indices] - y)
+        if max_distance is not None:
+            within = distances <= max_distance
+            indices, distances = indices[within], distances[within]
+        order = np.argsort(distances, kind="stable")[:k]
+        return indices[order], distances[order]
+
+    def nearest(self, x, y, max_distance=None):
+        """
+        Zwraca przeciwnika, którego środek leży najbliżej punktu.
+
+        :param x: Współrzędna x punktu (w pikselach)
+        :param y: Współrzędna y punktu (w pikselach)
+        :param max_distance: Opcjonalny maksymalny zasięg wyszukiwania (w pikselach)
+        :return: Przeciwnik lub None, jeśli nikogo nie ma w zasięgu
+        """
+        indices, _ = self._search(x, y, 1, max_distance)
+        return self.items[indices[0]] if len(indices) else None
+
+    def k_nearest(self, x, y, k, max_distance=None):
+        """
+        Zwraca k przeciwników najbliższych punktowi, od najbliższego.
+
+        :param x: Współrzędna x punktu (w pikselach)
+        :param y: Współrzędna y punktu (w pikselach)
+        :param k: Liczba szukanych przeciwników
+        :param max_distance: Opcjonalny maksymalny zasięg wyszukiwania (w pikselach)
+        :return: Lista przeciwników (może być krótsza niż k)
+        """
+        indices, _ = self._search(x, y, k, max_distance)
+        return [self.items[i] for i in indices]
@@ -1,5 +1,6 @@
 import pygame
-from weapon import Weapon
+from weapon import Weapon, WEAPON_PREFABS
+from asset_cache import AssetCache
 
 class Player:
     """
@@ -26,42 +27,24 @@ class Player:
         self.health = 3000
         self.max_health = self.health
 
-        # Wczytanie i skalowanie grafiki gracza
-        self.image = pygame.image.load("assets/images/MainCharacter_Echo.png")
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        # Grafika gracza – współdzielone warianty zwrócone w prawo i w lewo
+        self.image_right, self.image_left = AssetCache.get_facing(
+            "assets/images/MainCharacter_Echo.png", (self.width, self.height)
+        )
+        self.image = self.image_right
 
         # Kierunek, w którym patrzy gracz – przydatne przy obracaniu sprite'a
         self.facing_right = True
         self.facing_direction = "up"
 
         # Inicjalizacja broni podstawowej
-        self.current_weapon = Weapon(
-            name="Podstawowa Broń",
-            damage=15,
-            projectile_speed=10,
-            cooldown=20,
-            projectile_image="assets/images/Projectile_Default.png"
-        )
+        self.current_weapon = Weapon(**WEAPON_PREFABS["default"])
 
         # Inicjalizacja broni dodatkowych
-        self.secondary_weapon_1 = Weapon(
-            name="Orbitalny Satelita",
-            damage=10,
-            projectile_speed=0,  # W trybie "satellite" prędkość nie ma znaczenia
-            cooldown=0,
-            projectile_image="assets/images/satellite.png",
-            mode="satellite"
-        )
+        self.secondary_weapon_1 = Weapon(**WEAPON_PREFABS["satellite"])
         self.secondary_weapon_1.level = 0  # Początkowo nieaktywna
 
-        self.secondary_weapon_2 = Weapon(
-            name="Obszarowy Wybuch",
-            damage=50,  # Obrażenia wybuchu
-            projectile_speed=0,  # W trybie wybuchu prędkość nie jest wykorzystywana
-            cooldown=15,
-            projectile_image="assets/images/explosion.png",
-            mode="explosion"
-        )
+        self.secondary_weapon_2 = Weapon(**WEAPON_PREFABS["explosion"])
         self.secondary_weapon_2.level = 0  # Początkowo nieaktywna
 
     def get_collision_rect(self):
@@ -76,14 +59,14 @@ class Player:
             self.COLLISION_HEIGHT
         )
 
-    def move(self, keys, map_width, map_height, wall_rects):
+    def move(self, keys, map_width, map_height, collision_world):
         """
         Aktualizuje pozycję gracza na podstawie wciśniętych klawiszy oraz sprawdza kolizje
         z granicami mapy i przeszkodami (ścianami).
         :param keys: Słownik klawiszy (pygame.key.get_pressed())
         :param map_width: Szerokość mapy (w liczbie kafelków)
         :param map_height: Wysokość mapy (w liczbie kafelków)
-        :param wall_rects: Lista prostokątów reprezentujących ściany
+        :param collision_world: Siatka kolizji terenu (CollisionWorld)
         """
         old_x, old_y = self.x, self.y
 
@@ -99,14 +82,14 @@ class Player:
             self.facing_direction = "left"
             # Jeśli gracz dotychczas patrzył w prawo, odbij sprite'a
             if self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
+                self.image = self.image_left
                 self.facing_right = False
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
             self.x += self.speed
             self.facing_direction = "right"
             # Jeśli gracz dotychczas patrzył w lewo, odbij sprite'a
             if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
+                self.image = self.image_right
                 self.facing_right = True
 
         # Ograniczenie ruchu gracza do granic mapy
@@ -125,11 +108,9 @@ class Player:
 
         # Sprawdzenie kolizji ze ścianami
         collision_rect = self.get_collision_rect()
-        for wall_rect in wall_rects:
-            if collision_rect.colliderect(wall_rect):
-                # Jeśli wystąpi kolizja, przywracamy poprzednią pozycję
-                self.x, self.y = old_x, old_y
-                break
+        if collision_world.collides(collision_rect):
+            # Jeśli wystąpi kolizja, przywracamy poprzednią pozycję
+            self.x, self.y = old_x, old_y
 
     def take_damage(self, damage):
         """
@@ -140,16 +121,28 @@ class Player:
         if self.health < 0:
             self.health = 0
 
-    def shoot(self):
+    def shoot(self, nearest_index=None):
         """
         Strzela przy użyciu broni podstawowej.
-        Aktualizuje cooldown oraz ustala kierunek pocisku na podstawie
-        aktualnego kierunku gracza.
+        Ustala kierunek pocisku – na najbliższego przeciwnika
+        (broń z auto_aim) lub na podstawie aktualnego kierunku gracza.
+
+        :param nearest_index: Opcjonalny NearestEnemyIndex – wymagany do automatycznego celowania
         """
-        self.current_weapon.update_cooldown()
+        # Punkt startu pocisku – środek gracza
+        start_x = self.x + self.width // 2 - 8
+        start_y = self.y + self.height // 2 - 8
+
+        # Automatyczne celowanie – tylko gdy broń może wystrzelić
+        aimed = None
+        if (self.current_weapon.auto_aim and nearest_index is not None
+                and self.current_weapon.shot_ready):
+            aimed = self.current_weapon.aim_at_nearest(start_x, start_y, nearest_index)
 
         # Ustal kierunek pocisku
-        if self.facing_direction == "left":
+        if aimed is not None:
+            vx, vy = aimed
+        elif self.facing_direction == "left":
             vx, vy = -self.current_weapon.projectile_speed, 0
         elif self.facing_direction == "right":
             vx, vy = self.current_weapon.projectile_speed, 0
@@ -158,10 +151,6 @@ class Player:
         else:  # Domyślnie "up"
             vx, vy = 0, -self.current_weapon.projectile_speed
 
-        # Punkt startu pocisku – środek gracza
-        start_x = self.x + self.width // 2 - 8
-        start_y = self.y + self.height // 2 - 8
-
         self.current_weapon.shoot(start_x, start_y, velocity_x=vx, velocity_y=vy)
 
     def draw_health_bar(self, screen, screen_x, screen_y):
@@ -197,26 +186,28 @@ class Player:
         # Aby dodać rysowanie broni dodatkowej 2, wystarczy analogicznie wywołać:
         # self.secondary_weapon_2.draw(screen, self, camera_x, camera_y)
 
-    def update(self, keys, screen_width, screen_height, wall_rects, screen, level_system, delta_time, map_width, map_height):
+    def update(self, keys, screen_width, screen_height, collision_world, screen, level_system, delta_time, map_width, map_height,
+               nearest_index=None):
         """
         Główna metoda aktualizująca gracza.
         Wykonuje ruch, strzelanie oraz aktualizację pocisków.
         :param keys: Stan klawiszy (pygame.key.get_pressed())
         :param screen_width: Szerokość ekranu
         :param screen_height: Wysokość ekranu
-        :param wall_rects: Lista prostokątów kolizji ścian
+        :param collision_world: Siatka kolizji terenu (CollisionWorld)
         :param screen: Powierzchnia do rysowania
         :param level_system: Obiekt systemu poziomów (do ulepszania itp.)
         :param delta_time: Czas między klatkami
         :param map_width: Szerokość mapy (w liczbie kafelków)
         :param map_height: Wysokość mapy (w liczbie kafelków)
+        :param nearest_index: Opcjonalny NearestEnemyIndex – celowanie i naprowadzanie pocisków
         """
-        self.move(keys, map_width, map_height, wall_rects)
-        self.shoot()
+        self.move(keys, map_width, map_height, collision_world)
+        self.shoot(nearest_index)
 
         # Aktualizacja pocisków broni podstawowej – przeliczamy rozmiary mapy na piksele
-        self.current_weapon.update_projectiles(map_width * 64, map_height * 64)
+        self.current_weapon.update_projectiles(map_width * 64, map_height * 64, collision_world, nearest_index)
 
         # Aktualizacja broni dodatkowych – jeśli chcesz, możesz odkomentować poniższe linie:
-        # self.secondary_weapon_1.update(self, [], screen, level_system, delta_time)
-        # self.secondary_weapon_2.update(self, [], screen, level_system, delta_time)
+        # self.secondary_weapon_1.update(self, [], screen, delta_time)
+        # self.secondary_weapon_2.update(self, [], screen, delta_time)
@@ -1,59 +1,141 @@
-import pygame
+import math
+import numpy as np
+from asset_cache import AssetCache
+from column_store import make_columns, grow_columns, compact_columns
 
-class EnemyProjectile:
+# Kolumny bufora pocisków: nazwa -> typ numpy
+FIELDS = {
+    "x": np.float64,
+    "y": np.float64,
+    "vx": np.float64,
+    "vy": np.float64,
+    "damage": np.int32,
+    "lifetime": np.int32,
+    "bucket": np.int32,
+}
+
+
+class EnemyProjectiles:
     """
-    Klasa reprezentująca pocisk wroga.
-    Pocisk porusza się w ustalonym kierunku (z określoną prędkością) i zadaje obrażenia graczowi,
-    jeśli dojdzie do kolizji.
+    Klasa EnemyProjectiles – wspólny bufor pocisków wszystkich wrogów w tablicach numpy,
+    aktualizowany jednym przejściem; pociski lecą dalej także po śmierci strzelającego.
     """
-    def __init__(self, x, y, vx, vy, damage=10):
+    SIZE = 16                  # Rozmiar prostokąta kolizji pocisku (w pikselach)
+    DEFAULT_DAMAGE = 10
+    DEFAULT_LIFETIME = 600     # Maksymalny czas lotu (w klatkach)
+    IMAGE_PATH = "assets/images/Ranged_Projectile.png"
+
+    count = 0
+    capacity = 0
+    columns = make_columns(FIELDS, 0)
+
+    @staticmethod
+    def reset(capacity=512):
+        """
+        Usuwa wszystkie pociski i przydziela puste tablice.
+
+        :param capacity: Początkowa pojemność (tablice rosną dwukrotnie w razie potrzeby)
         """
-        Inicjalizuje pocisk wroga.
-        
+        EnemyProjectiles.count = 0
+        EnemyProjectiles.capacity = capacity
+        EnemyProjectiles.columns = make_columns(FIELDS, capacity)
+
+    @staticmethod
+    def emit(x, y, vx, vy, damage=DEFAULT_DAMAGE, lifetime=DEFAULT_LIFETIME):
+        """
+        Dodaje pocisk do bufora.
+
         :param x: Początkowa pozycja x pocisku (w pikselach)
         :param y: Początkowa pozycja y pocisku (w pikselach)
         :param vx: Składowa prędkości pocisku w osi X
         :param vy: Składowa prędkości pocisku w osi Y
-        :param damage: Ilość obrażeń, jakie pocisk zadaje przy trafieniu (domyślnie 10)
-        """
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.damage = damage
-        
-        # Ustalony rozmiar pocisku – tutaj 16x16 pikseli
-        self.size = 16
-        
-        # Kolor pocisku – ustawiony na czerwony (można zmienić lub zastąpić grafiką)
-        self.color = (255, 50, 50)
-        
-        # Wczytanie grafiki pocisku z podanej ścieżki
-        self.image = pygame.image.load("assets/images/Ranged_Projectile.png")
-        
-        # Inicjalizacja prostokąta kolizji na podstawie początkowej pozycji i rozmiaru
-        self.rect = pygame.Rect(x, y, self.size, self.size)
-
-    def update(self):
-        """
-        Aktualizuje pozycję pocisku na podstawie prędkości.
-        Pozycja pocisku jest aktualizowana, a następnie prostokąt kolizji (self.rect)
-        jest synchronizowany z nową pozycją.
-        """
-        self.x += self.vx
-        self.y += self.vy
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
-
-    def draw(self, screen, camera_x, camera_y):
-        """
-        Rysuje pocisk na ekranie.
-        
+        :param damage: Ilość obrażeń, jakie pocisk zadaje przy trafieniu
+        :param lifetime: Czas życia pocisku (w klatkach)
+        """
+        if EnemyProjectiles.count == EnemyProjectiles.capacity:
+            EnemyProjectiles.capacity = grow_columns(EnemyProjectiles.columns, EnemyProjectiles.count,
+                                                     EnemyProjectiles.count + 1)
+        # Kubełek obrotu grafiki zgodny z kierunkiem lotu (RotatedSpriteCache.get_for_velocity)
+        rotations = AssetCache.get_rotations(EnemyProjectiles.IMAGE_PATH)
+        bucket = rotations.bucket(math.degrees(math.atan2(-vy, vx)) - 90)
+
+        i = EnemyProjectiles.count
+        c = EnemyProjectiles.columns
+        c["x"][i] = x
+        c["y"][i] = y
+        c["vx"][i] = vx
+        c["vy"][i] = vy
+        c["damage"][i] = damage
+        c["lifetime"][i] = lifetime
+        c["bucket"][i] = bucket
+        EnemyProjectiles.count = i + 1
+
+    @staticmethod
+    def update(player, map_w_px, map_h_px, collision_world=None):
+        """
+        Przesuwa wszystkie pociski i usuwa te, które trafiły gracza, wyleciały poza mapę,
+        rozbiły się o ścianę lub przekroczyły czas życia. Wywoływana raz na klatkę.
+
+        :param player: Obiekt gracza (do wykrywania trafień)
+        :param map_w_px: Szerokość mapy w pikselach
+        :param map_h_px: Wysokość mapy w pikselach
+        :param collision_world: Siatka kolizji terenu (opcjonalnie)
+        """
+        n = EnemyProjectiles.count
+        if not n:
+            return
+        c = EnemyProjectiles.columns
+        x = c["x"][:n]
+        y = c["y"][:n]
+        x += c["vx"][:n]
+        y += c["vy"][:n]
+        c["lifetime"][:n] -= 1
+
+        # Prostokąt kolizji pocisku – jak pygame.Rect(int(x), int(y), SIZE, SIZE)
+        size = EnemyProjectiles.SIZE
+        left = x.astype(np.int64)
+        top = y.astype(np.int64)
+        player_x, player_y = int(player.x), int(player.y)
+        hit = ((left < player_x + player.width) & (left + size > player_x) &
+               (top < player_y + player.height) & (top + size > player_y))
+        for damage in c["damage"][:n][hit].tolist():
+            player.take_damage(damage)
+
+        remove = hit | (x < 0) | (x > map_w_px) | (y < 0) | (y > map_h_px) | (c["lifetime"][:n] <= 0)
+        if collision_world is not None:
+            # Trafienie w ścianę – środek pocisku wewnątrz ściany
+            ones = np.ones(n, dtype=np.int64)
+            remove |= collision_world.rects_blocked(left + size // 2, top + size // 2, ones, ones)
+        if remove.any():
+            EnemyProjectiles.count = compact_columns(c, n, ~remove)
+
+    @staticmethod
+    def draw(screen, camera_x, camera_y):
+        """
+        Rysuje pociski leżące na ekranie (jednym wywołaniem Surface.blits).
+
         :param screen: Powierzchnia, na której rysujemy (pygame.Surface)
         :param camera_x: Przesunięcie kamery w osi X (w pikselach)
         :param camera_y: Przesunięcie kamery w osi Y (w pikselach)
         """
-        # Obliczamy pozycję pocisku na ekranie uwzględniając przesunięcie kamery
-        draw_x = self.x - camera_x
-        draw_y = self.y - camera_y
-        screen.blit(self.image, (draw_x, draw_y))
+        n = EnemyProjectiles.count
+        if not n:
+            return
+        c = EnemyProjectiles.columns
+        draw_x = c["x"][:n] - camera_x
+        draw_y = c["y"][:n] - camera_y
+        margin = 2 * EnemyProjectiles.SIZE
+        visible = np.flatnonzero((draw_x > -margin) & (draw_x < screen.get_width()) &
+                                 (draw_y > -margin) & (draw_y < screen.get_height()))
+        if not len(visible):
+            return
+
+        rotations = AssetCache.get_rotations(EnemyProjectiles.IMAGE_PATH)
+        base_w = rotations.image.get_width()
+        base_h = rotations.image.get_height()
+        blits = []
+        for bucket, sx, sy in zip(c["bucket"][visible].tolist(), draw_x[visible].tolist(), draw_y[visible].tolist()):
+            image = rotations.get(bucket * rotations.angle_step)
+            # Obrót powiększa powierzchnię – przesunięcie utrzymuje środek grafiki w tym samym miejscu
+            blits.append((image, (sx + (base_w - image.get_width()) / 2, sy + (base_h - image.get_height()) / 2)))
+        screen.blits(blits, doreturn=False)
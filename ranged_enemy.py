@@ -2,7 +2,8 @@ import pygame
 import math
 import random
 from enemy import Enemy
-from projectile_enemy import EnemyProjectile
+from enemy_store import TYPE_RANGED
+from projectile_enemy import EnemyProjectiles
 
 class RangedEnemy(Enemy):
     """
@@ -13,7 +14,7 @@ class RangedEnemy(Enemy):
     Dziedziczy po klasie Enemy, więc korzysta z jej metod takich jak move_towards_player oraz
     zarządzania kolizjami.
     """
-    def __init__(self, x, y, speed, health, attack_cooldown=120, xp_value=3, wall_rects=None):
+    def __init__(self, x, y, speed, health, attack_cooldown=120, xp_value=3, collision_world=None):
         """
         Inicjalizacja przeciwnika dystansowego.
         
@@ -23,61 +24,61 @@ class RangedEnemy(Enemy):
         :param health: Punkty życia przeciwnika
         :param attack_cooldown: Liczba klatek między atakami
         :param xp_value: Wartość XP przy pokonaniu przeciwnika
-        :param wall_rects: Opcjonalna lista prostokątów kolizji (np. ścian)
+        :param collision_world: Opcjonalna siatka kolizji terenu (CollisionWorld)
         """
         # Wywołanie konstruktora klasy bazowej Enemy
-        super().__init__(x, y, speed, health, xp_value, wall_rects)
+        super().__init__(x, y, speed, health, xp_value, collision_world)
+        self.type_id = TYPE_RANGED
 
-        # Nadpisanie grafiki – wczytujemy obraz przeciwnika dystansowego
-        self.image = pygame.image.load("assets/images/Enemy_Dystansowy.png")
         # Ustawienie nowych wymiarów (dostosowane do charakterystyki przeciwnika dystansowego)
         self.width = 40
         self.height = 64
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        # Nadpisanie grafiki – obraz przeciwnika dystansowego w docelowym rozmiarze
+        self.set_facing_images("assets/images/Enemy_Dystansowy.png")
 
         # Ustawienia ataku dystansowego:
         self.attack_cooldown = attack_cooldown   # Ilość klatek między atakami
-        self.last_attack_time = 0                # Licznik od ostatniego ataku
-        self.projectiles = []                    # Lista pocisków wystrzelonych przez przeciwnika
+        self.attack_ready = True                 # Gotowość ataku – koniec cooldownu planuje Scheduler
 
-    def update(self, player, screen_width, screen_height, wall_rects=None, map_width=0, map_height=0):
+    def update(self, player, screen_width, screen_height, collision_world=None, map_width=0, map_height=0,
+               flow_field=None, time_scale=1):
         """
         Aktualizuje przeciwnika dystansowego – wykonuje ruch w kierunku gracza oraz obsługuje atak.
         
         :param player: Obiekt gracza
         :param screen_width: Szerokość ekranu (w pikselach)
         :param screen_height: Wysokość ekranu (w pikselach)
-        :param wall_rects: Lista prostokątów kolizji (opcjonalnie)
+        :param collision_world: Siatka kolizji terenu – CollisionWorld (opcjonalnie)
         :param map_width: Szerokość mapy (w liczbie kafelków)
         :param map_height: Wysokość mapy (w liczbie kafelków)
+        :param flow_field: Opcjonalne pole przepływu (FlowField) prowadzące do gracza
+        :param time_scale: Liczba klatek, które obejmuje ten krok (SimulationLOD dla dalekich przeciwników)
         """
         # Poruszanie się przeciwnika w kierunku gracza
-        self.move_towards_player(player.x, player.y, wall_rects)
+        self.move_towards_player(player.x, player.y, collision_world, flow_field, time_scale)
         # Obsługa ataku (wystrzeliwanie pocisków)
-        self.handle_attack(player, screen_width, screen_height, map_width, map_height)
+        self.handle_attack(player, screen_width, screen_height, map_width, map_height, collision_world)
 
-    def handle_attack(self, player, screen_width, screen_height, map_width, map_height):
+    def handle_attack(self, player, screen_width, screen_height, map_width, map_height, collision_world=None):
         """
         Metoda obsługująca atak dystansowy:
-          - Jeśli licznik cooldownu osiągnął 0, przeciwnik wystrzeliwuje pocisk.
-          - Po wystrzeleniu resetuje licznik.
-          - Aktualizuje pozycje pocisków i sprawdza ich kolizje.
+          - Jeśli atak jest gotowy, a gracz widoczny, przeciwnik wystrzeliwuje pocisk.
+          - Po wystrzeleniu rozpoczyna cooldown (zaplanowany w Scheduler).
+        Lot pocisków i ich kolizje obsługuje wspólny bufor EnemyProjectiles.
         
         :param player: Obiekt gracza (do określenia kierunku strzału i wykrywania kolizji)
         :param screen_width: Szerokość ekranu
         :param screen_height: Wysokość ekranu
         :param map_width: Szerokość mapy (w liczbie kafelków)
         :param map_height: Wysokość mapy (w liczbie kafelków)
+        :param collision_world: Siatka kolizji terenu – ściany zasłaniają gracza (opcjonalnie)
         """
-        # Sprawdzenie, czy cooldown minął
-        if self.last_attack_time <= 0:
+        # Strzał tylko, gdy cooldown minął i gracz jest widoczny –
+        # w przeciwnym razie atak czeka gotowy na odsłonięcie gracza
+        if self.attack_ready and self.can_see(player.x + player.width / 2, player.y + player.height / 2,
+                                              collision_world):
             self.shoot_towards_player(player.x, player.y)
-            self.last_attack_time = self.attack_cooldown
-        else:
-            self.last_attack_time -= 1
-
-        # Aktualizacja pozycji pocisków przeciwnika oraz usuwanie tych, które trafiają gracza
-        self.update_projectiles(player, screen_width, screen_height, map_width, map_height)
+            self.start_attack_cooldown()
 
     def shoot_towards_player(self, player_x, player_y):
         """
@@ -101,51 +102,5 @@ class RangedEnemy(Enemy):
         start_x = self.x + self.width // 2
         start_y = self.y + self.height // 2
 
-        projectile = EnemyProjectile(start_x, start_y, vx, vy)
-        self.projectiles.append(projectile)
-
-    def update_projectiles(self, player, screen_width, screen_height, map_width, map_height):
-        """
-        Aktualizuje pozycje pocisków:
-          - Każdy pocisk jest przesuwany zgodnie z własną prędkością.
-          - Jeżeli pocisk trafia w gracza, gracz otrzymuje obrażenia, a pocisk jest usuwany.
-          - Pociski wychodzące poza granice mapy są usuwane.
-        
-        :param player: Obiekt gracza (do wykrywania kolizji)
-        :param screen_width: Szerokość ekranu (w pikselach)
-        :param screen_height: Wysokość ekranu (w pikselach)
-        :param map_width: Szerokość mapy (w liczbie kafelków)
-        :param map_height: Wysokość mapy (w liczbie kafelków)
-        """
-        # Przeliczanie wymiarów mapy na piksele
-        map_w_px = map_width * 64
-        map_h_px = map_height * 64
-        for p in self.projectiles[:]:
-            p.update()
-            # Sprawdzenie kolizji z graczem – jeżeli pocisk trafi gracza, usuwamy go i zadajemy obrażenia
-            player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
-            if p.rect.colliderect(player_rect):
-                player.take_damage(p.damage)
-                self.projectiles.remove(p)
-                continue
-
-            # Usuwamy pocisk, gdy wyjdzie poza granice mapy
-            if (p.x < 0 or p.x > map_w_px or p.y < 0 or p.y > map_h_px):
-                self.projectiles.remove(p)
-
-    def draw(self, screen, camera_x, camera_y):
-        """
-        Rysuje przeciwnika oraz jego pociski na ekranie, uwzględniając przesunięcie kamery.
-        
-        :param screen: Powierzchnia do rysowania
-        :param camera_x: Przesunięcie kamery w osi X (w pikselach)
-        :param camera_y: Przesunięcie kamery w osi Y (w pikselach)
-        """
-        # Rysujemy przeciwnika – przesuwając jego pozycję o przesunięcia kamery
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        screen.blit(self.image, (screen_x, screen_y))
-
-        # Rysujemy wszystkie pociski przeciwnika
-        for p in self.projectiles:
-            p.draw(screen, camera_x, camera_y)
+        # Pocisk trafia do wspólnego bufora – leci dalej także po śmierci przeciwnika
+        EnemyProjectiles.emit(start_x, start_y, vx, vy)
@@ -0,0 +1,69 @@
+import math
+import pygame
+
+# Domyślna rozdzielczość kątowa wariantów obróconych sprite'ów (w stopniach)
+DEFAULT_ANGLE_STEP = 5
+
+
+class RotatedSpriteCache:
+    """
+    Zbiór obróconych wariantów jednego sprite'a, skwantowanych do zadanej rozdzielczości kątowej.
+
+    Zamiast wywoływać pygame.transform.rotate dla każdego pocisku, pocisk pobiera gotowy wariant
+    z odpowiedniego "kubełka" kąta. Warianty tworzone są leniwie przy pierwszym użyciu, więc pamięć
+    jest ograniczona liczbą kubełków (360 / angle_step).
+    """
+    def __init__(self, image, angle_step=DEFAULT_ANGLE_STEP, rotate=None):
+        """
+        :param image: Sprite bazowy (kąt 0°)
+        :param angle_step: Rozdzielczość kątowa w stopniach (np. 5 -> 72 warianty)
+        :param rotate: Opcjonalna funkcja kąt -> pygame.Surface tworząca wariant
+                       (domyślnie pygame.transform.rotate na obrazie bazowym)
+        """
+        self.image = image
+        self.bucket_count = max(1, int(round(360 / angle_step)))
+        self.angle_step = 360 / self.bucket_count
+        self.rotate = rotate or (lambda angle: pygame.transform.rotate(image, angle))
+        self.variants = [None] * self.bucket_count
+
+    def bucket(self, angle):
+        """
+        Zwraca indeks kubełka dla podanego kąta.
+
+        :param angle: Kąt w stopniach (dowolny, także ujemny)
+        :return: Indeks z zakresu 0..bucket_count-1
+        """
+        return int(round(angle / self.angle_step)) % self.bucket_count
+
+    def get(self, angle):
+        """
+        Zwraca sprite obrócony o kąt najbliższy podanemu (w konwencji pygame.transform.rotate –
+        dodatni kąt oznacza obrót przeciwnie do ruchu wskazówek zegara).
+
+        :param angle: Kąt w stopniach
+        :return: pygame.Surface (współdzielony – nie wolno po nim rysować)
+        """
+        index = self.bucket(angle)
+        variant = self.variants[index]
+        if variant is None:
+            variant = self.rotate(index * self.angle_step)
+            self.variants[index] = variant
+        return variant
+
+    def get_for_velocity(self, velocity_x, velocity_y):
+        """
+        Zwraca sprite obrócony zgodnie z kierunkiem lotu. Zakłada, że obraz bazowy
+        jest skierowany "w górę" ekranu.
+
+        :param velocity_x: Składowa prędkości w osi X
+        :param velocity_y: Składowa prędkości w osi Y
+        :return: pygame.Surface
+        """
+        return self.get(math.degrees(math.atan2(-velocity_y, velocity_x)) - 90)
+
+    def prewarm(self):
+        """
+        Tworzy z góry wszystkie warianty (np. podczas ładowania, aby uniknąć przycięć w trakcie gry).
+        """
+        for index in range(self.bucket_count):
+            self.get(index * self.angle_step)
@@ -0,0 +1,118 @@
+# Parametry koła czasowego
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS     # Kubełki na poziom
+LEVELS = 3                 # Zasięg kół: 256^3 klatek (ok. 77 godzin przy 60 FPS)
+
+
+class Timer:
+    """
+    Pojedynczy zaplanowany wpis harmonogramu – wywołanie funkcji w określonej klatce.
+    """
+    def __init__(self, expires, callback):
+        """
+        :param expires: Numer klatki (Scheduler.now), w której timer się odpala
+        :param callback: Funkcja bez argumentów wywoływana po upływie czasu
+        """
+        self.expires = expires
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Anuluje timer – wpis zostanie pominięty, gdy nadejdzie jego klatka.
+        """
+        self.cancelled = True
+
+
+class Scheduler:
+    """
+    Klasa Scheduler – hierarchiczne koło czasowe (timer wheel) dla cooldownów;
+    tick() obsługuje wyłącznie timery kończące się w bieżącej klatce.
+    """
+    now = 0                    # Bieżąca klatka harmonogramu
+    pending = 0                # Liczba oczekujących timerów (łącznie z anulowanymi)
+    fired_last_tick = 0        # Liczba timerów odpalonych w ostatnim tick()
+    _wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+    _overflow = []             # Terminy dalsze niż zasięg kół
+
+    @staticmethod
+    def reset():
+        """
+        Usuwa wszystkie timery i zeruje czas harmonogramu (np. przy starcie nowej gry).
+        """
+        Scheduler.now = 0
+        Scheduler.pending = 0
+        Scheduler.fired_last_tick = 0
+        Scheduler._wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        Scheduler._overflow = []
+
+    @staticmethod
+    def schedule(delay, callback):
+        """
+        Planuje wywołanie funkcji po upływie podanej liczby klatek.
+
+        :param delay: Opóźnienie w klatkach (co najmniej 1)
+        :param callback: Funkcja bez argumentów
+        :return: Timer – można go anulować metodą cancel()
+        """
+        timer = Timer(Scheduler.now + max(1, int(delay)), callback)
+        Scheduler._insert(timer)
+        Scheduler.pending += 1
+        return timer
+
+    @staticmethod
+    def _insert(timer):
+        """
+        Umieszcza timer w kubełku odpowiedniego poziomu koła.
+        """
+        delta = timer.expires - Scheduler.now
+        for level in range(LEVELS):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                slot = (timer.expires >> (SLOT_BITS * level)) & (SLOTS - 1)
+                Scheduler._wheels[level][slot].append(timer)
+                return
+        Scheduler._overflow.append(timer)
+
+    @staticmethod
+    def _cascade(level):
+        """
+        Przenosi timery z bieżącego kubełka poziomu level do niższych poziomów.
+        """
+        slot = (Scheduler.now >> (SLOT_BITS * level)) & (SLOTS - 1)
+        timers = Scheduler._wheels[level][slot]
+        Scheduler._wheels[level][slot] = []
+        for timer in timers:
+            Scheduler._insert(timer)
+
+    @staticmethod
+    def tick():
+        """
+        Przesuwa harmonogram o jedną klatkę i wywołuje timery, których termin właśnie minął.
+        Wywoływana raz na klatkę, tylko gdy gra nie jest wstrzymana.
+        """
+        Scheduler.now += 1
+        now = Scheduler.now
+        mask = SLOTS - 1
+
+        # Początek nowego przedziału – kaskada z wyższych poziomów (od najwyższego)
+        if now & mask == 0:
+            top = 1
+            while top < LEVELS and (now >> (SLOT_BITS * top)) & mask == 0:
+                top += 1
+            if top == LEVELS:
+                overflow = Scheduler._overflow
+                Scheduler._overflow = []
+                for timer in overflow:
+                    Scheduler._insert(timer)
+            for level in range(min(top, LEVELS - 1), 0, -1):
+                Scheduler._cascade(level)
+
+        bucket = Scheduler._wheels[0][now & mask]
+        Scheduler._wheels[0][now & mask] = []
+        Scheduler.pending -= len(bucket)
+        fired = 0
+        for timer in bucket:
+            if not timer.cancelled:
+                timer.callback()
+                fired += 1
+        Scheduler.fired_last_tick = fired
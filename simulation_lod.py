@@ -0,0 +1,84 @@
+import numpy as np
+from enemy_store import EnemyStore, TYPE_BASIC, TYPE_RANGED
+
+# Progi LOD: (minimalna odległość od krawędzi ekranu w pikselach, co ile klatek aktualizować)
+DEFAULT_TIERS = [
+    (0, 1),      # Na ekranie i tuż przy nim – pełna symulacja w każdej klatce
+    (256, 2),    # Poza ekranem – co 2 klatki z podwójnym krokiem czasu
+    (1024, 4),   # Daleko od ekranu – co 4 klatki z poczwórnym krokiem czasu
+]
+
+
+class SimulationLOD:
+    """
+    Poziomy szczegółowości symulacji (LOD) przeciwników zależne od odległości od widocznego obszaru.
+
+    Przeciwnik z poziomu o interwale n jest aktualizowany co n klatek z n-krotnie większym krokiem
+    czasu (lod_time_scale), więc średnio porusza się tak samo szybko. Aktualizacje są rozłożone
+    między klatki według stałego numeru przeciwnika (lod_slot), dzięki czemu obciążenie każdej klatki
+    pozostaje równe. Przeciwnicy w pobliżu ekranu są zawsze aktualizowani co klatkę.
+    """
+    def __init__(self, screen_width, screen_height, tiers=DEFAULT_TIERS):
+        """
+        :param screen_width: Szerokość ekranu (w pikselach)
+        :param screen_height: Wysokość ekranu (w pikselach)
+        :param tiers: Lista krotek (próg odległości, interwał) posortowana rosnąco po progu
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.thresholds = np.array([threshold for threshold, _ in tiers], dtype=float)
+        self.intervals = np.array([interval for _, interval in tiers], dtype=int)
+        self.frame = 0
+        # Statystyki do strojenia: liczba przeciwników na poziomie i liczba aktualizacji w bieżącej klatce
+        self.tier_counts = [0] * len(tiers)
+        self.updated_counts = [0] * len(tiers)
+
+    def update(self, camera_x, camera_y, types=(TYPE_BASIC, TYPE_RANGED)):
+        """
+        Przydziela przeciwnikom poziomy LOD i ustala, którzy z nich są aktualizowani w tej klatce.
+        Wynik zapisywany jest w kolumnach EnemyStore: lod_tier oraz lod_time_scale
+        (0 – pomiń w tej klatce, n – aktualizuj z n-krotnym krokiem czasu).
+
+        :param camera_x: Pozycja kamery w osi X (w pikselach)
+        :param camera_y: Pozycja kamery w osi Y (w pikselach)
+        :param types: Typy przeciwników objętych LOD (pozostali zachowują swój lod_time_scale)
+        """
+        self.frame += 1
+        self.tier_counts = [0] * len(self.intervals)
+        self.updated_counts = [0] * len(self.intervals)
+        rows = np.flatnonzero(np.isin(EnemyStore.column("type_id"), types))
+        if not len(rows):
+            return
+
+        columns = EnemyStore.columns
+        centers_x = columns["x"][rows] + columns["width"][rows] / 2
+        centers_y = columns["y"][rows] + columns["height"][rows] / 2
+        slots = columns["lod_slot"][rows]
+
+        # Odległość od prostokąta ekranu (0 dla przeciwników na ekranie)
+        outside_x = np.maximum(np.maximum(camera_x - centers_x, centers_x - (camera_x + self.screen_width)), 0)
+        outside_y = np.maximum(np.maximum(camera_y - centers_y, centers_y - (camera_y + self.screen_height)), 0)
+        distance = np.maximum(outside_x, outside_y)
+
+        tiers = np.searchsorted(self.thresholds, distance, side="right") - 1
+        intervals = self.intervals[tiers]
+        # Rozłożenie aktualizacji między klatki – każdy przeciwnik ma swoją "fazę" w interwale
+        due = (self.frame + slots) % intervals == 0
+        time_scales = np.where(due, intervals, 0)
+
+        self.tier_counts = np.bincount(tiers, minlength=len(self.intervals)).tolist()
+        self.updated_counts = np.bincount(tiers[due], minlength=len(self.intervals)).tolist()
+        columns["lod_tier"][rows] = tiers
+        columns["lod_time_scale"][rows] = time_scales
+
+    def stats(self):
+        """
+        Zwraca statystyki LOD do strojenia progów.
+
+        :return: Słownik z kluczami "tier_counts" (przeciwnicy na poziomach) i "updated_counts"
+                 (aktualizacje w bieżącej klatce na poziomach)
+        """
+        return {
+            "tier_counts": list(self.tier_counts),
+            "updated_counts": list(self.updated_counts),
+        }
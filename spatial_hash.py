@@ -0,0 +1,165 @@
+import numpy as np
+
+# Połowa sąsiedztwa komórki (łącznie z nią samą) – druga połowa należy do sąsiadów
+HALF_NEIGHBOURHOOD = ((0, 0), (1, 0), (1, 1), (0, 1), (-1, 1))
+
+
+class SpatialHash:
+    """
+    Haszowanie przestrzenne (jednorodna siatka) dla obiektów dynamicznych.
+
+    Siatka jest odbudowywana co klatkę z aktualnych pozycji obiektów (np. przeciwników).
+    Zapytania zwracają tylko obiekty z komórek, które pokrywa pytany obszar, dzięki czemu
+    testy kolizji wykonuje się wyłącznie dla par leżących blisko siebie.
+    """
+    def __init__(self, cell_size=128):
+        """
+        :param cell_size: Rozmiar komórki w pikselach – najlepiej rzędu rozmiaru największych obiektów
+        """
+        self.cell_size = cell_size
+        self.cells = {}   # (kolumna, wiersz) -> lista krotek (kolejność wstawienia, obiekt)
+        self.count = 0
+
+    def clear(self):
+        """
+        Usuwa wszystkie obiekty z siatki.
+        """
+        self.cells.clear()
+        self.count = 0
+
+    def insert(self, item, rect):
+        """
+        Wstawia obiekt do wszystkich komórek pokrywanych przez jego prostokąt.
+
+        :param item: Dowolny obiekt (np. przeciwnik)
+        :param rect: pygame.Rect obiektu
+        """
+        cs = self.cell_size
+        entry = (self.count, item)
+        self.count += 1
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    self.cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild(self, items):
+        """
+        Odbudowuje siatkę od zera na podstawie atrybutu rect każdego obiektu.
+
+        :param items: Lista obiektów posiadających atrybut rect (pygame.Rect)
+        """
+        self.clear()
+        for item in items:
+            self.insert(item, item.rect)
+
+    def query_rect(self, rect):
+        """
+        Zwraca obiekty z komórek pokrywanych przez prostokąt (kandydaci do kolizji),
+        bez powtórzeń i w kolejności wstawienia.
+
+        :param rect: pygame.Rect obszaru zapytania
+        :return: Lista obiektów
+        """
+        cs = self.cell_size
+        found = {}
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    for order, item in bucket:
+                        found[order] = item
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
+
+    def query_radius(self, center_x, center_y, radius):
+        """
+        Zwraca obiekty z komórek pokrywanych przez kwadrat opisany na okręgu (kandydaci
+        do testu odległości), bez powtórzeń i w kolejności wstawienia.
+
+        :param center_x: Współrzędna x środka okręgu
+        :param center_y: Współrzędna y środka okręgu
+        :param radius: Promień okręgu (w pikselach)
+        :return: Lista obiektów
+        """
+        cs = self.cell_size
+        found = {}
+        for cx in range(int((center_x - radius) // cs), int((center_x + radius) // cs) + 1):
+            for cy in range(int((center_y - radius) // cs), int((center_y + radius) // cs) + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    for order, item in bucket:
+                        found[order] = item
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
+
+    def candidate_pairs(self, items):
+        """
+        Generuje pary kandydatów (obiekt, obiekt_z_siatki) wyłącznie dla obiektów leżących blisko siebie.
+
+        :param items: Obiekty posiadające atrybut rect (np. pociski gracza)
+        :return: Generator krotek (item, kandydat)
+        """
+        for item in items:
+            for candidate in self.query_rect(item.rect):
+                yield item, candidate
+
+
+def neighbour_pairs(xs, ys, cell_size):
+    """
+    Zwraca wszystkie pary punktów z tej samej lub sąsiadujących komórek siatki – każdą parę dokładnie raz.
+    Punkty sortowane są według kluczy komórek (jak indeks XPGems), więc każda komórka to ciągły
+    przedział tablicy, a komórki sąsiednie znajduje wyszukiwanie binarne po kluczach.
+    Dla każdej komórki sprawdzana jest ona sama i połowa sąsiedztwa (4 z 8 sąsiadów).
+
+    :param xs: Tablica współrzędnych x punktów (w pikselach)
+    :param ys: Tablica współrzędnych y punktów (w pikselach)
+    :param cell_size: Rozmiar komórki (w pikselach)
+    :return: Krotka tablic (first, second) – pary indeksów punktów (first[k], second[k])
+    """
+    cell_xs = np.floor_divide(xs, cell_size).astype(np.int64)
+    cell_ys = np.floor_divide(ys, cell_size).astype(np.int64)
+    if not len(cell_xs):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    # Kolumny przesunięte o 1, aby sąsiad z offsetem -1 nie trafiał do poprzedniego wiersza
+    cell_xs -= cell_xs.min() - 1
+    stride = int(cell_xs.max()) + 2
+    keys = cell_ys * stride + cell_xs
+
+    order = np.argsort(keys, kind="stable")
+    cells, starts, sizes = np.unique(keys[order], return_index=True, return_counts=True)
+
+    first, second = [], []
+    for offset_x, offset_y in HALF_NEIGHBOURHOOD:
+        if offset_x == 0 and offset_y == 0:
+            cell_a = cell_b = np.arange(len(cells))
+        else:
+            # Komórki, których sąsiad z tym offsetem zawiera punkty
+            wanted = cells + offset_y * stride + offset_x
+            found = np.minimum(np.searchsorted(cells, wanted), len(cells) - 1)
+            cell_a = np.flatnonzero(cells[found] == wanted)
+            cell_b = found[cell_a]
+        size_a = sizes[cell_a]
+        size_b = sizes[cell_b]
+        pair_counts = size_a * size_b
+        total = int(pair_counts.sum())
+        if not total:
+            continue
+        # Iloczyn kartezjański punktów obu komórek dla wszystkich par komórek naraz
+        pair_cell = np.repeat(np.arange(len(cell_a)), pair_counts)
+        local = np.arange(total) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        index_a = local // size_b[pair_cell]
+        index_b = local % size_b[pair_cell]
+        if offset_x == 0 and offset_y == 0:
+            # Wewnątrz komórki – każda para raz, bez par punktu z samym sobą
+            upper = index_a < index_b
+            pair_cell, index_a, index_b = pair_cell[upper], index_a[upper], index_b[upper]
+        first.append(order[starts[cell_a][pair_cell] + index_a])
+        second.append(order[starts[cell_b][pair_cell] + index_b])
+    if not first:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(first), np.concatenate(second)
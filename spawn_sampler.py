@@ -0,0 +1,92 @@
+import random
+import numpy as np
+
+
+class SpawnSampler:
+    """
+    Losowanie pól spawnu przeciwników tuż za krawędzią widocznego obszaru.
+
+    Zbiór kandydatów to dostępne kafelki osiągalne z pozycji gracza, leżące w pasie o szerokości
+    band kafelków wokół ekranu (całkowicie poza ekranem). Zbiór jest przeliczany tylko wtedy,
+    gdy kamera przejdzie do innego kafelka, a samo losowanie to wybór losowego elementu tablicy – O(1).
+    Ponieważ kandydaci są z góry poprawni, spawn nigdy nie wymaga testów kolizji ani nie kończy się porażką.
+    """
+    def __init__(self, nav_grid, start_x, start_y, screen_width, screen_height, band=2):
+        """
+        :param nav_grid: Siatka nawigacyjna (NavGrid)
+        :param start_x: Pozycja x gracza (w pikselach) – od niej liczona jest osiągalność
+        :param start_y: Pozycja y gracza (w pikselach)
+        :param screen_width: Szerokość ekranu (w pikselach)
+        :param screen_height: Wysokość ekranu (w pikselach)
+        :param band: Szerokość pasa spawnu wokół ekranu (w kafelkach)
+        """
+        self.nav_grid = nav_grid
+        self.tile_size = nav_grid.tile_size
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.band = band
+        self.reachable = nav_grid.reachable_from(int(start_y // self.tile_size), int(start_x // self.tile_size))
+        self.candidates = np.empty((0, 2), dtype=int)
+        self.viewport_cells = None
+
+    def update(self, camera_x, camera_y):
+        """
+        Przelicza zbiór kandydatów, jeśli kamera przesunęła się do innego kafelka.
+
+        :param camera_x: Pozycja kamery w osi X (w pikselach)
+        :param camera_y: Pozycja kamery w osi Y (w pikselach)
+        """
+        ts = self.tile_size
+        col0 = int(camera_x // ts)
+        row0 = int(camera_y // ts)
+        col1 = int((camera_x + self.screen_width - 1) // ts)
+        row1 = int((camera_y + self.screen_height - 1) // ts)
+        viewport_cells = (row0, row1, col0, col1)
+        if viewport_cells == self.viewport_cells:
+            return
+        self.viewport_cells = viewport_cells
+
+        # Kafelki (choćby częściowo) widoczne na ekranie są wykluczone
+        rows, cols = self.reachable.shape
+        off_screen = self.reachable.copy()
+        off_screen[max(0, row0):max(0, row1 + 1), max(0, col0):max(0, col1 + 1)] = False
+
+        # Pas wokół ekranu
+        band_mask = np.zeros_like(off_screen)
+        band_mask[max(0, row0 - self.band):max(0, row1 + self.band + 1),
+                  max(0, col0 - self.band):max(0, col1 + self.band + 1)] = True
+
+        candidates = np.argwhere(off_screen & band_mask)
+        if not len(candidates):
+            # Ekran obejmuje cały pas (np. przy krawędzi mapy) – dowolne osiągalne pole poza ekranem
+            candidates = np.argwhere(off_screen)
+        if not len(candidates):
+            # Cały osiągalny obszar jest widoczny – spawn na dowolnym osiągalnym polu
+            candidates = np.argwhere(self.reachable)
+        self.candidates = candidates
+
+    def sample_cell(self):
+        """
+        Losuje pole spawnu spośród aktualnych kandydatów.
+
+        :return: Krotka (wiersz, kolumna) lub None, jeśli na mapie nie ma osiągalnych pól
+        """
+        if not len(self.candidates):
+            return None
+        row, col = self.candidates[random.randrange(len(self.candidates))]
+        return int(row), int(col)
+
+    def spawn_position(self, entity_width, entity_height):
+        """
+        Zwraca pozycję (lewy-górny róg) jednostki wyśrodkowanej na wylosowanym polu spawnu.
+
+        :param entity_width: Szerokość jednostki (w pikselach)
+        :param entity_height: Wysokość jednostki (w pikselach)
+        :return: Krotka (x, y) lub None, jeśli na mapie nie ma osiągalnych pól
+        """
+        cell = self.sample_cell()
+        if cell is None:
+            return None
+        row, col = cell
+        ts = self.tile_size
+        return col * ts + (ts - entity_width) // 2, row * ts + (ts - entity_height) // 2
@@ -0,0 +1,113 @@
+import json
+import os
+import pygame
+
+# Katalog z wypieczonymi atlasami (wynik działania asset_baker.py)
+BAKED_DIR = "assets/baked"
+MANIFEST_NAME = "atlas.json"
+
+
+def sprite_key(path, size=None, transform=None):
+    """
+    Buduje klucz, pod którym sprite jest zapisany w manifeście atlasu.
+
+    :param path: Ścieżka do źródłowego obrazu, np. "assets/images/boss.png"
+    :param size: Docelowy rozmiar (szerokość, wysokość) lub None dla rozmiaru oryginalnego
+    :param transform: Opcjonalne przekształcenie – "flip_x", "rot_<stopnie>" lub "tile:<nazwa kafelka>"
+    :return: Klucz tekstowy, np. "assets/images/boss.png|128x128|flip_x"
+    """
+    size_part = f"{size[0]}x{size[1]}" if size else "native"
+    if transform:
+        return f"{path}|{size_part}|{transform}"
+    return f"{path}|{size_part}"
+
+
+def apply_transform(surface, transform):
+    """
+    Stosuje przekształcenie opisane tekstem do powierzchni.
+
+    :param surface: Powierzchnia źródłowa (pygame.Surface)
+    :param transform: None, "flip_x" (odbicie w poziomie) lub "rot_<stopnie>" (obrót jak w pygame.transform.rotate)
+    :return: Nowa powierzchnia lub oryginał, jeśli przekształcenie jest puste
+    """
+    if not transform:
+        return surface
+    if transform == "flip_x":
+        return pygame.transform.flip(surface, True, False)
+    if transform.startswith("rot_"):
+        return pygame.transform.rotate(surface, float(transform[4:]))
+    raise ValueError(f"Nieznane przekształcenie sprite'a: {transform}")
+
+
+class SpriteAtlas:
+    """
+    Klasa SpriteAtlas – wypieczone atlasy sprite'ów ładowane raz na starcie gry;
+    sprite'y wydawane są jako podpowierzchnie (subsurface) bez kopiowania pikseli.
+    """
+    _initialized = False
+    pages = []      # Strony atlasu (pygame.Surface po convert_alpha)
+    sprites = {}    # Klucz sprite'a -> podpowierzchnia strony atlasu
+
+    @staticmethod
+    def init(manifest_path=os.path.join(BAKED_DIR, MANIFEST_NAME)):
+        """
+        Wczytuje manifest oraz strony atlasu. Metodę należy wywołać raz, po pygame.display.set_mode().
+        Jeśli atlas nie został wypieczony, gra korzysta z oryginalnych plików PNG.
+
+        :param manifest_path: Ścieżka do pliku manifestu (JSON)
+        """
+        if SpriteAtlas._initialized:
+            return
+        SpriteAtlas._initialized = True
+
+        if not os.path.exists(manifest_path):
+            print(f"[SpriteAtlas] Brak atlasu ({manifest_path}) – grafiki wczytywane z plików źródłowych")
+            return
+
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+
+        base_dir = os.path.dirname(manifest_path)
+        SpriteAtlas.pages = [
+            pygame.image.load(os.path.join(base_dir, page_name)).convert_alpha()
+            for page_name in manifest["pages"]
+        ]
+        SpriteAtlas.sprites = {}
+        for key, (page, x, y, w, h) in manifest["sprites"].items():
+            SpriteAtlas.sprites[key] = SpriteAtlas.pages[page].subsurface(pygame.Rect(x, y, w, h))
+        print(f"[SpriteAtlas] Wczytano {len(SpriteAtlas.sprites)} sprite'ów z {len(SpriteAtlas.pages)} stron atlasu")
+
+    @staticmethod
+    def get(key):
+        """
+        Zwraca wypieczony sprite o podanym kluczu.
+
+        :param key: Klucz zbudowany funkcją sprite_key
+        :return: pygame.Surface (podpowierzchnia atlasu) lub None, jeśli sprite nie został wypieczony
+        """
+        return SpriteAtlas.sprites.get(key)
+
+
+def load_sprite(path, size=None, transform=None):
+    """
+    Zwraca gotowy do rysowania sprite: najpierw szuka go w atlasie, a w razie braku
+    wczytuje obraz z dysku, konwertuje do formatu ekranu, skaluje i przekształca.
+
+    Zwracana powierzchnia może być współdzielona – nie wolno po niej rysować.
+
+    :param path: Ścieżka do obrazu źródłowego
+    :param size: Docelowy rozmiar (szerokość, wysokość) lub None
+    :param transform: Opcjonalne przekształcenie (patrz apply_transform)
+    :return: pygame.Surface
+    """
+    baked = SpriteAtlas.get(sprite_key(path, size, transform))
+    if baked is not None:
+        return baked
+
+    surface = pygame.image.load(path)
+    # Konwersja jest możliwa dopiero po utworzeniu okna gry
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    if size:
+        surface = pygame.transform.scale(surface, size)
+    return apply_transform(surface, transform)
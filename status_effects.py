@@ -0,0 +1,91 @@
+import numpy as np
+from scheduler import Scheduler
+from enemy_store import EnemyStore, TYPE_BOSS
+
+# Definicje efektów statusu (czasy w klatkach Scheduler.now):
+#   - "damage_per_frame" – obrażenia na klatkę za każdy ładunek (efekty obrażeń w czasie),
+#   - "max_stacks" – limit ładunków; każde nałożenie dodaje ładunek i odnawia czas trwania,
+#   - "slow" – ułamek prędkości odbierany przeciwnikowi (1 – całkowite unieruchomienie),
+#   - "immune_types" – typy przeciwników odpornych na efekt.
+EFFECTS = {
+    "burn": {"duration": 180, "damage_per_frame": 0.4, "max_stacks": 5},
+    "poison": {"duration": 300, "damage_per_frame": 0.15, "max_stacks": 10},
+    "slow": {"duration": 120, "slow": 0.5, "immune_types": (TYPE_BOSS,)},
+    "freeze": {"duration": 45, "slow": 1.0, "immune_types": (TYPE_BOSS,)},
+}
+
+# Efekty obrażeń w czasie (kolumny <nazwa>_stacks i <nazwa>_until) i efekty spowalniające (<nazwa>_until)
+DOT_EFFECTS = tuple(name for name, effect in EFFECTS.items() if "damage_per_frame" in effect)
+SLOW_EFFECTS = tuple(name for name, effect in EFFECTS.items() if "slow" in effect)
+
+
+class StatusEffects:
+    """
+    Klasa StatusEffects – podpalenie, trucizna, spowolnienie i zamrożenie przeciwników;
+    stan efektów (ładunki i klatka wygaśnięcia) to kolumny EnemyStore.
+    """
+
+    @staticmethod
+    def apply(name, slots):
+        """
+        Nakłada efekt na przeciwników w podanych wierszach (powtórzenia dodają kolejne ładunki).
+
+        :param name: Klucz EFFECTS ("burn", "poison", "slow", "freeze")
+        :param slots: Tablica numerów wierszy EnemyStore
+        """
+        effect = EFFECTS[name]
+        slots = np.asarray(slots, dtype=np.int64)
+        columns = EnemyStore.columns
+        if "immune_types" in effect and len(slots):
+            slots = slots[~np.isin(columns["type_id"][slots], effect["immune_types"])]
+        if not len(slots):
+            return
+        now = Scheduler.now
+        until = columns[f"{name}_until"]
+        if "max_stacks" in effect:
+            stacks = columns[f"{name}_stacks"]
+            # Wygasłe ładunki nie sumują się z nowymi
+            stacks[slots[until[slots] <= now]] = 0
+            np.add.at(stacks, slots, 1)
+            stacks[slots] = np.minimum(stacks[slots], effect["max_stacks"])
+        until[slots] = np.maximum(until[slots], now + effect["duration"])
+
+    @staticmethod
+    def tick():
+        """
+        Zadaje obrażenia efektów w czasie, usuwa wygasłe ładunki i wylicza spowolnienie
+        (slow_amount) wszystkich przeciwników. Wywoływana raz na klatkę, przed ruchem hordy.
+
+        :return: Tablica wierszy przeciwników pokonanych przez efekty w tej klatce
+        """
+        count = EnemyStore.count
+        columns = EnemyStore.columns
+        if not count:
+            return np.zeros(0, dtype=np.int64)
+        now = Scheduler.now
+        health = columns["health"][:count]
+
+        for name in DOT_EFFECTS:
+            stacks = columns[f"{name}_stacks"][:count]
+            stacks[columns[f"{name}_until"][:count] <= now] = 0
+            health -= stacks * EFFECTS[name]["damage_per_frame"]
+
+        slow_amount = columns["slow_amount"][:count]
+        slow_amount[:] = 0
+        for name in SLOW_EFFECTS:
+            active = columns[f"{name}_until"][:count] > now
+            np.maximum(slow_amount, np.where(active, EFFECTS[name]["slow"], 0.0), out=slow_amount)
+
+        to_remove = columns["to_remove"][:count]
+        killed = np.flatnonzero((health <= 0) & ~to_remove)
+        to_remove[killed] = True
+        return killed
+
+    @staticmethod
+    def immobile_mask():
+        """
+        Zwraca maskę przeciwników unieruchomionych (np. zamrożonych) – nie atakują w tej klatce.
+
+        :return: Tablica bool o długości EnemyStore.count
+        """
+        return EnemyStore.columns["slow_amount"][:EnemyStore.count] >= 1.0
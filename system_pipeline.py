@@ -0,0 +1,87 @@
+import time
+
+
+class FrameContext:
+    """
+    Wspólny stan klatki przekazywany wszystkim systemom potoku.
+
+    Przechowuje referencje do obiektów gry (gracz, systemy przestrzenne, poziomy, fale)
+    oraz wartości zmieniane w trakcie klatki (czas gry, kamera, lista przeciwników).
+    Systemy czytają i zapisują atrybuty bezpośrednio – main() odczytuje je po przebiegu potoku.
+    """
+    def __init__(self, **state):
+        """
+        :param state: Początkowe atrybuty kontekstu (nazwa=wartość)
+        """
+        self.next_state = None       # Stan gry, na który potok przełącza (np. "game_over")
+        self.__dict__.update(state)
+
+
+class SystemPipeline:
+    """
+    Uporządkowany harmonogram systemów wykonywanych co klatkę.
+
+    Każdy system to funkcja przyjmująca FrameContext; systemy wykonywane są w kolejności dodania,
+    więc zależności między nimi (np. ruch przed kolizjami, kolizje przed usuwaniem) wynikają
+    wprost z listy. System może przerwać resztę klatki, zwracając False (np. przy zmianie stanu gry).
+    Czas każdego systemu mierzony jest time.perf_counter() i wygładzany średnią wykładniczą.
+    """
+    def __init__(self, smoothing=0.05):
+        """
+        :param smoothing: Waga najnowszego pomiaru w średniej wykładniczej czasów (0–1)
+        """
+        self.systems = []            # Lista par (nazwa, funkcja systemu)
+        self.smoothing = smoothing
+        self.timings = {}            # Nazwa systemu -> wygładzony czas wykonania (w milisekundach)
+        self.last_timings = {}       # Nazwa systemu -> czas z ostatniego wykonania (w milisekundach)
+
+    def add(self, name, system):
+        """
+        Dodaje system na koniec harmonogramu.
+
+        :param name: Unikalna nazwa systemu (klucz statystyk)
+        :param system: Funkcja system(context); zwrócenie False przerywa klatkę
+        :return: self (umożliwia łańcuchowe dodawanie)
+        """
+        if any(existing == name for existing, _ in self.systems):
+            raise ValueError(f"System '{name}' jest już w harmonogramie")
+        self.systems.append((name, system))
+        self.timings[name] = 0.0
+        return self
+
+    def run(self, context):
+        """
+        Wykonuje systemy po kolei, mierząc czas każdego z nich.
+
+        :param context: FrameContext przekazywany każdemu systemowi
+        :return: True, jeśli wykonano wszystkie systemy; False, jeśli któryś przerwał klatkę
+        """
+        smoothing = self.smoothing
+        timings = self.timings
+        for name, system in self.systems:
+            start = time.perf_counter()
+            result = system(context)
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self.last_timings[name] = elapsed
+            timings[name] += (elapsed - timings[name]) * smoothing
+            if result is False:
+                return False
+        return True
+
+    def stats(self):
+        """
+        Zwraca wygładzone czasy systemów w kolejności harmonogramu.
+
+        :return: Słownik nazwa systemu -> czas (w milisekundach)
+        """
+        return {name: self.timings[name] for name, _ in self.systems}
+
+    def summary(self, top=5):
+        """
+        Zwraca opis najdroższych systemów – do logowania razem z FPS.
+
+        :param top: Liczba systemów w opisie
+        :return: Tekst w formacie "nazwa=czas ms, ..."
+        """
+        ranked = sorted(self.stats().items(), key=lambda item: item[1], reverse=True)[:top]
+        return ", ".join(f"{name}={ms:.2f} ms" for name, ms in ranked)
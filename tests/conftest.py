@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+
+import pygame
+import pytest
+
+# Moduły gry leżą w katalogu głównym repozytorium; pygame bez okna i dźwięku
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from enemy_store import EnemyStore  # noqa: E402
+from scheduler import Scheduler  # noqa: E402
+from collision_world import CollisionWorld  # noqa: E402
+
+# Szablony kolizji kafelków testowej mapy (względem lewego-górnego rogu kafelka 32 px)
+TILE_SIZE = 32
+TILE_RECTS = {
+    "floor": [],
+    "wall": [(0, 0, 32, 32)],
+    "edge": [(20, 0, 12, 32)],
+    "corner": [(20, 0, 12, 32), (0, 20, 32, 12)],
+    "post": [(12, 12, 8, 8)],
+}
+
+
+class GridTiles:
+    """
+    Zastępczy TileManager – rozmiar kafelka i prostokąty kolizji bez wczytywania grafik.
+    """
+    def tile_width(self):
+        return TILE_SIZE
+
+    def get_collision_rects(self, tile_name, x, y):
+        return [pygame.Rect(x + left, y + top, w, h) for left, top, w, h in TILE_RECTS[tile_name]]
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """
+    Każdy test zaczyna z pustym magazynem przeciwników i wyzerowanym harmonogramem.
+    """
+    EnemyStore.reset()
+    Scheduler.reset()
+    yield
+    EnemyStore.reset()
+    Scheduler.reset()
+
+
+@pytest.fixture
+def make_world():
+    """
+    Buduje CollisionWorld z mapy nazw kafelków (klucze TILE_RECTS).
+    """
+    return lambda terrain_map: CollisionWorld(terrain_map, GridTiles())
+
+
+@pytest.fixture
+def collision_world(make_world):
+    """
+    Losowa mapa 12x10 kafelków z różnymi kształtami ścian (stałe ziarno).
+    """
+    rng = random.Random(11)
+    names = ["floor"] * 6 + ["wall", "edge", "corner", "post"]
+    return make_world([[rng.choice(names) for _ in range(12)] for _ in range(10)])
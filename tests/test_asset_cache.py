@@ -0,0 +1,33 @@
+import pygame
+import pytest
+
+from asset_cache import AssetCache
+
+
+@pytest.fixture
+def sprite_path(tmp_path):
+    """
+    Ścieżka do tymczasowego obrazu; okno (dummy) umożliwia zapamiętywanie powierzchni.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    path = str(tmp_path / "sprite.png")
+    pygame.image.save(pygame.Surface((4, 2)), path)
+    AssetCache.clear()
+    yield path
+    AssetCache.clear()
+    pygame.display.quit()
+
+
+def test_cold_transformed_lookup_counts_one_miss(sprite_path):
+    flipped = AssetCache.get(sprite_path, (8, 4), "flip_x")
+    assert flipped.get_size() == (8, 4)
+    assert AssetCache.stats() == {"hits": 0, "misses": 1, "entries": 2}
+
+
+def test_base_loaded_for_transform_is_a_hit_later(sprite_path):
+    AssetCache.get(sprite_path, (8, 4), "flip_x")
+    base = AssetCache.get(sprite_path, (8, 4))
+    assert AssetCache.get(sprite_path, (8, 4)) is base
+    assert AssetCache.stats()["hits"] == 2
+    assert AssetCache.stats()["misses"] == 1
@@ -0,0 +1,103 @@
+import numpy as np
+import pygame
+
+
+def brute_force_blocked(world, rect):
+    return any(rect.colliderect(wall) for wall in world)
+
+
+def test_rects_blocked_matches_brute_force(collision_world):
+    rng = np.random.default_rng(5)
+    count = 3000
+    lefts = rng.integers(-40, collision_world.pixel_width + 40, count)
+    tops = rng.integers(-40, collision_world.pixel_height + 40, count)
+    widths = rng.integers(1, 48, count)
+    heights = rng.integers(1, 48, count)
+
+    blocked = collision_world.rects_blocked(lefts, tops, widths, heights)
+
+    expected = [brute_force_blocked(collision_world, pygame.Rect(*r))
+                for r in zip(lefts.tolist(), tops.tolist(), widths.tolist(), heights.tolist())]
+    assert any(expected) and not all(expected)
+    assert blocked.tolist() == expected
+
+
+def test_rects_blocked_agrees_with_collides(collision_world):
+    rng = np.random.default_rng(6)
+    for _ in range(500):
+        rect = pygame.Rect(*rng.integers(0, 300, 2).tolist(), *rng.integers(1, 40, 2).tolist())
+        assert collision_world.rects_blocked([rect.x], [rect.y], [rect.w], [rect.h])[0] == collision_world.collides(rect)
+
+
+def overlaps_wall(world, left, top, width, height):
+    """
+    Czy prostokąt o współrzędnych zmiennoprzecinkowych nachodzi na ścianę (samo zetknięcie nie jest kolizją).
+    """
+    return any(left < wall.right and left + width > wall.left and top < wall.bottom and top + height > wall.top
+               for wall in world)
+
+
+def out_of_bounds(world, left, top, width, height):
+    return left < 0 or top < 0 or left + width > world.pixel_width or top + height > world.pixel_height
+
+
+def brute_force_sweep(world, rect, dx, dy, steps):
+    """
+    Pierwszy krok k/steps drogi, na którym prostokąt nachodzi na ścianę lub opuszcza mapę.
+
+    :return: Numer kroku k lub None, gdy cała droga jest wolna
+    """
+    left, top, width, height = rect
+    for k in range(1, steps + 1):
+        x = left + dx * k / steps
+        y = top + dy * k / steps
+        if overlaps_wall(world, x, y, width, height) or out_of_bounds(world, x, y, width, height):
+            return k
+    return None
+
+
+def test_sweep_rect_matches_stepped_brute_force(collision_world):
+    rng = np.random.default_rng(8)
+    steps = 400
+    checked = blocked = 0
+    while checked < 150:
+        width, height = rng.integers(8, 40, 2).tolist()
+        left = int(rng.integers(0, collision_world.pixel_width - width))
+        top = int(rng.integers(0, collision_world.pixel_height - height))
+        if overlaps_wall(collision_world, left, top, width, height):
+            continue
+        dx, dy = rng.integers(-120, 121, 2).tolist()
+        checked += 1
+
+        t = collision_world.sweep_rect((left, top, width, height), dx, dy)
+        k = brute_force_sweep(collision_world, (left, top, width, height), dx, dy, steps)
+        if k is None:
+            assert t == 1.0
+        else:
+            blocked += 1
+            # Kontakt leży między ostatnim wolnym a pierwszym kolidującym krokiem
+            assert (k - 1) / steps - 1e-9 <= t <= k / steps + 1e-9
+            assert not overlaps_wall(collision_world, left + dx * t, top + dy * t, width, height)
+    assert blocked > 10
+
+
+def test_sweep_rect_slides_along_touching_wall(make_world):
+    world = make_world([["floor"] * 3, ["wall"] * 3])
+    # Dolna krawędź prostokąta leży na górnej krawędzi rzędu ścian (y = 32)
+    assert world.sweep_rect((10, 22, 20, 10), 40, 0) == 1.0
+    assert world.sweep_rect((10, 22, 20, 10), 0, 5) == 0.0
+    assert world.sweep_rect((10, 12, 20, 10), 0, 20) == 0.5
+
+
+def test_sweep_rect_from_inside_wall_is_blocked(make_world):
+    world = make_world([["floor"] * 3, ["wall"] * 3])
+    assert world.sweep_rect((10, 40, 4, 4), 10, 0) == 0.0
+    assert world.sweep_rect((10, 30, 4, 4), 0, -10) == 0.0
+
+
+def test_sweep_rect_stops_at_map_bounds(make_world):
+    world = make_world([["floor"] * 3, ["floor"] * 3])
+    assert world.sweep_rect((0, 0, 8, 8), -10, 0) == 0.0
+    assert world.sweep_rect((80, 0, 8, 8), 16, 0) == 0.5
+    assert world.sweep_rect((80, 0, 8, 8), 16, 0, stay_in_bounds=False) == 1.0
+    assert world.sweep_rect((-1, 0, 8, 8), 5, 0) == 0.0
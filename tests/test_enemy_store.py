@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from enemy_store import EnemyStore, ID_INDEX_MASK
+
+
+def add_enemy(x=0.0, health=100.0):
+    """
+    Dodaje do magazynu wiersz przeciwnika z uchwytem zastępczym.
+
+    :return: Uchwyt (atrybut slot wskazuje wiersz)
+    """
+    handle = SimpleNamespace(slot=None)
+    handle.slot = EnemyStore.allocate(handle)
+    EnemyStore.columns["x"][handle.slot] = x
+    EnemyStore.columns["health"][handle.slot] = health
+    return handle
+
+
+def test_release_moves_last_row_into_freed_slot():
+    first, middle, last = add_enemy(1.0), add_enemy(2.0), add_enemy(3.0)
+    snapshot = EnemyStore.release(middle.slot)
+
+    assert snapshot["x"] == 2.0
+    assert EnemyStore.count == 2
+    assert last.slot == 1
+    assert EnemyStore.handles[1] is last
+    assert EnemyStore.column("x").tolist() == [1.0, 3.0]
+    assert first.slot == 0
+
+
+def test_release_of_last_row_only_shrinks():
+    first, last = add_enemy(1.0), add_enemy(2.0)
+    EnemyStore.release(last.slot)
+    assert EnemyStore.count == 1
+    assert EnemyStore.handles[:2] == [first, None]
+
+
+def test_allocate_clears_reused_row():
+    enemy = add_enemy(5.0, health=40.0)
+    EnemyStore.columns["to_remove"][enemy.slot] = True
+    EnemyStore.release(enemy.slot)
+    reused = add_enemy()
+    assert reused.slot == 0
+    assert not EnemyStore.columns["to_remove"][reused.slot]
+    assert EnemyStore.columns["x"][reused.slot] == 0.0
+
+
+def test_grow_keeps_existing_rows():
+    EnemyStore.reset(capacity=2)
+    handles = [add_enemy(float(i)) for i in range(70)]
+    assert EnemyStore.capacity >= 70
+    assert len(EnemyStore.handles) == EnemyStore.capacity
+    assert EnemyStore.column("x").tolist() == [float(i) for i in range(70)]
+    assert all(EnemyStore.handles[h.slot] is h for h in handles)
+
+
+def test_collect_removed_releases_only_marked_rows():
+    handles = [add_enemy(float(i)) for i in range(5)]
+    for handle in handles:
+        handle.release = lambda handle=handle: EnemyStore.release(handle.slot)
+    EnemyStore.columns["to_remove"][[1, 3]] = True
+
+    removed = EnemyStore.collect_removed()
+
+    assert {id(h) for h in removed} == {id(handles[1]), id(handles[3])}
+    assert EnemyStore.count == 3
+    assert sorted(EnemyStore.column("x").tolist()) == [0.0, 2.0, 4.0]
+    assert not EnemyStore.column("to_remove").any()
+    assert EnemyStore.collect_removed() == []
+
+
+def test_apply_damage_sums_repeated_hits_and_marks_kills_once():
+    a, b = add_enemy(health=30.0), add_enemy(health=100.0)
+    killed = EnemyStore.apply_damage([a.slot, a.slot, b.slot], 15)
+    assert killed.tolist() == [a.slot]
+    assert np.allclose(EnemyStore.column("health"), [0.0, 85.0])
+    assert EnemyStore.apply_damage([a.slot], 15).tolist() == []
+
+
+def test_entity_id_resolves_to_handle_after_swap_remove():
+    first, moved = add_enemy(), add_enemy()
+    moved_id = EnemyStore.columns["entity_id"][moved.slot].item()
+    EnemyStore.release(first.slot)
+    assert EnemyStore.get(moved_id) is moved
+
+
+def test_released_entity_id_goes_stale():
+    enemy = add_enemy()
+    entity_id = EnemyStore.columns["entity_id"][enemy.slot].item()
+    EnemyStore.release(enemy.slot)
+    assert EnemyStore.get(entity_id) is None
+
+
+def test_reused_index_gets_new_generation():
+    enemy = add_enemy()
+    old_id = EnemyStore.columns["entity_id"][enemy.slot].item()
+    EnemyStore.release(enemy.slot)
+    reused = add_enemy()
+    new_id = EnemyStore.columns["entity_id"][reused.slot].item()
+
+    assert new_id != old_id
+    assert new_id & ID_INDEX_MASK == old_id & ID_INDEX_MASK
+    assert EnemyStore.get(old_id) is None
+    assert EnemyStore.get(new_id) is reused
+
+
+def test_get_of_none_and_unknown_ids():
+    add_enemy()
+    assert EnemyStore.get(None) is None
+    assert EnemyStore.get(12345) is None
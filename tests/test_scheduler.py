@@ -0,0 +1,74 @@
+import random
+
+from scheduler import Scheduler, SLOTS
+
+
+def run_until(frame):
+    while Scheduler.now < frame:
+        Scheduler.tick()
+
+
+def schedule_recording(delays):
+    """
+    Planuje timery zapisujące klatkę, w której zostały odpalone.
+
+    :return: Lista par (oczekiwana klatka, lista klatek odpalenia)
+    """
+    timers = []
+    for delay in delays:
+        fired = []
+        Scheduler.schedule(delay, lambda fired=fired: fired.append(Scheduler.now))
+        timers.append((Scheduler.now + delay, fired))
+    return timers
+
+
+def test_timers_fire_exactly_once_on_their_frame_across_wheel_levels():
+    delays = [1, 2, SLOTS - 1, SLOTS, SLOTS + 1, 3 * SLOTS + 7, SLOTS * SLOTS - 1, SLOTS * SLOTS,
+              SLOTS * SLOTS + 1, SLOTS * SLOTS + 5 * SLOTS + 3]
+    timers = schedule_recording(delays)
+    run_until(max(delays) + 2)
+    for expected, fired in timers:
+        assert fired == [expected]
+    assert Scheduler.pending == 0
+
+
+def test_timers_scheduled_mid_wheel_fire_on_time():
+    rng = random.Random(3)
+    timers = []
+    # Planowanie w trakcie biegu, także tuż przed granicami przedziałów kół
+    for start in (5, SLOTS - 1, SLOTS * SLOTS - 2, SLOTS * SLOTS + 130):
+        run_until(start)
+        timers += schedule_recording([rng.randint(1, 3 * SLOTS * SLOTS) for _ in range(20)])
+        timers += schedule_recording([SLOTS - start % SLOTS, SLOTS * SLOTS - start % (SLOTS * SLOTS)])
+    run_until(max(expected for expected, _ in timers) + 1)
+    for expected, fired in timers:
+        assert fired == [expected]
+
+
+def test_cancelled_timer_does_not_fire():
+    fired = []
+    timer = Scheduler.schedule(SLOTS + 3, lambda: fired.append(Scheduler.now))
+    timer.cancel()
+    run_until(2 * SLOTS)
+    assert fired == []
+    assert Scheduler.fired_last_tick == 0
+
+
+def test_timer_scheduled_from_callback_fires_later():
+    fired = []
+
+    def reschedule():
+        fired.append(Scheduler.now)
+        if len(fired) < 3:
+            Scheduler.schedule(SLOTS, reschedule)
+
+    Scheduler.schedule(SLOTS - 1, reschedule)
+    run_until(4 * SLOTS)
+    assert fired == [SLOTS - 1, 2 * SLOTS - 1, 3 * SLOTS - 1]
+
+
+def test_delay_below_one_fires_next_frame():
+    fired = []
+    Scheduler.schedule(0, lambda: fired.append(Scheduler.now))
+    Scheduler.tick()
+    assert fired == [1]
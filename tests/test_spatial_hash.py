@@ -0,0 +1,39 @@
+import itertools
+
+import numpy as np
+
+from spatial_hash import neighbour_pairs
+
+
+def brute_force_pairs(xs, ys, cell_size):
+    """
+    Pary punktów, których komórki różnią się najwyżej o jeden w każdej osi.
+    """
+    cells = [(int(x // cell_size), int(y // cell_size)) for x, y in zip(xs, ys)]
+    return sorted((i, j) for i, j in itertools.combinations(range(len(cells)), 2)
+                  if abs(cells[i][0] - cells[j][0]) <= 1 and abs(cells[i][1] - cells[j][1]) <= 1)
+
+
+def as_sorted_pairs(first, second):
+    return sorted((min(a, b), max(a, b)) for a, b in zip(first.tolist(), second.tolist()))
+
+
+def test_neighbour_pairs_match_brute_force():
+    rng = np.random.default_rng(7)
+    for spread in (20, 150, 1000):
+        xs = rng.uniform(-spread, spread, 200)
+        ys = rng.uniform(-spread, spread, 200)
+        assert as_sorted_pairs(*neighbour_pairs(xs, ys, 48)) == brute_force_pairs(xs, ys, 48)
+
+
+def test_neighbour_pairs_with_points_sharing_a_position():
+    xs = np.array([10.0, 10.0, 10.0, 60.0, 500.0])
+    ys = np.array([10.0, 10.0, 10.0, 10.0, 500.0])
+    assert as_sorted_pairs(*neighbour_pairs(xs, ys, 48)) == brute_force_pairs(xs, ys, 48)
+
+
+def test_neighbour_pairs_of_empty_and_single_point():
+    first, second = neighbour_pairs(np.zeros(0), np.zeros(0), 48)
+    assert len(first) == 0 and len(second) == 0
+    first, second = neighbour_pairs(np.array([5.0]), np.array([5.0]), 48)
+    assert len(first) == 0 and len(second) == 0
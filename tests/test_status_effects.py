@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from enemy_store import EnemyStore, TYPE_BASIC, TYPE_BOSS
+from scheduler import Scheduler
+from status_effects import EFFECTS, StatusEffects
+
+
+def add_enemy(health=100.0, type_id=TYPE_BASIC):
+    """
+    Dodaje do magazynu wiersz przeciwnika z uchwytem zastępczym.
+
+    :return: Numer wiersza
+    """
+    handle = SimpleNamespace(slot=None)
+    handle.slot = EnemyStore.allocate(handle)
+    EnemyStore.columns["health"][handle.slot] = health
+    EnemyStore.columns["type_id"][handle.slot] = type_id
+    return handle.slot
+
+
+def advance(frames):
+    for _ in range(frames):
+        Scheduler.tick()
+
+
+def test_stacks_are_capped_at_max_stacks():
+    slot = add_enemy()
+    for _ in range(EFFECTS["burn"]["max_stacks"] + 3):
+        StatusEffects.apply("burn", [slot])
+    assert EnemyStore.columns["burn_stacks"][slot] == EFFECTS["burn"]["max_stacks"]
+
+
+def test_repeated_slots_in_one_call_add_separate_stacks():
+    slot = add_enemy()
+    StatusEffects.apply("poison", [slot, slot, slot])
+    assert EnemyStore.columns["poison_stacks"][slot] == 3
+
+
+def test_tick_deals_damage_per_stack():
+    slot = add_enemy(health=100.0)
+    StatusEffects.apply("burn", [slot, slot])
+    StatusEffects.tick()
+    expected = 100.0 - 2 * EFFECTS["burn"]["damage_per_frame"]
+    assert np.isclose(EnemyStore.columns["health"][slot], expected)
+
+
+def test_stacks_expire_together_after_duration():
+    slot = add_enemy(health=1000.0)
+    StatusEffects.apply("burn", [slot, slot])
+    advance(EFFECTS["burn"]["duration"] - 1)
+    StatusEffects.tick()
+    assert EnemyStore.columns["burn_stacks"][slot] == 2
+
+    advance(1)
+    health = EnemyStore.columns["health"][slot]
+    StatusEffects.tick()
+    assert EnemyStore.columns["burn_stacks"][slot] == 0
+    assert EnemyStore.columns["health"][slot] == health
+
+
+def test_reapply_refreshes_duration():
+    slot = add_enemy(health=1000.0)
+    StatusEffects.apply("poison", [slot])
+    advance(100)
+    StatusEffects.apply("poison", [slot])
+    assert EnemyStore.columns["poison_until"][slot] == 100 + EFFECTS["poison"]["duration"]
+    assert EnemyStore.columns["poison_stacks"][slot] == 2
+
+
+def test_expired_stacks_do_not_carry_into_new_application():
+    slot = add_enemy(health=1000.0)
+    StatusEffects.apply("burn", [slot, slot, slot])
+    advance(EFFECTS["burn"]["duration"])
+    StatusEffects.apply("burn", [slot])
+    assert EnemyStore.columns["burn_stacks"][slot] == 1
+
+
+def test_slow_and_freeze_set_slow_amount_and_immobile_mask():
+    slowed = add_enemy()
+    frozen = add_enemy()
+    StatusEffects.apply("slow", [slowed, frozen])
+    StatusEffects.apply("freeze", [frozen])
+    StatusEffects.tick()
+    slow_amount = EnemyStore.column("slow_amount")
+    assert slow_amount[slowed] == EFFECTS["slow"]["slow"]
+    assert slow_amount[frozen] == 1.0
+    assert StatusEffects.immobile_mask().tolist() == [False, True]
+
+    advance(EFFECTS["freeze"]["duration"])
+    StatusEffects.tick()
+    assert EnemyStore.column("slow_amount")[frozen] == EFFECTS["slow"]["slow"]
+
+
+def test_boss_is_immune_to_slow_effects():
+    boss = add_enemy(type_id=TYPE_BOSS)
+    StatusEffects.apply("freeze", [boss])
+    StatusEffects.tick()
+    assert EnemyStore.columns["freeze_until"][boss] == 0
+    assert not StatusEffects.immobile_mask()[boss]
+
+
+def test_tick_marks_killed_enemies_once():
+    slot = add_enemy(health=0.1)
+    StatusEffects.apply("burn", [slot])
+    assert StatusEffects.tick().tolist() == [slot]
+    assert EnemyStore.columns["to_remove"][slot]
+    assert StatusEffects.tick().tolist() == []
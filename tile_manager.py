@@ -1,4 +1,5 @@
 import pygame
+from sprite_atlas import SpriteAtlas, sprite_key
 
 class TileManager:
     def __init__(self, tileset_path="assets/images/tileset.png"):
@@ -12,11 +13,12 @@ class TileManager:
               2 – floor_one_wall,
               3 – floor_two_wall.
           - Ustawia rozmiar kafelka (tutaj 64 piksele).
-          - Wycina z tilesetu poszczególne kafelki oraz generuje dla nich rotacje.
+          - Wycina z tilesetu poszczególne kafelki oraz generuje dla nich rotacje
+            (albo pobiera gotowe, obrócone kafelki z wypieczonego atlasu).
         :param tileset_path: Ścieżka do obrazu tilesetu.
         """
-        # Wczytanie całego tilesetu z obsługą przezroczystości
-        self.tileset = pygame.image.load(tileset_path).convert_alpha()
+        self.tileset_path = tileset_path
+        self.tileset = None
 
         # Ustawienie rozmiaru kafelka – założenie: 64x64 piksele
         self.tile_size = 64
@@ -28,8 +30,28 @@ class TileManager:
         # np. "floor_one_wall_90", "floor_two_wall_180", lub dla "wall" i "floor" – bez sufiksu.
         self.surfaces = {}
 
-        # Wycinanie kafelków z tilesetu oraz generowanie ich rotacji
-        self._load_and_rotate_tiles()
+        # Kafelki z atlasu; w razie jego braku – wycinanie z tilesetu oraz generowanie rotacji
+        if not self._load_baked_tiles():
+            # Wczytanie całego tilesetu z obsługą przezroczystości
+            self.tileset = pygame.image.load(tileset_path).convert_alpha()
+            self._load_and_rotate_tiles()
+
+    def _load_baked_tiles(self):
+        """
+        Pobiera wszystkie kafelki (wraz z rotacjami) z wypieczonego atlasu.
+        :return: True, jeśli atlas zawiera komplet kafelków, False w przeciwnym wypadku.
+        """
+        baked = {}
+        for base_name in self.base_tiles:
+            names = [f"{base_name}_90", f"{base_name}_180", f"{base_name}_270"]
+            names.append(base_name if base_name in ["wall", "floor"] else f"{base_name}_0")
+            for name in names:
+                surf = SpriteAtlas.get(sprite_key(self.tileset_path, None, f"tile:{name}"))
+                if surf is None:
+                    return False
+                baked[name] = surf
+        self.surfaces = baked
+        return True
 
     def _load_and_rotate_tiles(self):
         """
@@ -2,13 +2,12 @@ import pygame
 import random
 import math
 
-from enemy import Enemy
-from ranged_enemy import RangedEnemy
 from boss_enemy import BossEnemy
+from enemy_factory import EnemyFactory
 from audio_manager import AudioManager
 
 class WaveSystem:
-    def __init__(self, wave_data, total_game_time=600, screen_width=1200, screen_height=900):
+    def __init__(self, wave_data, total_game_time=600, screen_width=1200, screen_height=900, spawn_sampler=None):
         """
         Inicjalizuje system fal na podstawie przekazanych danych.
         
@@ -24,6 +23,7 @@ class WaveSystem:
         :param total_game_time: Całkowity czas trwania gry (np. 600 sekund)
         :param screen_width: Szerokość okna gry (w pikselach)
         :param screen_height: Wysokość okna gry (w pikselach)
+        :param spawn_sampler: Opcjonalny SpawnSampler – gotowe, osiągalne pola spawnu przy krawędzi ekranu
         """
         self.wave_data = wave_data
         self.total_game_time = total_game_time
@@ -31,6 +31,7 @@ class WaveSystem:
         self.wave_start_time = 0.0  # Czas rozpoczęcia aktualnej fali (w sekundach)
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.spawn_sampler = spawn_sampler
 
         # Timery spawnów przeciwników – będą zwiększane o delta_time
         self.basic_timer = 0.0
@@ -38,7 +39,7 @@ class WaveSystem:
 
         self.boss_spawned = False  # Flaga, czy boss już został zspawniony w tej fali
 
-    def update(self, game_time, delta_time, enemies, all_wall_rects,
+    def update(self, game_time, delta_time, enemies, collision_world,
                camera_x, camera_y, map_pixel_width, map_pixel_height):
         """
         Aktualizuje system fal na podstawie upływającego czasu.
@@ -46,7 +47,7 @@ class WaveSystem:
         :param game_time: Aktualny czas gry (w sekundach). Wartość ta może być "zamrożona" podczas menu.
         :param delta_time: Czas, który upłynął od ostatniej klatki (w sekundach)
         :param enemies: Lista aktualnych przeciwników – do której będą dodawane nowe spawnowane jednostki.
-        :param all_wall_rects: Lista prostokątów kolizji – używana przy generowaniu pozycji spawnu.
+        :param collision_world: Siatka kolizji terenu (CollisionWorld) – używana przy generowaniu pozycji spawnu.
         :param camera_x: Pozycja kamery w osi X (w pikselach)
         :param camera_y: Pozycja kamery w osi Y (w pikselach)
         :param map_pixel_width: Szerokość mapy w pikselach
@@ -64,7 +65,7 @@ class WaveSystem:
 
         # 1) Na początku fali (gdy wave_start_time == 0) wywołujemy start_wave, który m.in. spawnuje bossa
         if self.wave_start_time == 0.0:
-            self.start_wave(game_time, wave_info, enemies, all_wall_rects,
+            self.start_wave(game_time, wave_info, enemies, collision_world,
                             camera_x, camera_y, map_pixel_width, map_pixel_height)
 
         # 2) Obliczamy, ile czasu minęło od rozpoczęcia aktualnej fali
@@ -79,13 +80,13 @@ class WaveSystem:
 
             # Spawn BasicEnemy
             if "basic" in spawn_rates and self.basic_timer >= spawn_rates["basic"]:
-                self.spawn_enemy("basic", enemies, all_wall_rects, camera_x, camera_y, 
+                self.spawn_enemy("basic", enemies, collision_world, camera_x, camera_y, 
                                  map_pixel_width, map_pixel_height)
                 self.basic_timer = 0.0
 
             # Spawn RangedEnemy
             if "ranged" in spawn_rates and self.ranged_timer >= spawn_rates["ranged"]:
-                self.spawn_enemy("ranged", enemies, all_wall_rects, camera_x, camera_y, 
+                self.spawn_enemy("ranged", enemies, collision_world, camera_x, camera_y, 
                                  map_pixel_width, map_pixel_height)
                 self.ranged_timer = 0.0
 
@@ -120,30 +121,32 @@ class WaveSystem:
         return dt
 
     def start_wave(self, game_time, wave_info, enemies,
-                   all_wall_rects, camera_x, camera_y, map_pixel_width, map_pixel_height):
+                   collision_world, camera_x, camera_y, map_pixel_width, map_pixel_height):
         """
         Rozpoczyna nową falę, ustawiając czas rozpoczęcia oraz ewentualnie spawnując bossa.
         
         :param game_time: Aktualny czas gry (w sekundach)
         :param wave_info: Słownik z danymi o fali (czas trwania, spawn_rates, boss)
         :param enemies: Lista przeciwników – do której dodamy nowego bossa, jeśli dotyczy
-        :param all_wall_rects: Lista prostokątów kolizji (używana przy generowaniu pozycji spawnu)
+        :param collision_world: Siatka kolizji terenu (używana przy generowaniu pozycji spawnu)
         :param camera_x: Pozycja kamery w osi X
         :param camera_y: Pozycja kamery w osi Y
         :param map_pixel_width: Szerokość mapy w pikselach
         :param map_pixel_height: Wysokość mapy w pikselach
         """
         self.wave_start_time = game_time
+        # Spokojny moment na początku fali – przygotowanie pul przeciwników, których fala będzie spawnować
+        EnemyFactory.prewarm_for_wave(wave_info)
         # Jeśli fala zawiera bossa i jeszcze nie został on zspawniony
         if wave_info.get("boss", False) and not self.boss_spawned:
             x, y = self.generate_valid_spawn_position(
                 camera_x, camera_y,
                 map_pixel_width, map_pixel_height,
                 64, 64,
-                all_wall_rects
+                collision_world
             )
             # Tworzymy obiekt bossa i dodajemy go do listy przeciwników
-            boss_enemy = BossEnemy(x, y, wall_rects=all_wall_rects)
+            boss_enemy = BossEnemy(x, y, collision_world=collision_world)
             enemies.append(boss_enemy)
             self.boss_spawned = True
             print(">>> BOSS SPAWNED <<<")
@@ -152,14 +155,14 @@ class WaveSystem:
             
         print(f"[WaveSystem] Start fali nr {self.current_wave_index}")
 
-    def spawn_enemy(self, enemy_type, enemies, all_wall_rects,
+    def spawn_enemy(self, enemy_type, enemies, collision_world,
                     camera_x, camera_y, map_pixel_width, map_pixel_height):
         """
         Spawnuje przeciwnika określonego typu ("basic" lub "ranged") na losowej pozycji.
         
         :param enemy_type: Typ przeciwnika ("basic" lub "ranged")
         :param enemies: Lista aktualnych przeciwników, do której dodamy nowego
-        :param all_wall_rects: Lista prostokątów kolizji
+        :param collision_world: Siatka kolizji terenu (CollisionWorld)
         :param camera_x: Pozycja kamery w osi X
         :param camera_y: Pozycja kamery w osi Y
         :param map_pixel_width: Szerokość mapy w pikselach
@@ -169,15 +172,12 @@ class WaveSystem:
             camera_x, camera_y,
             map_pixel_width, map_pixel_height,
             64, 64,
-            all_wall_rects
+            collision_world
         )
-        if enemy_type == "basic":
-            new_enemy = Enemy(x, y, speed=2, health=50, xp_value=1)
-        elif enemy_type == "ranged":
-            new_enemy = RangedEnemy(x, y, speed=1.5, health=40, xp_value=3)
-        else:
-            new_enemy = Enemy(x, y, speed=2, health=50, xp_value=1)
-        enemies.append(new_enemy)
+        if enemy_type not in ("basic", "ranged"):
+            enemy_type = "basic"
+        # Obiekt z puli fabryki (przygotowanej w start_wave) – bez tworzenia i wczytywania grafik w trakcie fali
+        enemies.append(EnemyFactory.spawn(enemy_type, x, y))
     
     def generate_spawn_position(self, camera_x, camera_y,
                                 map_pixel_width, map_pixel_height,
@@ -215,13 +215,20 @@ class WaveSystem:
     def generate_valid_spawn_position(self, camera_x, camera_y,
                                       map_pixel_width, map_pixel_height,
                                       entity_width, entity_height,
-                                      wall_rects, max_tries=100):
+                                      collision_world, max_tries=100):
         """
-        Próbuje wygenerować prawidłową (nie kolidującą) pozycję spawnu dla jednostki.
-        Wykonuje do max_tries prób; gdy żadna nie jest poprawna, zwraca (0, 0).
+        Wyznacza prawidłową (nie kolidującą) pozycję spawnu dla jednostki.
+        Z SpawnSamplerem losuje gotowe, osiągalne pole tuż poza ekranem (bez testów kolizji).
+        Bez niego wykonuje do max_tries prób losowania; gdy żadna nie jest poprawna, zwraca (0, 0).
         
         :return: Krotka (x, y) – prawidłowa pozycja spawnu
         """
+        if self.spawn_sampler is not None:
+            self.spawn_sampler.update(camera_x, camera_y)
+            position = self.spawn_sampler.spawn_position(entity_width, entity_height)
+            if position is not None:
+                return position
+
         for _ in range(max_tries):
             x, y = self.generate_spawn_position(
                 camera_x, camera_y,
@@ -229,7 +236,7 @@ class WaveSystem:
                 entity_width, entity_height
             )
             rect = pygame.Rect(x, y, entity_width, entity_height)
-            collision = any(rect.colliderect(w) for w in wall_rects)
+            collision = collision_world.collides(rect)
             if not collision:
                 return x, y
         # Jeśli nie uda się znaleźć poprawnej pozycji po max_tries, zwróć (0, 0)
@@ -1,6 +1,43 @@
 import pygame
 import math
+import numpy as np
 from audio_manager import AudioManager
+from asset_cache import AssetCache
+from scheduler import Scheduler
+from enemy_store import EnemyStore
+from status_effects import StatusEffects
+
+# Definicje broni gracza: klucz -> parametry konstruktora Weapon.
+# Nowa broń w istniejącym trybie to nowy wpis w tej tabeli.
+WEAPON_PREFABS = {
+    "default": {
+        "name": "Podstawowa Broń",
+        "damage": 15,
+        "projectile_speed": 10,
+        "cooldown": 20,
+        "projectile_image": "assets/images/Projectile_Default.png",
+        "auto_aim": False,
+        "status_effects": (),
+    },
+    "satellite": {
+        "name": "Orbitalny Satelita",
+        "damage": 10,
+        "projectile_speed": 0,  # W trybie "satellite" prędkość nie ma znaczenia
+        "cooldown": 0,
+        "projectile_image": "assets/images/satellite.png",
+        "mode": "satellite",
+        "status_effects": (),
+    },
+    "explosion": {
+        "name": "Obszarowy Wybuch",
+        "damage": 50,  # Obrażenia wybuchu
+        "projectile_speed": 0,  # W trybie wybuchu prędkość nie jest wykorzystywana
+        "cooldown": 15,
+        "projectile_image": "assets/images/explosion.png",
+        "mode": "explosion",
+        "status_effects": (),
+    },
+}
 
 class Weapon:
     """
@@ -9,7 +46,8 @@ class Weapon:
       - "satellite": tryb, w którym broń generuje orbitujące satelity,
       - "explosion": tryb, w którym broń wywołuje eksplozje zadające obrażenia w zasięgu.
     """
-    def __init__(self, name, damage, projectile_speed, cooldown, projectile_image, mode="projectile"):
+    def __init__(self, name, damage, projectile_speed, cooldown, projectile_image, mode="projectile",
+                 auto_aim=False, homing=False, status_effects=()):
         """
         Inicjalizuje broń.
 
@@ -19,20 +57,40 @@ class Weapon:
         :param cooldown: Czas odnowienia między strzałami (w klatkach)
         :param projectile_image: Ścieżka do obrazu pocisku (lub efektu eksplozji)
         :param mode: Tryb działania broni – "projectile", "satellite" lub "explosion"
+        :param auto_aim: Czy strzał celuje w najbliższego przeciwnika (tryb "projectile")
+        :param homing: Czy pociski naprowadzają się na najbliższego przeciwnika (tryb "projectile")
+        :param status_effects: Efekty statusu (klucze status_effects.EFFECTS) nakładane na trafionych przeciwników
         """
         self.name = name
         self.damage = damage
         self.projectile_speed = projectile_speed
         self.cooldown = cooldown
-        self.current_cooldown = 0
-        self.projectiles = []            # Lista aktywnych pocisków (dla trybu "projectile")
+        self.shot_ready = True           # Gotowość strzału – koniec cooldownu planuje Scheduler
         self.level = 0                   # Poziom broni (domyślnie 0 – broń nieaktywna)
         self.mode = mode                 # Tryb działania broni
-        self.damaged_enemies = set()     # W trybie satelitów – przeciwnicy, którzy już zostali uszkodzeni
+        self.damaged_enemies = set()     # W trybie satelitów – identyfikatory (entity_id) już uszkodzonych przeciwników
         self.was_updated_this_frame = False  # Flaga pomocnicza (można wykorzystać przy synchronizacji aktualizacji)
-
-        # Wczytujemy obraz pocisku; na potrzeby różnych trybów obraz ten może być później przeskalowany
-        self.projectile_image = pygame.image.load(projectile_image)
+        self.explosion_updated = False   # Tryb "explosion": czy wybuch był już aktualizowany w tej klatce
+
+        # Celowanie i naprowadzanie (zapytania do NearestEnemyIndex)
+        self.auto_aim = auto_aim
+        self.aim_range = 600             # Zasięg automatycznego celowania (w pikselach)
+        self.homing = homing
+        self.homing_range = 400          # Zasięg wyszukiwania celu przez pocisk naprowadzany (w pikselach)
+        self.homing_turn_rate = math.radians(6)  # Maksymalny skręt pocisku na klatkę
+        self.status_effects = tuple(status_effects)
+
+        # Obraz pocisku – w trybie "projectile" od razu w docelowym rozmiarze, w pozostałych oryginalny
+        self.projectile_image_path = projectile_image
+        if self.mode == "projectile":
+            self.projectile_image = AssetCache.get(projectile_image, (17, 32))
+            # Obrócone warianty pocisku – wspólne dla wszystkich strzałów tej grafiki
+            self.projectile_rotations = AssetCache.get_rotations(projectile_image, (17, 32))
+            # Pula aktywnych pocisków – obiekty Projectile tworzone raz i używane ponownie
+            self.projectiles = ProjectilePool(self.projectile_image, self.projectile_rotations)
+        else:
+            self.projectile_image = AssetCache.get(projectile_image)
+            self.projectiles = ProjectilePool(self.projectile_image, capacity=0)
         
         # Tryb "satellite": inicjalizacja parametrów orbity
         if self.mode == "satellite":
@@ -51,8 +109,7 @@ class Weapon:
             self.current_explosion_cooldown = 0
             self.explosion_radius = 100          # Promień wybuchu (obszar, w którym zadaje obrażenia)
             # Wczytujemy grafikę wybuchu i skalujemy ją według promienia
-            self.explosion_image = pygame.image.load(projectile_image)
-            self.explosion_image = pygame.transform.scale(self.explosion_image, (self.explosion_radius * 2, self.explosion_radius * 2))
+            self.explosion_image = AssetCache.get(projectile_image, (self.explosion_radius * 2, self.explosion_radius * 2))
             self.active_explosions = []          # Lista aktywnych efektów wybuchu
             print(f"Tworzenie broni wybuchowej: cooldown={self.explosion_cooldown}, damage={self.damage}")
         else:
@@ -60,12 +117,23 @@ class Weapon:
             self.active_explosions = []
             self.explosion_image = None
 
-        # Tryb "projectile": ustawienie obrazu pocisku na odpowiedni rozmiar
-        if self.mode == "projectile":
-            self.projectile_image = pygame.transform.scale(self.projectile_image, (17, 32))
-        else:
-            # W trybach "satellite" i "explosion" można wykorzystać inny rozmiar lub pozostawić domyślny
-            pass
+    def apply_status_effects(self, slots):
+        """
+        Nakłada efekty statusu broni na trafionych przeciwników – jedna operacja wektorowa na efekt.
+
+        :param slots: Tablica (lub lista) wierszy EnemyStore trafionych przeciwników
+        """
+        for name in self.status_effects:
+            StatusEffects.apply(name, slots)
+
+    def add_status_effect(self, name):
+        """
+        Dodaje efekt statusu do broni (ulepszenie przy awansie) – ponowne dodanie nic nie zmienia.
+
+        :param name: Klucz EFFECTS ("burn", "poison", "slow", "freeze")
+        """
+        if name not in self.status_effects:
+            self.status_effects += (name,)
 
     def _initialize_satellites(self):
         """
@@ -76,19 +144,16 @@ class Weapon:
             angle = (360 / self.max_satellites) * i
             self.satellites.append(angle)
 
-    def trigger_explosion(self, player, enemies, level_system):
+    def trigger_explosion(self, player, enemy_index=None):
         """
         Wyzwala eksplozję w pozycji gracza, zadając obrażenia wszystkim przeciwnikom znajdującym się w zasięgu.
         Dodaje efekt wybuchu do listy aktywnych wybuchów oraz odtwarza dźwięk.
         
         :param player: Obiekt gracza (używany do określenia środka eksplozji)
-        :param enemies: Lista przeciwników – sprawdzamy ich pozycje względem eksplozji
-        :param level_system: Obiekt systemu poziomów – służy do przyznawania punktów za zabicie przeciwników
+        :param enemy_index: Opcjonalny SpatialHash przeciwników – ogranicza test odległości do pobliskich kandydatów
         """
-        kills = 0
         player_center_x = player.x + player.width // 2
         player_center_y = player.y + player.height // 2
-        print("1. Nowa eksplozja dodana")  # Debugowanie
 
         # Dodaj efekt eksplozji z timerem
         self.active_explosions.append({
@@ -97,24 +162,24 @@ class Weapon:
             "timer": self.explosion_duration
         })
         AudioManager.play_explosion()
-        print(f"2. Nowa eksplozja dodana: {self.active_explosions[-1]}")
-
-        # Sprawdzanie przeciwników w promieniu eksplozji
-        for enemy in list(enemies):  # Iterujemy po kopii listy, aby móc usuwać elementy
-            enemy_center_x = enemy.x + enemy.width // 2
-            enemy_center_y = enemy.y + enemy.height // 2
-            distance = math.sqrt((enemy_center_x - player_center_x) ** 2 +
-                                 (enemy_center_y - player_center_y) ** 2)
-            print(f"Dystans do przeciwnika: {distance}, Promień eksplozji: {self.explosion_radius}")
-            if distance <= self.explosion_radius:
-                print(f"Przeciwnik w zasięgu eksplozji! Zdrowie przed: {enemy.health}")
-                enemy.take_damage(self.damage)
-                print(f"Zdrowie przeciwnika po eksplozji: {enemy.health}")
-                if enemy.health <= 0:
-                    print("Przeciwnik zniszczony przez eksplozję!")
-                    enemy.to_remove = True
-                    kills += 1
-        level_system.add_chaos_points(kills)
+
+        # Kandydaci z indeksu przestrzennego (lub wszyscy przeciwnicy, gdy indeksu brak)
+        if enemy_index is not None:
+            candidates = enemy_index.query_radius(player_center_x, player_center_y, self.explosion_radius)
+            slots = np.fromiter((enemy.slot for enemy in candidates), dtype=np.int64, count=len(candidates))
+        else:
+            slots = np.arange(EnemyStore.count)
+        columns = EnemyStore.columns
+        slots = slots[~columns["to_remove"][slots]]
+
+        # Wektorowe sprawdzenie odległości środków kandydatów (kolumny EnemyStore)
+        # od środka eksplozji i zadanie obrażeń trafionym jedną operacją
+        centers_x = columns["x"][slots] + columns["width"][slots] // 2
+        centers_y = columns["y"][slots] + columns["height"][slots] // 2
+        dist_sq = (centers_x - player_center_x) ** 2 + (centers_y - player_center_y) ** 2
+        in_range = slots[dist_sq <= self.explosion_radius ** 2]
+        EnemyStore.apply_damage(in_range, self.damage)
+        self.apply_status_effects(in_range)
 
     def level_up(self):
         """
@@ -146,16 +211,26 @@ class Weapon:
                 self.damage = 25
                 self.radius = 160
                 self.speed = 4
+                # Maksymalny poziom – satelity zamrażają trafionych przeciwników
+                self.add_status_effect("freeze")
 
         elif self.mode == "projectile":
             if self.level == 1:
                 self.damage = 20
             elif self.level == 2:
                 self.damage = 35
+            elif self.level == 3:
+                # Pociski zatruwają trafionych przeciwników
+                self.add_status_effect("poison")
             elif self.level == 4:
                 self.damage = 50
             elif self.level == 5:
                 self.cooldown = max(1, self.cooldown - 8)
+                # Strzał celuje w najbliższego przeciwnika zamiast w kierunku patrzenia gracza
+                self.auto_aim = True
+            elif self.level == 6:
+                # Maksymalny poziom – pociski naprowadzają się na przeciwników
+                self.homing = True
 
         elif self.mode == "explosion":
             if self.level == 1:
@@ -173,6 +248,8 @@ class Weapon:
             elif self.level == 4:
                 self.damage = 125
                 self.explosion_radius = 220
+                # Wybuch spowalnia ocalałych przeciwników
+                self.add_status_effect("slow")
             elif self.level == 5:
                 self.damage = 150
                 self.explosion_radius = 240
@@ -181,11 +258,12 @@ class Weapon:
                 self.damage = 200
                 self.explosion_radius = 260
                 self.explosion_cooldown = 6
+                # Maksymalny poziom – wybuch podpala przeciwników
+                self.add_status_effect("burn")
 
-            # Aktualizacja obrazu eksplozji zgodnie z nowym promieniem
-            self.explosion_image = pygame.image.load("assets/images/explosion.png")
-            self.explosion_image = pygame.transform.scale(
-                self.explosion_image, (self.explosion_radius * 2, self.explosion_radius * 2)
+            # Aktualizacja obrazu eksplozji zgodnie z nowym promieniem (współdzielony obraz z AssetCache)
+            self.explosion_image = AssetCache.get(
+                self.projectile_image_path, (self.explosion_radius * 2, self.explosion_radius * 2)
             )
 
     def set_parameters(self, damage, max_satellites, radius, speed):
@@ -209,17 +287,9 @@ class Weapon:
         :param velocity_x: Składowa prędkości w osi X
         :param velocity_y: Składowa prędkości w osi Y
         """
-        if self.mode == "projectile" and self.current_cooldown == 0:
-            # Tworzymy centralny pocisk
-            central_projectile = Projectile(
-                x, y, 
-                self.damage, 
-                self.projectile_speed, 
-                self.projectile_image,
-                velocity_x, 
-                velocity_y
-            )
-            self.projectiles.append(central_projectile)
+        if self.mode == "projectile" and self.shot_ready:
+            # Centralny pocisk – wolny obiekt z puli
+            self.projectiles.spawn(x, y, self.damage, self.projectile_speed, velocity_x, velocity_y)
             AudioManager.play_shoot()
 
             # Przy poziomie >= 3 dodajemy dodatkowe pociski pod różnymi kątami
@@ -230,7 +300,30 @@ class Weapon:
                 self.add_projectile_at_angle(x, y, velocity_x, velocity_y, 60)
                 self.add_projectile_at_angle(x, y, velocity_x, velocity_y, -60)
 
-            self.current_cooldown = max(1, self.cooldown)
+            self.shot_ready = False
+            Scheduler.schedule(max(1, self.cooldown), self._on_shot_ready)
+
+    def _on_shot_ready(self):
+        self.shot_ready = True
+
+    def aim_at_nearest(self, x, y, nearest_index):
+        """
+        Wyznacza prędkość pocisku skierowaną na najbliższego przeciwnika w zasięgu celowania.
+
+        :param x: Punkt startu pocisku (x)
+        :param y: Punkt startu pocisku (y)
+        :param nearest_index: NearestEnemyIndex z pozycjami przeciwników
+        :return: Krotka (velocity_x, velocity_y) lub None, jeśli nikogo nie ma w zasięgu
+        """
+        target = nearest_index.nearest(x, y, self.aim_range)
+        if target is None:
+            return None
+        dx = target.x + target.width / 2 - x
+        dy = target.y + target.height / 2 - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length * self.projectile_speed, dy / length * self.projectile_speed
 
     def add_projectile_at_angle(self, x, y, vx, vy, angle_degrees):
         """
@@ -252,60 +345,26 @@ class Weapon:
         rx *= self.projectile_speed
         ry *= self.projectile_speed
 
-        angled_projectile = Projectile(
-            x, y, 
-            self.damage, 
-            self.projectile_speed, 
-            self.projectile_image,
-            velocity_x=rx, 
-            velocity_y=ry
-        )
-        self.projectiles.append(angled_projectile)
-
-    def update(self, player, enemies, screen, level_system, delta_time):
-        """
-        Aktualizuje stan broni w zależności od trybu:
-          - W trybie "projectile" aktualizuje cooldown i pozycje pocisków.
-          - W trybie "satellite" obraca satelity, sprawdza kolizje z przeciwnikami i zadaje obrażenia.
-          - W trybie "explosion" zarządza wybuchami, aktualizując cooldown oraz wyświetlając efekty.
-        
+        self.projectiles.spawn(x, y, self.damage, self.projectile_speed, rx, ry)
+
+    def update(self, player, enemies, screen, delta_time, enemy_index=None):
+        """
+        Aktualizuje stan aktywnej broni – zachowanie trybu pochodzi z tabeli WEAPON_BEHAVIOURS
+        (satelity obracają się i zadają obrażenia, wybuch odlicza cooldown i wyzwala eksplozję),
+        po czym odliczany jest czas trwania efektów wybuchu.
+        Pociski trybu "projectile" aktualizuje Player.update (update_projectiles).
+
         :param player: Obiekt gracza
         :param enemies: Lista przeciwników
         :param screen: Powierzchnia do rysowania
-        :param level_system: System poziomów – do przyznawania punktów
         :param delta_time: Czas między klatkami (w sekundach)
+        :param enemy_index: Opcjonalny SpatialHash przeciwników – zapytania obszarowe zamiast przeglądania całej listy
         """
-        if self.mode == "projectile":
-            self.update_cooldown()
-            self.update_projectiles(player, screen.get_width(), screen.get_height())  # Przekazujemy rozmiar mapy w pikselach
-        if self.mode == "satellite" and self.level > 0:
-            AudioManager.play_satellite_loop()
-            for i in range(len(self.satellites)):
-                self.satellites[i] = (self.satellites[i] + self.speed) % 360
-                # Resetujemy listę uszkodzonych przeciwników po pełnym obrocie
-                if self.satellites[i] < self.speed:
-                    self.damaged_enemies.clear()
-            for enemy in enemies:
-                enemy_rect = enemy.rect
-                for pos in self.get_satellite_positions(player):
-                    satellite_rect = pygame.Rect(pos[0], pos[1], self.projectile_image.get_width(), self.projectile_image.get_height())
-                    if satellite_rect.colliderect(enemy_rect) and enemy not in self.damaged_enemies:
-                        enemy.take_damage(self.damage)
-                        self.damaged_enemies.add(enemy)
-                        if enemy.health <= 0:
-                            enemies.remove(enemy)
-                            level_system.add_chaos_points(1)
-        if self.mode == "explosion" and self.level > 0:
-            if not hasattr(self, "explosion_updated"):
-                self.explosion_updated = False
-            if self.explosion_updated:
+        update_mode = WEAPON_BEHAVIOURS[self.mode][0]
+        if update_mode is not None and self.level > 0:
+            # Zwrócenie False – broń była już aktualizowana w tej klatce
+            if update_mode(self, player, enemies, delta_time, enemy_index) is False:
                 return
-            self.explosion_updated = True
-            if self.current_explosion_cooldown > 0:
-                self.current_explosion_cooldown -= delta_time
-            else:
-                self.trigger_explosion(player, enemies, level_system)
-                self.current_explosion_cooldown = self.explosion_cooldown
 
         # Aktualizacja czasu trwania efektów wybuchu oraz ich rysowanie
         for explosion in self.active_explosions[:]:
@@ -314,27 +373,144 @@ class Weapon:
                 self.active_explosions.remove(explosion)
             else:
                 screen.blit(self.explosion_image, (explosion["x"], explosion["y"]))
-        print(f"Liczba aktywnych wybuchów: {len(self.active_explosions)}")
 
-    def update_cooldown(self):
+    def update_satellites(self, player, enemies, delta_time, enemy_index=None):
+        """
+        Tryb "satellite": obraca satelity, sprawdza kolizje z przeciwnikami i zadaje obrażenia.
+        """
+        AudioManager.play_satellite_loop()
+        for i in range(len(self.satellites)):
+            self.satellites[i] = (self.satellites[i] + self.speed) % 360
+            # Resetujemy listę uszkodzonych przeciwników po pełnym obrocie
+            if self.satellites[i] < self.speed:
+                self.damaged_enemies.clear()
+        satellite_w = self.projectile_image.get_width()
+        satellite_h = self.projectile_image.get_height()
+        hit_slots = []
+        for pos in self.get_satellite_positions(player):
+            satellite_rect = pygame.Rect(pos[0], pos[1], satellite_w, satellite_h)
+            # Tylko przeciwnicy z komórek pokrywanych przez satelitę
+            candidates = enemy_index.query_rect(satellite_rect) if enemy_index is not None else enemies
+            for enemy in candidates:
+                if enemy.to_remove or enemy.entity_id in self.damaged_enemies:
+                    continue
+                if satellite_rect.colliderect(enemy.rect):
+                    enemy.take_damage(self.damage)
+                    self.damaged_enemies.add(enemy.entity_id)
+                    if enemy.health <= 0:
+                        # Usunięcie z listy następuje w main() – tutaj tylko oznaczamy przeciwnika
+                        enemy.to_remove = True
+                    else:
+                        hit_slots.append(enemy.slot)
+        self.apply_status_effects(hit_slots)
+
+    def update_explosion(self, player, enemies, delta_time, enemy_index=None):
+        """
+        Tryb "explosion": odlicza cooldown i wyzwala eksplozję (najwyżej raz na klatkę).
+
+        :return: False, jeśli broń była już aktualizowana w tej klatce
+        """
+        if self.explosion_updated:
+            return False
+        self.explosion_updated = True
+        if self.current_explosion_cooldown > 0:
+            self.current_explosion_cooldown -= delta_time
+        else:
+            self.trigger_explosion(player, enemy_index)
+            self.current_explosion_cooldown = self.explosion_cooldown
+
+    def resolve_projectile_hits(self, enemy_index):
         """
-        Zmniejsza licznik cooldownu dla strzału, jeśli jest aktywny.
+        Rozstrzyga trafienia pocisków w przeciwników w jednym przejściu.
+        Kandydatów do kolizji dostarcza haszowanie przestrzenne, więc sprawdzane są tylko
+        pary pocisk–przeciwnik leżące blisko siebie. Każdy pocisk trafia co najwyżej jednego
+        przeciwnika, a trafione pociski wracają do puli (usunięcie w czasie stałym).
+
+        :param enemy_index: SpatialHash z przeciwnikami (odbudowany w bieżącej klatce)
+        """
+        hit_projectiles = []
+        hit_slots = []
+        for projectile, enemy in enemy_index.candidate_pairs(self.projectiles):
+            # Przeciwnicy pokonani wcześniej w tej klatce (np. przez efekty statusu) nie zatrzymują pocisków
+            if projectile.hit or enemy.to_remove or not enemy.rect.colliderect(projectile.rect):
+                continue
+            projectile.hit = True
+            hit_projectiles.append(projectile.pool_index)
+            hit_slots.append(enemy.slot)
+
+        if hit_projectiles:
+            # Obrażenia wszystkich trafień naraz – powtórzone trafienia w tego samego przeciwnika sumują się
+            EnemyStore.apply_damage(hit_slots, self.damage)
+            self.apply_status_effects(hit_slots)
+            self.projectiles.release_many(hit_projectiles)
+
+    def steer_homing_projectiles(self, nearest_index):
         """
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
+        Naprowadza pociski na cele. Pocisk bez celu (lub którego cel zginął) pobiera nowy cel
+        z indeksu najbliższych przeciwników; skręt wszystkich pocisków liczony jest wektorowo
+        i ograniczony do homing_turn_rate na klatkę.
 
-    def update_projectiles(self, map_width_px, map_height_px):
+        :param nearest_index: NearestEnemyIndex z pozycjami przeciwników
         """
-        Aktualizuje pozycje pocisków i usuwa te, które wychodzą poza granice mapy.
+        steered = []
+        target_slots = []
+        for projectile in self.projectiles:
+            # Cel zapamiętany jako identyfikator – usunięty przeciwnik po prostu się nie rozwiązuje
+            target = EnemyStore.get(projectile.target_id)
+            if target is None or target.to_remove:
+                center_x, center_y = projectile.rect.center
+                target = nearest_index.nearest(center_x, center_y, self.homing_range)
+                projectile.target_id = target.entity_id if target is not None else None
+            if target is not None:
+                steered.append(projectile)
+                target_slots.append(target.slot)
+        if not steered:
+            return
+
+        count = len(steered)
+        columns = EnemyStore.columns
+        pos_x = np.fromiter((p.rect.centerx for p in steered), dtype=float, count=count)
+        pos_y = np.fromiter((p.rect.centery for p in steered), dtype=float, count=count)
+        target_x = columns["x"][target_slots] + columns["width"][target_slots] / 2
+        target_y = columns["y"][target_slots] + columns["height"][target_slots] / 2
+        vel_x = np.fromiter((p.velocity_x for p in steered), dtype=float, count=count)
+        vel_y = np.fromiter((p.velocity_y for p in steered), dtype=float, count=count)
+
+        # Różnica kątów między kierunkiem lotu a kierunkiem do celu, sprowadzona do [-pi, pi]
+        heading = np.arctan2(vel_y, vel_x)
+        turn = np.arctan2(target_y - pos_y, target_x - pos_x) - heading
+        turn = (turn + math.pi) % (2 * math.pi) - math.pi
+        heading += np.clip(turn, -self.homing_turn_rate, self.homing_turn_rate)
+        speed = np.hypot(vel_x, vel_y)
+        new_vx = (speed * np.cos(heading)).tolist()
+        new_vy = (speed * np.sin(heading)).tolist()
+
+        for projectile, vx, vy in zip(steered, new_vx, new_vy):
+            projectile.set_velocity(vx, vy)
+
+    def update_projectiles(self, map_width_px, map_height_px, collision_world=None, nearest_index=None):
+        """
+        Aktualizuje pozycje pocisków i usuwa te, które wychodzą poza granice mapy
+        lub trafiają w ścianę.
         
         :param map_width_px: Szerokość mapy w pikselach
         :param map_height_px: Wysokość mapy w pikselach
-        """
-        for projectile in self.projectiles[:]:
+        :param collision_world: Opcjonalna siatka kolizji terenu – pociski rozbijają się o ściany
+        :param nearest_index: Opcjonalny NearestEnemyIndex – wymagany do naprowadzania pocisków
+        """
+        if self.homing and nearest_index is not None and len(nearest_index):
+            self.steer_homing_projectiles(nearest_index)
+        pool = self.projectiles
+        items = pool.items
+        # Od końca – zwolniony pocisk zastępowany jest ostatnim, już przesuniętym
+        for index in range(pool.count - 1, -1, -1):
+            projectile = items[index]
             projectile.move()
             if (projectile.x < 0 or projectile.x > map_width_px or
                 projectile.y < 0 or projectile.y > map_height_px):
-                self.projectiles.remove(projectile)
+                pool.release(index)
+            elif collision_world is not None and collision_world.point_blocked(*projectile.rect.center):
+                pool.release(index)
 
     def get_satellite_positions(self, player):
         """
@@ -381,34 +557,82 @@ class Weapon:
 
     def draw(self, screen, player, camera_x=0, camera_y=0):
         """
-        Wybiera metodę rysowania odpowiednią dla aktualnego trybu broni.
+        Rysuje broń metodą trybu z tabeli WEAPON_BEHAVIOURS.
         """
-        if self.mode == "projectile":
-            self.draw_projectiles(screen, camera_x, camera_y)
-        elif self.mode == "satellite" and self.level > 0:
-            self.draw_satellites(screen, player, camera_x, camera_y)
-        elif self.mode == "explosion":
-            self.draw_explosions(screen, camera_x, camera_y)
+        WEAPON_BEHAVIOURS[self.mode][1](self, screen, player, camera_x, camera_y)
+
+
+def _draw_projectile_mode(weapon, screen, player, camera_x, camera_y):
+    weapon.draw_projectiles(screen, camera_x, camera_y)
+
+
+def _draw_satellite_mode(weapon, screen, player, camera_x, camera_y):
+    if weapon.level > 0:
+        weapon.draw_satellites(screen, player, camera_x, camera_y)
+
+
+def _draw_explosion_mode(weapon, screen, player, camera_x, camera_y):
+    weapon.draw_explosions(screen, camera_x, camera_y)
+
+
+# Zachowania trybów broni: tryb -> (aktualizacja na klatkę lub None, rysowanie).
+# Nowy tryb broni to wpis w tej tabeli (analogicznie do ENEMY_BEHAVIOURS), a nie kolejna gałąź w update/draw.
+WEAPON_BEHAVIOURS = {
+    "projectile": (None, _draw_projectile_mode),
+    "satellite": (Weapon.update_satellites, _draw_satellite_mode),
+    "explosion": (Weapon.update_explosion, _draw_explosion_mode),
+}
 
 class Projectile:
     """
     Klasa reprezentująca pojedynczy pocisk wystrzelony przez broń.
-    Oblicza kąt rotacji pocisku na podstawie jego prędkości.
+    Dobiera obrócony wariant grafiki na podstawie prędkości pocisku.
+    Obiekty pocisków żyją w ProjectilePool i są ponownie inicjalizowane metodą reset().
     """
-    def __init__(self, x, y, damage, speed, image, velocity_x=0, velocity_y=-10):
+    def __init__(self, x, y, damage, speed, image, velocity_x=0, velocity_y=-10, rotations=None):
+        self.base_image = image
+        self.rotations = rotations
+        # Prostokąty kolizji i rysowania – tworzone raz, przy ponownym użyciu tylko przesuwane
+        self.rect = pygame.Rect(x, y, image.get_width(), image.get_height())
+        self.rotated_rect = pygame.Rect(0, 0, 0, 0)
+        self.pool_index = None   # Pozycja w ProjectilePool.items
+        self.reset(x, y, damage, speed, velocity_x, velocity_y)
+
+    def reset(self, x, y, damage, speed, velocity_x, velocity_y):
+        """
+        Inicjalizuje pocisk na nowo (ponowne użycie obiektu z puli – bez tworzenia obiektów).
+        """
         self.x = x
         self.y = y
         self.damage = damage
         self.speed = speed
-        # Inicjalizacja prostokąta kolizji na podstawie obrazu
-        self.rect = pygame.Rect(x, y, image.get_width(), image.get_height())
+        self.rect.x = int(x)
+        self.rect.y = int(y)
         self.velocity_x = velocity_x
         self.velocity_y = velocity_y
+        self.target_id = None  # Identyfikator (entity_id) celu pocisku naprowadzanego
+        self.hit = False      # Pocisk trafił już przeciwnika w tej klatce
+
+        # Obrócona grafika: gotowy wariant z RotatedSpriteCache (jeśli podany) lub obrót na miejscu
+        if self.rotations is not None:
+            self.image = self.rotations.get_for_velocity(velocity_x, velocity_y)
+        else:
+            angle = math.degrees(math.atan2(-velocity_y, velocity_x)) - 90
+            self.image = pygame.transform.rotate(self.base_image, angle)
+        self.rotated_rect.size = self.image.get_size()
+        self.rotated_rect.center = (x, y)
 
-        # Obliczenie kąta rotacji na podstawie prędkości
-        angle = math.degrees(math.atan2(-self.velocity_y, self.velocity_x)) - 90
-        self.image = pygame.transform.rotate(image, angle)
-        self.rotated_rect = self.image.get_rect(center=(x, y))
+    def set_velocity(self, velocity_x, velocity_y):
+        """
+        Zmienia kierunek lotu pocisku (np. przy naprowadzaniu) i dobiera odpowiednio obrócony wariant grafiki.
+        """
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+        if self.rotations is not None:
+            center = self.rotated_rect.center
+            self.image = self.rotations.get_for_velocity(velocity_x, velocity_y)
+            self.rotated_rect.size = self.image.get_size()
+            self.rotated_rect.center = center
 
     def move(self):
         """
@@ -425,3 +649,97 @@ class Projectile:
         Rysuje pocisk na ekranie.
         """
         screen.blit(self.image, self.rotated_rect.topleft)
+
+
+class ProjectilePool:
+    """
+    Pula pocisków o stałej pojemności.
+
+    Obiekty Projectile tworzone są z góry i używane ponownie: aktywne pociski zajmują
+    items[0..count-1], spawn() inicjalizuje kolejny wolny obiekt, a release() zastępuje
+    zwalniany pocisk ostatnim aktywnym (swap-remove) – usuwanie w czasie stałym, bez
+    przebudowywania listy. W stanie ustalonym strzelanie nie tworzy żadnych obiektów;
+    pula powiększa się (dwukrotnie) tylko wtedy, gdy zabraknie wolnych pocisków.
+    """
+    def __init__(self, image, rotations=None, capacity=128):
+        """
+        :param image: Grafika pocisku (w docelowym rozmiarze)
+        :param rotations: Opcjonalny RotatedSpriteCache z obróconymi wariantami grafiki
+        :param capacity: Początkowa liczba pocisków w puli
+        """
+        self.image = image
+        self.rotations = rotations
+        self.items = []
+        self.count = 0            # Liczba aktywnych pocisków
+        self.peak = 0             # Największa liczba jednocześnie aktywnych pocisków (do strojenia pojemności)
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """
+        Dotwarza pociski do podanej pojemności.
+        """
+        for index in range(len(self.items), capacity):
+            projectile = Projectile(0, 0, 0, 0, self.image, rotations=self.rotations)
+            projectile.pool_index = index
+            self.items.append(projectile)
+
+    @property
+    def capacity(self):
+        return len(self.items)
+
+    def spawn(self, x, y, damage, speed, velocity_x, velocity_y):
+        """
+        Aktywuje wolny pocisk z puli.
+
+        :return: Projectile
+        """
+        if self.count == len(self.items):
+            self._grow(max(16, 2 * len(self.items)))
+        projectile = self.items[self.count]
+        projectile.reset(x, y, damage, speed, velocity_x, velocity_y)
+        self.count += 1
+        self.peak = max(self.peak, self.count)
+        return projectile
+
+    def release(self, index):
+        """
+        Zwraca pocisk o podanej pozycji do puli – jego miejsce zajmuje ostatni aktywny pocisk.
+
+        :param index: Pozycja pocisku w items (0..count-1)
+        """
+        last = self.count - 1
+        items = self.items
+        released = items[index]
+        released.target_id = None
+        if index != last:
+            moved = items[last]
+            items[index] = moved
+            moved.pool_index = index
+            items[last] = released
+            released.pool_index = last
+        self.count = last
+
+    def release_many(self, indices):
+        """
+        Zwraca do puli kilka pocisków naraz (kolejność od końca zachowuje poprawność swap-remove).
+
+        :param indices: Lista pozycji pocisków w items
+        """
+        for index in sorted(indices, reverse=True):
+            self.release(index)
+
+    def clear(self):
+        """
+        Zwraca do puli wszystkie aktywne pociski.
+        """
+        for index in range(self.count):
+            self.items[index].target_id = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        items = self.items
+        for index in range(self.count):
+            yield items[index]
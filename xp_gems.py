@@ -0,0 +1,277 @@
+import numpy as np
+import pygame
+from column_store import make_columns, grow_columns, compact_columns
+
+# Kolumny magazynu kryształów: nazwa -> typ numpy
+FIELDS = {
+    "x": np.float64,
+    "y": np.float64,
+    "value": np.int32,
+    "attracted": np.bool_,
+}
+
+# Wygląd kryształów: (minimalna wartość, kolor, rozmiar w pikselach) – od najmniejszej wartości
+TIERS = (
+    (1, (80, 160, 255), 8),
+    (5, (80, 255, 120), 10),
+    (25, (255, 80, 80), 12),
+)
+
+# Klucz komórki siatki: wiersz * KEY_STRIDE + kolumna
+KEY_STRIDE = 1 << 20
+
+
+class XPGems:
+    """
+    Klasa XPGems – kryształy doświadczenia upuszczane przez pokonanych przeciwników,
+    przyciągane magnesem gracza i łączone, gdy jest ich więcej niż MAX_GEMS.
+    """
+    CELL_SIZE = 128            # Komórka indeksu przestrzennego (w pikselach)
+    MAX_GEMS = 1500            # Limit kryształów na mapie – powyżej kryształy są łączone
+    MERGE_CELL_SIZE = 64       # Początkowa komórka łączenia (w pikselach)
+    BASE_MAGNET_RADIUS = 80    # Promień magnesu na pierwszym poziomie (w pikselach)
+    MAGNET_PER_LEVEL = 12      # Przyrost promienia magnesu na poziom
+    MAX_MAGNET_RADIUS = 400
+    PICKUP_RADIUS = 24         # Odległość od środka gracza, przy której kryształ jest zbierany
+    SPEED = 9                  # Prędkość lotu przyciąganego kryształu (w pikselach na klatkę)
+
+    count = 0
+    capacity = 0
+    columns = make_columns(FIELDS, 0)
+    _keys = np.zeros(0, dtype=np.int64)     # Posortowane klucze komórek
+    _order = np.zeros(0, dtype=np.int64)    # Indeksy kryształów w kolejności _keys
+    _index_dirty = False
+    _images = None
+    collected = 0              # Liczba zebranych kryształów
+    merged = 0                 # Liczba kryształów usuniętych przez łączenie
+
+    @staticmethod
+    def reset(capacity=1024):
+        """
+        Usuwa wszystkie kryształy i przydziela puste tablice.
+
+        :param capacity: Początkowa pojemność (tablice rosną dwukrotnie w razie potrzeby)
+        """
+        XPGems.count = 0
+        XPGems.capacity = capacity
+        XPGems.columns = make_columns(FIELDS, capacity)
+        XPGems._keys = np.zeros(0, dtype=np.int64)
+        XPGems._order = np.zeros(0, dtype=np.int64)
+        XPGems._index_dirty = False
+        XPGems.collected = 0
+        XPGems.merged = 0
+
+    @staticmethod
+    def drop(xs, ys, values):
+        """
+        Upuszcza kryształy (np. po przeciwnikach pokonanych w tej klatce).
+
+        :param xs: Pozycje x środków kryształów (w pikselach)
+        :param ys: Pozycje y środków kryształów (w pikselach)
+        :param values: Wartości kryształów (punkty chaosu)
+        """
+        XPGems._append(xs, ys, values)
+        if XPGems.count > XPGems.MAX_GEMS:
+            XPGems._merge()
+
+    @staticmethod
+    def _append(xs, ys, values):
+        """
+        Dopisuje kryształy na koniec tablic (bez łączenia).
+        """
+        added = len(xs)
+        if not added:
+            return
+        start = XPGems.count
+        end = start + added
+        if end > XPGems.capacity:
+            XPGems.capacity = grow_columns(XPGems.columns, start, end)
+        c = XPGems.columns
+        c["x"][start:end] = xs
+        c["y"][start:end] = ys
+        c["value"][start:end] = values
+        c["attracted"][start:end] = False
+        XPGems.count = end
+        XPGems._index_dirty = True
+
+    @staticmethod
+    def magnet_radius(level):
+        """
+        Zwraca promień magnesu dla poziomu gracza.
+
+        :param level: Poziom gracza (LevelSystem.current_level)
+        :return: Promień w pikselach
+        """
+        return min(XPGems.BASE_MAGNET_RADIUS + XPGems.MAGNET_PER_LEVEL * (level - 1), XPGems.MAX_MAGNET_RADIUS)
+
+    @staticmethod
+    def _cell_keys(xs, ys, cell_size):
+        """
+        Zwraca klucze komórek siatki o podanym rozmiarze dla pozycji kryształów.
+        """
+        cell_xs = np.maximum(xs // cell_size, 0).astype(np.int64)
+        cell_ys = np.maximum(ys // cell_size, 0).astype(np.int64)
+        return cell_ys * KEY_STRIDE + cell_xs
+
+    @staticmethod
+    def _rebuild_index():
+        """
+        Sortuje kryształy według kluczy komórek – kryształy jednej komórki leżą obok siebie.
+        """
+        n = XPGems.count
+        keys = XPGems._cell_keys(XPGems.columns["x"][:n], XPGems.columns["y"][:n], XPGems.CELL_SIZE)
+        XPGems._order = np.argsort(keys, kind="stable")
+        XPGems._keys = keys[XPGems._order]
+        XPGems._index_dirty = False
+
+    @staticmethod
+    def query_radius(x, y, radius):
+        """
+        Zwraca leżące (nieprzyciągane) kryształy w promieniu od punktu.
+
+        :param x: Współrzędna x środka zapytania (w pikselach)
+        :param y: Współrzędna y środka zapytania (w pikselach)
+        :param radius: Promień zapytania (w pikselach)
+        :return: Tablica indeksów kryształów
+        """
+        if not XPGems.count:
+            return np.zeros(0, dtype=np.int64)
+        if XPGems._index_dirty:
+            XPGems._rebuild_index()
+        cs = XPGems.CELL_SIZE
+        cell_x0 = max(int((x - radius) // cs), 0)
+        cell_x1 = max(int((x + radius) // cs), 0)
+        rows = np.arange(max(int((y - radius) // cs), 0), max(int((y + radius) // cs), 0) + 1, dtype=np.int64)
+        # Każdy wiersz komórek to ciągły przedział posortowanych kluczy
+        starts = np.searchsorted(XPGems._keys, rows * KEY_STRIDE + cell_x0, side="left")
+        ends = np.searchsorted(XPGems._keys, rows * KEY_STRIDE + cell_x1, side="right")
+        candidates = np.concatenate([XPGems._order[s:e] for s, e in zip(starts.tolist(), ends.tolist())])
+        c = XPGems.columns
+        near = ((c["x"][candidates] - x) ** 2 + (c["y"][candidates] - y) ** 2 <= radius * radius)
+        return candidates[near & ~c["attracted"][candidates]]
+
+    @staticmethod
+    def _keep(keep):
+        """
+        Zostawia tylko kryształy z maski keep (kompaktowanie tablic).
+        """
+        XPGems.count = compact_columns(XPGems.columns, XPGems.count, keep)
+        XPGems._index_dirty = True
+
+    @staticmethod
+    def _merge():
+        """
+        Łączy leżące kryształy z tej samej komórki w jeden (suma wartości, pozycja ważona wartością),
+        powiększając komórkę, dopóki liczba kryształów przekracza MAX_GEMS.
+        """
+        cell_size = XPGems.MERGE_CELL_SIZE
+        while XPGems.count > XPGems.MAX_GEMS and cell_size < KEY_STRIDE:
+            n = XPGems.count
+            c = XPGems.columns
+            free = np.flatnonzero(~c["attracted"][:n])
+            if len(free) < 2:
+                return
+            x = c["x"][free]
+            y = c["y"][free]
+            value = c["value"][free].astype(np.float64)
+            _, groups = np.unique(XPGems._cell_keys(x, y, cell_size), return_inverse=True)
+            group_count = int(groups.max()) + 1
+            if group_count < len(free):
+                totals = np.bincount(groups, weights=value)
+                merged_x = np.bincount(groups, weights=x * value) / totals
+                merged_y = np.bincount(groups, weights=y * value) / totals
+                keep = c["attracted"][:n].copy()
+                XPGems._keep(keep)
+                XPGems.merged += len(free) - group_count
+                XPGems._append(merged_x, merged_y, totals.astype(np.int32))
+            cell_size *= 2
+
+    @staticmethod
+    def update(player, level_system):
+        """
+        Przyciąga kryształy w promieniu magnesu, przesuwa przyciągane w stronę gracza
+        i zbiera te, które do niego dotarły. Wywoływana raz na klatkę.
+
+        :param player: Obiekt gracza
+        :param level_system: System poziomów – poziom gracza (promień magnesu) i przyznawanie punktów
+        """
+        if not XPGems.count:
+            return
+        px = player.x + player.width / 2
+        py = player.y + player.height / 2
+        c = XPGems.columns
+        c["attracted"][XPGems.query_radius(px, py, XPGems.magnet_radius(level_system.current_level))] = True
+
+        n = XPGems.count
+        pulled = np.flatnonzero(c["attracted"][:n])
+        if not len(pulled):
+            return
+        dx = px - c["x"][pulled]
+        dy = py - c["y"][pulled]
+        distance = np.hypot(dx, dy)
+        step = np.divide(np.minimum(distance, XPGems.SPEED), distance, out=np.zeros_like(distance), where=distance > 0)
+        c["x"][pulled] += dx * step
+        c["y"][pulled] += dy * step
+
+        reached = distance - XPGems.SPEED <= XPGems.PICKUP_RADIUS
+        if reached.any():
+            picked = pulled[reached]
+            points = int(c["value"][picked].sum())
+            keep = np.ones(n, dtype=np.bool_)
+            keep[picked] = False
+            XPGems._keep(keep)
+            XPGems.collected += len(picked)
+            level_system.add_chaos_points(points)
+
+    @staticmethod
+    def _tier_images():
+        """
+        Zwraca grafiki kryształów (romby) dla kolejnych progów TIERS – tworzone raz.
+        """
+        if XPGems._images is None:
+            images = []
+            for _, color, size in TIERS:
+                surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                half = size // 2
+                pygame.draw.polygon(surface, color, [(half, 0), (size - 1, half), (half, size - 1), (0, half)])
+                images.append(surface)
+            XPGems._images = images
+        return XPGems._images
+
+    @staticmethod
+    def draw(screen, camera_x, camera_y):
+        """
+        Rysuje kryształy leżące na ekranie (jednym wywołaniem Surface.blits).
+
+        :param screen: Powierzchnia, na której rysujemy (pygame.Surface)
+        :param camera_x: Przesunięcie kamery w osi X (w pikselach)
+        :param camera_y: Przesunięcie kamery w osi Y (w pikselach)
+        """
+        n = XPGems.count
+        if not n:
+            return
+        c = XPGems.columns
+        draw_x = c["x"][:n] - camera_x
+        draw_y = c["y"][:n] - camera_y
+        margin = TIERS[-1][2]
+        visible = np.flatnonzero((draw_x > -margin) & (draw_x < screen.get_width() + margin) &
+                                 (draw_y > -margin) & (draw_y < screen.get_height() + margin))
+        if not len(visible):
+            return
+        images = XPGems._tier_images()
+        tiers = np.searchsorted([tier[0] for tier in TIERS], c["value"][visible], side="right") - 1
+        blits = []
+        for tier, sx, sy in zip(np.maximum(tiers, 0).tolist(), draw_x[visible].tolist(), draw_y[visible].tolist()):
+            image = images[tier]
+            half = image.get_width() / 2
+            blits.append((image, (sx - half, sy - half)))
+        screen.blits(blits, doreturn=False)
+
+    @staticmethod
+    def stats():
+        """
+        Zwraca statystyki kryształów.
+
+        :return: Słownik z kluczami "count", "collected" i "merged"
+        """
+        return {"count": XPGems.count, "collected": XPGems.collected, "merged": XPGems.merged}